@@ -3,6 +3,7 @@ from PIL import Image
 import os
 import json  # Added for remember me
 from users.auth import log_in
+from utils.scheduler import scheduler
 from gui_Light import PRIMARY_COLOR, BACKGROUND_COLOR, ENTRY_BG_COLOR, TEXT_COLOR, BUTTON_HOVER_COLOR, SUCCESS_COLOR, DISABLED_BUTTON_COLOR, ERROR_COLOR, set_swigato_icon
 
 class LoginScreen(ctk.CTkFrame):
@@ -142,14 +143,14 @@ class LoginScreen(ctk.CTkFrame):
                     self._clear_remembered_user()
                 self.status_label.configure(text=f"Welcome back, {user.username}!", text_color=SUCCESS_COLOR)
                 # Schedule the screen transition using the new callback
-                self.master.after(0, lambda: self.login_success_callback(user))  # MODIFIED THIS LINE
+                scheduler.call_later(self.master, 0, self.login_success_callback, user)
             else:
                 self.status_label.configure(text="Invalid username or password.", text_color=PRIMARY_COLOR)
                 # Only re-enable the button if login failed and the widget still exists
                 if self.login_button.winfo_exists():
                     self.login_button.configure(state="normal", text=original_button_text, fg_color=PRIMARY_COLOR)
 
-        self.after(100, process_login_attempt)
+        scheduler.call_later(self, 100, process_login_attempt)
 
     def forgot_password_dialog(self):
         dialog = ctk.CTkToplevel(self)
@@ -4,6 +4,7 @@ import os
 from users.auth import sign_up
 from gui_Light import PRIMARY_COLOR, BACKGROUND_COLOR, ENTRY_BG_COLOR, TEXT_COLOR, BUTTON_HOVER_COLOR, SUCCESS_COLOR, DISABLED_BUTTON_COLOR, ERROR_COLOR
 from utils.validation import is_valid_password
+from utils.scheduler import scheduler
 
 class SignupScreen(ctk.CTkFrame):
     def __init__(self, master, show_login_callback):
@@ -152,7 +153,7 @@ class SignupScreen(ctk.CTkFrame):
                 if success:
                     self.status_label.configure(text="Account created successfully! Redirecting to login...", text_color=SUCCESS_COLOR)
                     self.signup_button.configure(state="disabled", text="Account Created", fg_color=DISABLED_BUTTON_COLOR)
-                    self.after(2000, lambda: self.app.show_login_screen(username_to_fill=username))
+                    scheduler.call_later(self, 2000, lambda: self.app.show_login_screen(username_to_fill=username))
                 else:
                     self.status_label.configure(text="Signup failed. Username might already exist or another issue occurred.", text_color=ERROR_COLOR)
                     self.signup_button.configure(state="normal", text=original_button_text, fg_color=PRIMARY_COLOR)
@@ -165,7 +166,7 @@ class SignupScreen(ctk.CTkFrame):
                     self.status_label.configure(text=f"An error occurred: {error_message}", text_color=ERROR_COLOR)
                 self.signup_button.configure(state="normal", text=original_button_text, fg_color=PRIMARY_COLOR)
 
-        self.after(100, process_signup_attempt)
+        scheduler.call_later(self, 100, process_signup_attempt)
 
     def _go_to_login(self):
         self.show_login_callback()
@@ -1,6 +1,7 @@
 import customtkinter as ctk
-from CTkTable import CTkTable
+from gui_components.data_grid import DataGrid
 import logging
+from tkinter import messagebox
 from gui_Light import (
     FONT_FAMILY, BODY_FONT_SIZE, HEADING_FONT_SIZE,
     ADMIN_BACKGROUND_COLOR, ADMIN_FRAME_FG_COLOR, ADMIN_TEXT_COLOR,
@@ -9,9 +10,14 @@ from gui_Light import (
     ADMIN_TABLE_BORDER_COLOR, ADMIN_TABLE_TEXT_COLOR, ERROR_COLOR, ADMIN_PRIMARY_COLOR, ADMIN_BUTTON_TEXT_COLOR, ADMIN_BUTTON_HOVER_COLOR, set_swigato_icon, center_window
 )
 from orders.models import Order
+from utils.scheduler import scheduler
 
 logger = logging.getLogger("swigato_app.admin_orders_screen")
 
+ACTIVE_STATUSES = ("Pending Confirmation", "Preparing", "Out for Delivery", "Confirmed")
+# Logical order flow: Pending → Confirmed → Preparing → Out for Delivery → Delivered, with Cancelled/Failed as exceptions
+STATUS_OPTIONS = ["Pending Confirmation", "Confirmed", "Preparing", "Out for Delivery", "Delivered", "Cancelled", "Failed"]
+
 class AdminOrdersScreen(ctk.CTkFrame):
     def __init__(self, master, app_callbacks, user, **kwargs):
         super().__init__(master, fg_color=ADMIN_BACKGROUND_COLOR, **kwargs)
@@ -46,14 +52,18 @@ class AdminOrdersScreen(ctk.CTkFrame):
         self.current_view = "history"
         self._load_and_display_orders(active_only=False)
 
+    def refresh_data(self):
+        """Reloads the current view from the database (the dashboard's explicit refresh)."""
+        self._load_and_display_orders(active_only=self.current_view == "orders")
+
     def _load_and_display_orders(self, active_only=True):
         for widget in self.table_frame.winfo_children():
             widget.destroy()
+        self.orders_table = None
 
         all_orders = Order.get_all_orders()
         if active_only:
-            active_statuses = ("Pending Confirmation", "Preparing", "Out for Delivery", "Confirmed")
-            orders = [o for o in all_orders if o.status in active_statuses]
+            orders = [o for o in all_orders if o.status in ACTIVE_STATUSES]
             orders.sort(key=lambda o: o.order_date, reverse=True)
         else:
             orders = list(all_orders)
@@ -71,29 +81,7 @@ class AdminOrdersScreen(ctk.CTkFrame):
             headers = ["Order ID", "User", "Restaurant", "Date", "Total (₹)", "Status", "Address", "Items", "Actions"]
         else:
             headers = ["Order ID", "User", "Restaurant", "Date", "Total (₹)", "Status", "Address", "Items"]
-        table_data = [headers]
-        for order in orders:
-            user_display = order.customer_username if hasattr(order, 'customer_username') else str(order.user_id)
-            date_str = order.order_date.strftime('%Y-%m-%d %H:%M') if hasattr(order.order_date, 'strftime') else str(order.order_date)
-            items_str = ", ".join([f"{item.name} x{item.quantity}" for item in getattr(order, 'items', [])])
-            if len(items_str) > 60:
-                items_str = items_str[:57] + "..."
-            address_str = order.delivery_address or "N/A"
-            if len(address_str) > 30:
-                address_str = address_str[:27] + "..."
-            row = [
-                order.order_id,
-                user_display,
-                order.restaurant_name,
-                date_str,
-                f"{order.total_amount:.2f}",
-                order.status,
-                address_str,
-                items_str
-            ]
-            if active_only:
-                row.append("Change Status")
-            table_data.append(row)
+        table_data = [headers] + [self._order_row(order, active_only) for order in orders]
 
         if len(table_data) == 1:
             ctk.CTkLabel(self.table_frame, text="No orders found.",
@@ -101,18 +89,15 @@ class AdminOrdersScreen(ctk.CTkFrame):
                          text_color=ADMIN_TEXT_COLOR).pack(expand=True, anchor="center", padx=25, pady=25)
             return
 
+        if active_only:
+            self._create_bulk_bar()
         cell_font = ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE - 1)
-        # Use a scrollable frame for order history (not for active orders, which are usually fewer)
-        if not active_only:
-            scroll_frame = ctk.CTkScrollableFrame(self.table_frame, fg_color=ADMIN_FRAME_FG_COLOR, corner_radius=10)
-            scroll_frame.pack(expand=True, fill="both", padx=0, pady=0)
-            table_parent = scroll_frame
-        else:
-            table_parent = self.table_frame
-        self.orders_table = CTkTable(
-            master=table_parent,
+        # The grid scrolls itself and only draws the rows in view, however long the history is
+        self.orders_table = DataGrid(
+            master=self.table_frame,
             values=table_data,
-            font=cell_font,  # type: ignore[arg-type]
+            name="admin_orders" if active_only else "admin_order_history",
+            font=cell_font,
             header_color=ADMIN_TABLE_HEADER_BG_COLOR,
             text_color=ADMIN_TABLE_TEXT_COLOR,
             hover_color=ADMIN_PRIMARY_ACCENT_COLOR,
@@ -120,13 +105,102 @@ class AdminOrdersScreen(ctk.CTkFrame):
             corner_radius=8,
             border_width=2,
             border_color="#ff6b35",
-            wraplength=180,
-            command=self._on_cell_click if active_only else None
+            max_column_width=240,
+            command=self._on_cell_click if active_only else None,
+            empty_text="No orders found.",
+            selectable=active_only,
+            select_color=ADMIN_SECONDARY_ACCENT_COLOR,
+            on_select=self._on_selection_changed
         )
         self.orders_table.pack(expand=True, fill="both", padx=20, pady=15)
         if active_only:
             self.actions_column_index = 8
 
+    def _order_row(self, order, active_only):
+        user_display = order.customer_username if hasattr(order, 'customer_username') else str(order.user_id)
+        date_str = order.order_date.strftime('%Y-%m-%d %H:%M') if hasattr(order.order_date, 'strftime') else str(order.order_date)
+        items_str = ", ".join([f"{item.name} x{item.quantity}" for item in getattr(order, 'items', [])])
+        if len(items_str) > 60:
+            items_str = items_str[:57] + "..."
+        address_str = order.delivery_address or "N/A"
+        if len(address_str) > 30:
+            address_str = address_str[:27] + "..."
+        row = [
+            order.order_id,
+            user_display,
+            order.restaurant_name,
+            date_str,
+            f"{order.total_amount:.2f}",
+            order.status,
+            address_str,
+            items_str
+        ]
+        if active_only:
+            row.append("Change Status")
+        return row
+
+    def _create_bulk_bar(self):
+        """Controls for changing the status of every selected order at once."""
+        bar = ctk.CTkFrame(self.table_frame, fg_color="transparent")
+        bar.pack(fill="x", padx=20, pady=(15, 0))
+        self.selection_label = ctk.CTkLabel(bar, text="Click, Ctrl+click or Shift+click rows to select orders.",
+                                            font=ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE - 1),
+                                            text_color=ADMIN_TEXT_COLOR)
+        self.selection_label.pack(side="left")
+        self.bulk_apply_button = ctk.CTkButton(bar, text="Apply to Selected", command=self._apply_bulk_status,
+                                               fg_color=ADMIN_PRIMARY_COLOR, hover_color=ADMIN_BUTTON_HOVER_COLOR,
+                                               text_color=ADMIN_BUTTON_TEXT_COLOR, font=ctk.CTkFont(family=FONT_FAMILY, size=14),
+                                               width=150, state="disabled")
+        self.bulk_apply_button.pack(side="right")
+        self.bulk_status_var = ctk.StringVar(value="Out for Delivery")
+        ctk.CTkOptionMenu(bar, variable=self.bulk_status_var, values=STATUS_OPTIONS,
+                          font=ctk.CTkFont(family=FONT_FAMILY, size=14), fg_color=ADMIN_PRIMARY_COLOR,
+                          text_color=ADMIN_BUTTON_TEXT_COLOR, dropdown_fg_color=ADMIN_PRIMARY_ACCENT_COLOR,
+                          dropdown_text_color=ADMIN_TEXT_COLOR).pack(side="right", padx=10)
+
+    def _on_selection_changed(self, order_ids):
+        if not hasattr(self, 'selection_label') or not self.selection_label.winfo_exists():
+            return
+        count = len(order_ids)
+        self.selection_label.configure(text=f"{count} order(s) selected." if count else
+                                       "Click, Ctrl+click or Shift+click rows to select orders.")
+        self.bulk_apply_button.configure(state="normal" if count else "disabled")
+
+    def _apply_bulk_status(self):
+        if self.orders_table is None:
+            return
+        order_ids = self.orders_table.selected_keys()
+        new_status = self.bulk_status_var.get()
+        if not order_ids or not messagebox.askyesno(
+                "Confirm Status Change", f"Set the status of {len(order_ids)} order(s) to '{new_status}'?"):
+            return
+        results = Order.update_status_many(order_ids, new_status)
+        updated = [o for o in self.current_orders if results.get(o.order_id)]
+        self._apply_status_changes(updated, new_status)
+        failed = [order_id for order_id, ok in results.items() if not ok]
+        logger.info(f"Bulk status change to {new_status}: {len(updated)} updated, {len(failed)} failed.")
+        if failed:
+            messagebox.showwarning("Some Orders Not Updated",
+                                   f"{len(failed)} order(s) could not be updated: {', '.join(map(str, failed[:20]))}"
+                                   + (" ..." if len(failed) > 20 else ""))
+
+    def _apply_status_change(self, order, new_status):
+        self._apply_status_changes([order], new_status)
+
+    def _apply_status_changes(self, orders, new_status):
+        """Updates the orders' rows in place; in the active view, orders that are no longer active are removed."""
+        for order in orders:
+            order.status = new_status
+        if self.orders_table is None or not orders:
+            return
+        active_only = self.current_view == "orders"
+        if active_only and new_status not in ACTIVE_STATUSES:
+            removed = {order.order_id for order in orders}
+            self.orders_table.remove_rows(removed)
+            self.current_orders = [o for o in self.current_orders if o.order_id not in removed]
+        else:
+            self.orders_table.patch_rows([self._order_row(order, active_only) for order in orders])
+
     def _on_cell_click(self, event_data):
         row_clicked = event_data["row"]
         column_clicked = event_data["column"]
@@ -149,10 +223,8 @@ class AdminOrdersScreen(ctk.CTkFrame):
         dialog.grab_set()
         ctk.CTkLabel(dialog, text=f"Order ID: {order.order_id}", font=ctk.CTkFont(family=FONT_FAMILY, size=18, weight="bold"), text_color=ADMIN_PRIMARY_COLOR, fg_color="transparent").pack(pady=(24,8))
         ctk.CTkLabel(dialog, text=f"Current Status: {order.status}", font=ctk.CTkFont(family=FONT_FAMILY, size=15), text_color=ADMIN_TEXT_COLOR, fg_color="transparent").pack(pady=6)
-        # Logical order flow: Pending → Confirmed → Preparing → Out for Delivery → Delivered, with Cancelled/Failed as exceptions
-        status_options = ["Pending Confirmation", "Confirmed", "Preparing", "Out for Delivery", "Delivered", "Cancelled", "Failed"]
         status_var = ctk.StringVar(value=order.status)
-        status_menu = ctk.CTkOptionMenu(dialog, variable=status_var, values=status_options, font=ctk.CTkFont(family=FONT_FAMILY, size=15), fg_color=ADMIN_PRIMARY_COLOR, text_color=ADMIN_BUTTON_TEXT_COLOR, dropdown_fg_color=ADMIN_PRIMARY_ACCENT_COLOR, dropdown_text_color=ADMIN_TEXT_COLOR)
+        status_menu = ctk.CTkOptionMenu(dialog, variable=status_var, values=STATUS_OPTIONS, font=ctk.CTkFont(family=FONT_FAMILY, size=15), fg_color=ADMIN_PRIMARY_COLOR, text_color=ADMIN_BUTTON_TEXT_COLOR, dropdown_fg_color=ADMIN_PRIMARY_ACCENT_COLOR, dropdown_text_color=ADMIN_TEXT_COLOR)
         status_menu.pack(pady=12)
         status_label = ctk.CTkLabel(dialog, text="", font=ctk.CTkFont(family=FONT_FAMILY, size=13), text_color=ERROR_COLOR, fg_color="transparent")
         status_label.pack(pady=5)
@@ -164,8 +236,8 @@ class AdminOrdersScreen(ctk.CTkFrame):
             from orders.models import Order as OrderModel
             if OrderModel.update_status(order.order_id, new_status):
                 status_label.configure(text="Status updated!", text_color="#43A047")
-                dialog.after(700, dialog.destroy)
-                self._load_and_display_orders(active_only=True)
+                scheduler.call_later(dialog, 700, dialog.destroy)
+                self._apply_status_change(order, new_status)
             else:
                 status_label.configure(text="Failed to update status.", text_color=ERROR_COLOR)
         btn_frame = ctk.CTkFrame(dialog, fg_color="transparent")
@@ -1,6 +1,6 @@
 import customtkinter as ctk
 import logging
-from CTkTable import CTkTable
+from gui_components.data_grid import DataGrid
 from gui_Light import (
     FONT_FAMILY, HEADING_FONT_SIZE, BODY_FONT_SIZE, BUTTON_FONT_SIZE,
     ADMIN_BACKGROUND_COLOR, ADMIN_TEXT_COLOR, ADMIN_PRIMARY_ACCENT_COLOR,
@@ -58,14 +58,12 @@ class AdminRestaurantsScreen(ctk.CTkFrame):
         logger.info("AdminRestaurantsScreen initialized and restaurants loaded.")
 
     def _load_and_display_restaurants(self):
-        if self.table and isinstance(self.table, CTkTable):
-            self.table.destroy()
-            self.table = None
-        elif self.table:
+        if self.table:
             self.table.destroy()
             self.table = None
 
-        restaurants_from_db = Restaurant.get_all()
+        # Ratings come from the same query instead of two queries per row
+        restaurants_from_db = Restaurant.get_all_with_stats()
         logger.info(f"Loaded {len(restaurants_from_db)} restaurants from database.")
 
         self.current_restaurants_in_table = []
@@ -101,9 +99,11 @@ class AdminRestaurantsScreen(ctk.CTkFrame):
         header_font = ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE+2, weight="bold")
         cell_font = ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE)
 
-        self.table = CTkTable(master=self.table_frame, 
+        self.table = DataGrid(master=self.table_frame,
                               values=table_data,
-                              font=cell_font,  # type: ignore[arg-type] 
+                              name="admin_restaurants",
+                              font=cell_font,
+                              header_font=header_font,
                               header_color=ADMIN_TABLE_HEADER_BG_COLOR,
                               text_color=ADMIN_TABLE_TEXT_COLOR,
                               hover_color=ADMIN_PRIMARY_ACCENT_COLOR,
@@ -112,7 +112,7 @@ class AdminRestaurantsScreen(ctk.CTkFrame):
                               border_width=2,
                               border_color="#ff6b35",
                               command=self._on_cell_click,
-                              wraplength=180,
+                              max_column_width=240,
                              )
 
         self.table.pack(expand=True, fill="both", padx=20, pady=15)
@@ -1,5 +1,4 @@
 import customtkinter as ctk
-from CTkTable import CTkTable
 import logging
 from tkinter import messagebox
 from gui_Light import (
@@ -7,9 +6,12 @@ from gui_Light import (
     ADMIN_BACKGROUND_COLOR, ADMIN_FRAME_FG_COLOR, ADMIN_TEXT_COLOR,
     ADMIN_PRIMARY_ACCENT_COLOR, ADMIN_SECONDARY_ACCENT_COLOR,
     ADMIN_TABLE_HEADER_BG_COLOR, ADMIN_TABLE_ROW_LIGHT_COLOR, ADMIN_TABLE_ROW_DARK_COLOR,
-    ADMIN_TABLE_BORDER_COLOR, ADMIN_TABLE_TEXT_COLOR, ERROR_COLOR
+    ADMIN_TABLE_BORDER_COLOR, ADMIN_TABLE_TEXT_COLOR, ERROR_COLOR,
+    ADMIN_BUTTON_TEXT_COLOR
 )
 from reviews.models import Review
+from gui_components.data_grid import DataGrid
+from utils.tasks import load_async
 
 logger = logging.getLogger("swigato_app.admin_reviews_screen")
 
@@ -36,29 +38,31 @@ class AdminReviewsScreen(ctk.CTkFrame):
 
         self.reviews_table = None
         self._load_and_display_reviews()
-        logger.info("AdminReviewsScreen initialized and reviews loaded.")
+        logger.info("AdminReviewsScreen initialized; reviews are loading.")
 
     def _load_and_display_reviews(self):
+        """Loads reviews in the background; the table is rebuilt when they arrive."""
+        if not self.reviews_table:
+            for widget in self.table_frame.winfo_children():
+                widget.destroy()
+            ctk.CTkLabel(self.table_frame, text="Loading reviews...",
+                         font=ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE),
+                         text_color=ADMIN_TEXT_COLOR).pack(expand=True, anchor="center", padx=25, pady=25)
+        load_async(self, Review.get_all_reviews, self._display_reviews, on_error=self._on_reviews_load_failed, key="reviews")
+
+    def _on_reviews_load_failed(self, error):
+        logger.error(f"Failed to load reviews: {error}")
+        self._display_reviews([])
+
+    def _display_reviews(self, all_reviews):
         for widget in self.table_frame.winfo_children():
             widget.destroy()
+        self.reviews_table = None
 
-        all_reviews = Review.get_all_reviews()
         self.current_reviews = all_reviews
 
         headers = ["ID", "Restaurant", "User", "Rating", "Comment", "Date", "Actions"]
-        table_data = [headers]
-        for review in all_reviews:
-            date_str = review.review_date.strftime('%Y-%m-%d %H:%M') if hasattr(review.review_date, 'strftime') else str(review.review_date)
-            comment_short = (review.comment[:40] + '...') if review.comment and len(review.comment) > 43 else (review.comment or "")
-            table_data.append([
-                review.review_id,
-                review.restaurant_name,
-                review.username,
-                f"{review.rating}/5",
-                comment_short,
-                date_str,
-                "Delete"
-            ])
+        table_data = [headers] + [self._review_row(review) for review in all_reviews]
 
         if len(table_data) == 1:
             ctk.CTkLabel(self.table_frame, text="No reviews found in the system.",
@@ -66,12 +70,15 @@ class AdminReviewsScreen(ctk.CTkFrame):
                          text_color=ADMIN_TEXT_COLOR).pack(expand=True, anchor="center", padx=25, pady=25)
             return
 
+        self._create_bulk_bar()
         cell_font = ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE - 1)
         header_font = ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE + 2, weight="bold")
-        self.reviews_table = CTkTable(
+        self.reviews_table = DataGrid(
             master=self.table_frame,
             values=table_data,
-            font=cell_font,  # type: ignore[arg-type]
+            name="admin_reviews",
+            font=cell_font,
+            header_font=header_font,
             header_color=ADMIN_TABLE_HEADER_BG_COLOR,
             text_color=ADMIN_TABLE_TEXT_COLOR,
             hover_color=ADMIN_PRIMARY_ACCENT_COLOR,
@@ -80,11 +87,69 @@ class AdminReviewsScreen(ctk.CTkFrame):
             border_width=2,
             border_color="#ff6b35",
             command=self._on_cell_click,
-            wraplength=180
+            max_column_width=240,
+            empty_text="No reviews found in the system.",
+            selectable=True,
+            select_color=ADMIN_SECONDARY_ACCENT_COLOR,
+            on_select=self._on_selection_changed
         )
         self.reviews_table.pack(expand=True, fill="both", padx=20, pady=15)
         self.actions_column_index = 6
 
+    def _create_bulk_bar(self):
+        bar = ctk.CTkFrame(self.table_frame, fg_color="transparent")
+        bar.pack(fill="x", padx=20, pady=(15, 0))
+        self.selection_label = ctk.CTkLabel(bar, text="Click, Ctrl+click or Shift+click rows to select reviews.",
+                                            font=ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE - 1),
+                                            text_color=ADMIN_TEXT_COLOR)
+        self.selection_label.pack(side="left")
+        self.bulk_delete_button = ctk.CTkButton(bar, text="Delete Selected", command=self._confirm_delete_selected,
+                                                fg_color=ERROR_COLOR, hover_color="#C00000", text_color=ADMIN_BUTTON_TEXT_COLOR,
+                                                font=ctk.CTkFont(family=FONT_FAMILY, size=14), width=150, state="disabled")
+        self.bulk_delete_button.pack(side="right")
+
+    def _on_selection_changed(self, review_ids):
+        if not hasattr(self, 'selection_label') or not self.selection_label.winfo_exists():
+            return
+        count = len(review_ids)
+        self.selection_label.configure(text=f"{count} review(s) selected." if count else
+                                       "Click, Ctrl+click or Shift+click rows to select reviews.")
+        self.bulk_delete_button.configure(state="normal" if count else "disabled")
+
+    def _confirm_delete_selected(self):
+        if self.reviews_table is None:
+            return
+        review_ids = self.reviews_table.selected_keys()
+        if not review_ids or not messagebox.askyesno(
+                "Confirm Delete", f"Are you sure you want to delete {len(review_ids)} review(s)?"):
+            return
+        results = Review.delete_many(review_ids)
+        deleted = [review_id for review_id, ok in results.items() if ok]
+        failed = [review_id for review_id, ok in results.items() if not ok]
+        self._remove_reviews(deleted)
+        logger.info(f"Bulk review delete: {len(deleted)} deleted, {len(failed)} failed.")
+        if failed:
+            messagebox.showwarning("Some Reviews Not Deleted",
+                                   f"{len(failed)} review(s) could not be deleted: {', '.join(map(str, failed[:20]))}"
+                                   + (" ..." if len(failed) > 20 else ""))
+
+    def refresh_data(self):
+        """Reloads all reviews from the database (the dashboard's explicit refresh)."""
+        self._load_and_display_reviews()
+
+    def _review_row(self, review):
+        date_str = review.review_date.strftime('%Y-%m-%d %H:%M') if hasattr(review.review_date, 'strftime') else str(review.review_date)
+        comment_short = (review.comment[:40] + '...') if review.comment and len(review.comment) > 43 else (review.comment or "")
+        return [
+            review.review_id,
+            review.restaurant_name,
+            review.username,
+            f"{review.rating}/5",
+            comment_short,
+            date_str,
+            "Delete"
+        ]
+
     def _on_cell_click(self, event_data):
         row_clicked = event_data["row"]
         column_clicked = event_data["column"]
@@ -104,6 +169,13 @@ class AdminReviewsScreen(ctk.CTkFrame):
         success = Review.delete_review(review_id)
         if success:
             messagebox.showinfo("Success", "Review deleted successfully.")
-            self._load_and_display_reviews()
+            self._remove_reviews([review_id])
         else:
             messagebox.showerror("Error", "Failed to delete review. It may not exist.")
+
+    def _remove_reviews(self, review_ids):
+        """Drops deleted reviews from the table without reloading the rest."""
+        review_ids = set(review_ids)
+        if self.reviews_table is not None:
+            self.reviews_table.remove_rows(review_ids)
+        self.current_reviews = [r for r in self.current_reviews if r.review_id not in review_ids]
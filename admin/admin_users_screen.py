@@ -1,5 +1,4 @@
 import customtkinter as ctk
-from CTkTable import CTkTable
 import logging
 from tkinter import messagebox
 import os # For icon path
@@ -18,10 +17,14 @@ from gui_Light import (
     set_swigato_icon, safe_focus, center_window
 )
 from users.models import User # Import the User model
-from utils.database import get_db_connection # For direct DB operations if needed, though User model should handle most
+from gui_components.data_grid import DataGrid
+from utils.tasks import load_async
+from utils.database import get_write_connection # For direct DB operations if needed, though User model should handle most
 
 logger = logging.getLogger("swigato_app.admin_users_screen") # Updated logger name
 
+USERS_PAGE_SIZE = 50 # Users per page in the table
+
 # Define icon path - ensure swigato_icon.ico is in the assets folder
 ICON_PATH = os.path.join("assets", "swigato_icon.ico")
 
@@ -60,7 +63,7 @@ class AdminUsersScreen(ctk.CTkFrame): # Renamed class
 
         self.search_entry = ctk.CTkEntry(
             left_controls_subframe,
-            placeholder_text="Search ID, Name, Address...",
+            placeholder_text="Search ID, Name prefix, Address...",
             font=ctk.CTkFont(family=MODERN_ADMIN_FONT_FAMILY, size=MODERN_ADMIN_FONT_SIZES["medium"]),
             width=320,
             height=45,
@@ -129,17 +132,62 @@ class AdminUsersScreen(ctk.CTkFrame): # Renamed class
         self.table_frame.grid_columnconfigure(0, weight=1)
         self.table_frame.grid_rowconfigure(0, weight=1)
 
+        # Paging controls; each page is one User.search() call
+        self.grid_rowconfigure(3, weight=0)
+        paging_frame = ctk.CTkFrame(self, fg_color="transparent")
+        paging_frame.grid(row=3, column=0, columnspan=2, padx=30, pady=(0, 20), sticky="e")
+        self.prev_page_button = ctk.CTkButton(
+            paging_frame,
+            text="◀ Previous",
+            command=self._show_previous_page,
+            fg_color=MODERN_ADMIN_BUTTON,
+            hover_color=MODERN_ADMIN_BUTTON_HOVER,
+            text_color=MODERN_ADMIN_TEXT,
+            font=ctk.CTkFont(family=MODERN_ADMIN_FONT_FAMILY, size=MODERN_ADMIN_FONT_SIZES["medium"]),
+            corner_radius=MODERN_ADMIN_BORDER_RADIUS["large"],
+            width=120,
+            height=36,
+            state="disabled"
+        )
+        self.prev_page_button.pack(side="left", padx=(0, 10))
+        self.page_label = ctk.CTkLabel(
+            paging_frame,
+            text="Page 1",
+            font=ctk.CTkFont(family=MODERN_ADMIN_FONT_FAMILY, size=MODERN_ADMIN_FONT_SIZES["medium"]),
+            text_color=MODERN_ADMIN_TEXT
+        )
+        self.page_label.pack(side="left", padx=(0, 10))
+        self.next_page_button = ctk.CTkButton(
+            paging_frame,
+            text="Next ▶",
+            command=self._show_next_page,
+            fg_color=MODERN_ADMIN_BUTTON,
+            hover_color=MODERN_ADMIN_BUTTON_HOVER,
+            text_color=MODERN_ADMIN_TEXT,
+            font=ctk.CTkFont(family=MODERN_ADMIN_FONT_FAMILY, size=MODERN_ADMIN_FONT_SIZES["medium"]),
+            corner_radius=MODERN_ADMIN_BORDER_RADIUS["large"],
+            width=120,
+            height=36,
+            state="disabled"
+        )
+        self.next_page_button.pack(side="left")
+
         self.user_table = None
+        self.loading_label = None
+        self.page_cursors = [None] # Cursor of every page visited so far; the last one is the current page
+        self.next_page_cursor = None
         self._load_and_display_users() # Initial load
 
     def _apply_filters_and_refresh_table(self):
         logger.debug("Applying filters and refreshing table.")
+        self.page_cursors = [None]  # Filters changed, start again from the first page
         self._load_and_display_users()
 
     def _clear_filters_and_refresh_table(self):
         logger.debug("Clearing filters and refreshing table.")
         self.search_entry.delete(0, "end")
         self.admin_filter_var.set("All")
+        self.page_cursors = [None]
         self._load_and_display_users()
     
     def _open_add_user_dialog(self):
@@ -254,7 +302,7 @@ class AdminUsersScreen(ctk.CTkFrame): # Renamed class
 
         if new_user_obj:
             logger.info(f"New user '{username}' (ID: {new_user_obj.user_id}) created successfully in DB.")
-            self._load_and_display_users() # Refresh table from DB
+            self._insert_user(new_user_obj)
             if hasattr(self, 'add_user_dialog') and self.add_user_dialog.winfo_exists():
                 self.add_user_dialog.destroy()
         else:
@@ -522,7 +570,7 @@ class AdminUsersScreen(ctk.CTkFrame): # Renamed class
         update_success = True
         # Update username (conditionally, using direct DB for now as User model doesn't have a direct method)
         if user_to_update_obj.username != new_username:
-            conn = get_db_connection()
+            conn = get_write_connection()
             cursor = conn.cursor()
             try:
                 cursor.execute("UPDATE users SET username = ? WHERE user_id = ?", (new_username, user_to_update_obj.user_id))
@@ -542,7 +590,7 @@ class AdminUsersScreen(ctk.CTkFrame): # Renamed class
                 logger.error(f"Failed to update password for user {user_to_update_obj.username}")
 
         if user_to_update_obj.address != new_address:
-            conn = get_db_connection()
+            conn = get_write_connection()
             cursor = conn.cursor()
             try:
                 cursor.execute("UPDATE users SET address = ? WHERE user_id = ?", (new_address, user_to_update_obj.user_id))
@@ -562,7 +610,7 @@ class AdminUsersScreen(ctk.CTkFrame): # Renamed class
         
         if update_success:
             logger.info(f"User data updated for '{user_to_update_obj.username}' (ID: {user_to_update_obj.user_id}).")
-            self._load_and_display_users() # Refresh table from DB
+            self._patch_user(user_to_update_obj)
             if hasattr(self, 'edit_user_dialog') and self.edit_user_dialog.winfo_exists():
                 self.edit_user_dialog.destroy()
             self.current_edit_user_id = None
@@ -608,7 +656,7 @@ class AdminUsersScreen(ctk.CTkFrame): # Renamed class
     def _delete_user(self, user_id_to_delete, username_for_logging):
         if User.delete_by_username(username_for_logging):
             logger.info(f"User '{username_for_logging}' (ID: {user_id_to_delete}) deleted successfully from DB.")
-            self._load_and_display_users()        
+            self._remove_user(user_id_to_delete)
         else:
             logger.warning(f"Failed to delete user '{username_for_logging}' (ID: {user_id_to_delete}) from DB. They might have already been deleted or an error occurred.")
             messagebox.showwarning("Deletion Failed", f"User '{username_for_logging}' could not be deleted. The list might have been updated or an error occurred.")
@@ -626,109 +674,156 @@ class AdminUsersScreen(ctk.CTkFrame): # Renamed class
         new_status = not old_status
         if user_to_modify_obj.update_admin_status(new_status):
             logger.info(f"Toggled admin status for user '{user_to_modify_obj.username}' (ID: {user_id_to_toggle}) from {old_status} to {new_status} in DB.")
-            self._load_and_display_users()
+            self._patch_user(user_to_modify_obj)
         else:
             logger.error(f"Failed to toggle admin status for user '{user_to_modify_obj.username}' (ID: {user_id_to_toggle}) in DB.")
             messagebox.showerror("Error", "Failed to update admin status. Check logs.")
             self._load_and_display_users()
 
     def _load_and_display_users(self):
-        search_term = self.search_entry.get().lower() if hasattr(self, 'search_entry') and self.search_entry.winfo_exists() else ""
+        """Loads the current page of users in the background; the table is rebuilt when it arrives."""
+        search_term = self.search_entry.get().strip() if hasattr(self, 'search_entry') and self.search_entry.winfo_exists() else ""
         admin_filter_status = self.admin_filter_var.get() if hasattr(self, 'admin_filter_var') else "All"
-        
-        logger.debug(f"Loading users from DB. Search: '{search_term}', Filter: '{admin_filter_status}'")
+        is_admin = {"Admin": True, "Non-Admin": False}.get(admin_filter_status)
+        page_cursor = self.page_cursors[-1]
+        logger.debug(f"Loading users from DB. Search: '{search_term}', Filter: '{admin_filter_status}', Page: {len(self.page_cursors)}")
+
+        if not self.user_table:
+            self._show_loading_label()
+        load_async(self, lambda: User.search(search_term, is_admin=is_admin, cursor=page_cursor, limit=USERS_PAGE_SIZE),
+                   lambda result: self._display_users(*result, search_term=search_term, admin_filter_status=admin_filter_status),
+                   on_error=self._on_users_load_failed, key="users")
+
+    def _show_loading_label(self):
+        if self.loading_label is None:
+            self.loading_label = ctk.CTkLabel(
+                self.table_frame,
+                text="Loading users...",
+                font=ctk.CTkFont(family=MODERN_ADMIN_FONT_FAMILY, size=MODERN_ADMIN_FONT_SIZES["medium"]),
+                text_color=MODERN_ADMIN_TEXT_SECONDARY
+            )
+            self.loading_label.pack(expand=True, anchor="center")
+
+    def _on_users_load_failed(self, error):
+        logger.error(f"Failed to load users: {error}")
+        self._display_users([], None)
+
+    def _show_next_page(self):
+        if self.next_page_cursor is not None:
+            self.page_cursors.append(self.next_page_cursor)
+            self._load_and_display_users()
 
-        all_users_from_db = User.get_all_users()
-        
-        self.users_data = []
-        if all_users_from_db:
-            for user_obj in all_users_from_db:
-                self.users_data.append({
-                    'id': user_obj.user_id,
-                    'username': user_obj.username,
-                    'is_admin': user_obj.is_admin,
-                    'address': user_obj.address if user_obj.address else ""
-                })
-
-        filtered_user_list = []
+    def _show_previous_page(self):
+        if len(self.page_cursors) > 1:
+            self.page_cursors.pop()
+            self._load_and_display_users()
+
+    def _update_paging_controls(self):
+        self.page_label.configure(text=f"Page {len(self.page_cursors)}")
+        self.prev_page_button.configure(state="normal" if len(self.page_cursors) > 1 else "disabled")
+        self.next_page_button.configure(state="normal" if self.next_page_cursor is not None else "disabled")
+
+    def _display_users(self, page_users, next_cursor, search_term="", admin_filter_status="All"):
+        if self.loading_label is not None:
+            self.loading_label.destroy()
+            self.loading_label = None
+
+        # Filtering happens in User.search; this is one page of matching users
+        self.next_page_cursor = next_cursor
+        self._update_paging_controls()
+
+        self.users_data = [self._user_dict(user_obj) for user_obj in page_users]
         source_users = self.users_data
 
-        for user_item in source_users:
-            passes_admin_filter = False
-            if admin_filter_status == "All":
-                passes_admin_filter = True
-            elif admin_filter_status == "Admin" and user_item['is_admin']:
-                passes_admin_filter = True
-            elif admin_filter_status == "Non-Admin" and not user_item['is_admin']:
-                passes_admin_filter = True
-
-            if not passes_admin_filter:
-                continue
-
-            passes_search_filter = False
-            if not search_term: 
-                passes_search_filter = True
-            else:
-                if search_term in str(user_item['id']).lower():
-                    passes_search_filter = True
-                elif search_term in user_item['username'].lower():
-                    passes_search_filter = True
-                elif 'address' in user_item and user_item['address'] and search_term in user_item['address'].lower():
-                    passes_search_filter = True
-            
-            if not passes_search_filter:
-                continue
-            
-            filtered_user_list.append(user_item)
-
-        self.current_view_users = filtered_user_list 
-        logger.debug(f"Displaying {len(self.current_view_users)} users after filtering.")
+        self.current_view_users = self.users_data
+        logger.debug(f"Displaying {len(self.current_view_users)} users on page {len(self.page_cursors)}.")
 
         # Create modern table with enhanced styling
         table_values = [["ID", "Username", "Admin?", "Address", "Actions"]]
-        for user_item_view in self.current_view_users: 
-            table_values.append([
-                user_item_view['id'],
-                user_item_view['username'],
-                "Yes" if user_item_view['is_admin'] else "No",
-                user_item_view.get('address', 'N/A'), 
-                "Edit / Delete"
-            ])
+        table_values.extend(self._user_row(user_item_view) for user_item_view in self.current_view_users)
 
         if self.user_table:
             self.user_table.destroy()
             self.user_table = None 
 
-        header_font = ctk.CTkFont(family=MODERN_ADMIN_FONT_FAMILY, size=MODERN_ADMIN_FONT_SIZES["medium"]+2, weight="bold")
-        cell_font = ctk.CTkFont(family=MODERN_ADMIN_FONT_FAMILY, size=MODERN_ADMIN_FONT_SIZES["medium"])
+        self.user_table_header_font = ctk.CTkFont(family=MODERN_ADMIN_FONT_FAMILY, size=MODERN_ADMIN_FONT_SIZES["medium"]+2, weight="bold")
+        self.user_table_cell_font = ctk.CTkFont(family=MODERN_ADMIN_FONT_FAMILY, size=MODERN_ADMIN_FONT_SIZES["medium"])
         
         if len(table_values) == 1 and (search_term or admin_filter_status != "All"):
              logger.info("No users match current filter criteria. Table will be empty or show header only.")
         elif not source_users:
              logger.info("No users in the master list. Table will be empty or show header only.")
 
-        self.user_table = CTkTable(
+        self.user_table = DataGrid(
             master=self.table_frame,
-            values=table_values, 
-            font=cell_font,  # type: ignore[arg-type]
+            values=table_values,
+            name="admin_users",
+            command=self._on_cell_click,
+            font=self.user_table_cell_font,
+            header_font=self.user_table_header_font,
             colors=[MODERN_ADMIN_TABLE["row_light"], MODERN_ADMIN_TABLE["row_dark"]],
             header_color=MODERN_ADMIN_TABLE["header_bg"],
+            header_text_color=MODERN_ADMIN_TABLE["header_text"],
             text_color=MODERN_ADMIN_TABLE["text"],
             hover_color=MODERN_ADMIN_TABLE["hover"],
             corner_radius=MODERN_ADMIN_BORDER_RADIUS["large"],
             border_width=2,
             border_color=MODERN_ADMIN_TABLE["border"],
-            command=self._on_cell_click,
-            wraplength=200
+            max_column_width=260,
+            empty_text="No users found."
         )
         self.user_table.pack(expand=True, fill="both", padx=MODERN_ADMIN_SPACING["xlarge"], pady=MODERN_ADMIN_SPACING["xlarge"])
 
-        if table_values: 
-            self.user_table.edit_row(0, text_color=MODERN_ADMIN_TABLE["header_text"], font=header_font, fg_color=MODERN_ADMIN_TABLE["header_bg"])
+    def _user_dict(self, user_obj):
+        return {
+            'id': user_obj.user_id,
+            'username': user_obj.username,
+            'is_admin': user_obj.is_admin,
+            'address': user_obj.address if user_obj.address else ""
+        }
+
+    def _user_row(self, user_item_view):
+        return [
+            user_item_view['id'],
+            user_item_view['username'],
+            "Yes" if user_item_view['is_admin'] else "No",
+            user_item_view.get('address', 'N/A'),
+            "Edit / Delete"
+        ]
+
+    def _matches_admin_filter(self, is_admin):
+        admin_filter_status = self.admin_filter_var.get() if hasattr(self, 'admin_filter_var') else "All"
+        return admin_filter_status == "All" or is_admin == (admin_filter_status == "Admin")
+
+    # The table is patched in place after an edit; only refresh_data() and the
+    # filter and paging controls reload the page from the database.
+
+    def _patch_user(self, user_obj):
+        """Shows an edited user's new details, or drops the row if they no longer match the admin filter."""
+        if not self._matches_admin_filter(user_obj.is_admin):
+            self._remove_user(user_obj.user_id)
+            return
+        user_dict = self._user_dict(user_obj)
+        for i, existing in enumerate(self.current_view_users):
+            if existing['id'] == user_obj.user_id:
+                self.current_view_users[i] = user_dict
+                if self.user_table:
+                    self.user_table.patch_row(user_obj.user_id, self._user_row(user_dict))
+                return
 
-        for i in range(1, len(table_values)): 
-            current_bg_color = MODERN_ADMIN_TABLE["row_light"] if i % 2 != 0 else MODERN_ADMIN_TABLE["row_dark"]
-            self.user_table.edit_row(i, fg_color=current_bg_color, text_color=MODERN_ADMIN_TABLE["text"], hover_color=MODERN_ADMIN_TABLE["hover"], font=cell_font)
+    def _remove_user(self, user_id):
+        self.current_view_users[:] = [u for u in self.current_view_users if u['id'] != user_id]
+        if self.user_table:
+            self.user_table.remove_rows([user_id])
+
+    def _insert_user(self, user_obj):
+        """Shows a new user at the top of the current page if they match the admin filter."""
+        if not self._matches_admin_filter(user_obj.is_admin):
+            return
+        user_dict = self._user_dict(user_obj)
+        self.current_view_users.insert(0, user_dict)
+        if self.user_table:
+            self.user_table.insert_rows([self._user_row(user_dict)], index=0)
 
     def refresh_data(self):
         logger.info("AdminUsersScreen: Refreshing data (called externally)...")
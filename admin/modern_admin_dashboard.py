@@ -271,7 +271,7 @@ class ModernAdminDashboard(ctk.CTkFrame):
     def create_stats_cards(self):
         """Create modern stats cards with vertical layout and consistent design"""
         try:
-            user_count = len(User.get_all_users())
+            user_count = User.count()
             restaurant_count = len(Restaurant.get_all())
             order_count = len(Order.get_all_orders())
             review_count = len(Review.get_all_reviews())
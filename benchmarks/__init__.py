@@ -0,0 +1,7 @@
+"""
+Headless benchmarks for the model layer's hot paths.
+
+Run with `python -m benchmarks --size 1k` from the project root; see runner.py
+for the options. Datasets are generated once per size and cached in data/benchmarks/,
+baselines saved with --save-baseline in data/benchmarks/baselines/.
+"""
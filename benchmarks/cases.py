@@ -0,0 +1,78 @@
+import sqlite3
+
+from utils import database
+from restaurants.models import Restaurant, MenuItem
+from orders.models import Order, create_order, get_orders_by_user_id
+from reviews.models import Review
+from users.models import User
+from cart.models import Cart
+from benchmarks.fixtures import BENCH_PASSWORD
+
+# name -> setup(); setup() returns the callable that is timed
+BENCHMARKS = {}
+
+def benchmark(name):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+def _query_one(sql, params=()):
+    conn = sqlite3.connect(database.DATABASE_NAME)
+    try:
+        return conn.execute(sql, params).fetchone()
+    finally:
+        conn.close()
+
+def _busiest_user_id():
+    return _query_one("SELECT user_id FROM orders GROUP BY user_id ORDER BY COUNT(*) DESC LIMIT 1")[0]
+
+@benchmark("restaurants.get_all+rating")
+def _restaurants_with_rating():
+    # What the restaurant list used to do: one rating and one count query per card
+    def run():
+        return [f"{restaurant.rating:.1f} ({restaurant.get_review_count()})" for restaurant in Restaurant.get_all()]
+    return run
+
+@benchmark("restaurants.get_all_with_stats")
+def _restaurants_with_stats():
+    def run():
+        return [f"{restaurant.rating:.1f} ({restaurant.get_review_count()})" for restaurant in Restaurant.get_all_with_stats()]
+    return run
+
+@benchmark("menu_item.search")
+def _menu_item_search():
+    return lambda: MenuItem.search("Chicken")
+
+@benchmark("orders.create_order")
+def _create_order():
+    user_id = _busiest_user_id()
+    restaurant = Restaurant.get_all()[0]
+    cart = Cart(user_id)
+    for menu_item in MenuItem.get_for_restaurant(restaurant.restaurant_id)[:3]:
+        cart.add_item(menu_item, 2)
+    items = cart.get_items_for_order()
+    total = cart.get_total_price()
+    return lambda: create_order(user_id, restaurant.restaurant_id, restaurant.name, items, total, "Bench Street")
+
+@benchmark("orders.get_orders_by_user_id")
+def _orders_by_user():
+    user_id = _busiest_user_id()
+    return lambda: get_orders_by_user_id(user_id)
+
+@benchmark("reviews.get_all_reviews")
+def _all_reviews():
+    return Review.get_all_reviews
+
+@benchmark("user.verify_password")
+def _verify_password():
+    username = _query_one("SELECT username FROM users WHERE is_admin = 0 ORDER BY user_id LIMIT 1")[0]
+    user = User.get_by_username(username)
+    return lambda: user.verify_password(BENCH_PASSWORD)
+
+@benchmark("admin.dashboard_stats")
+def _dashboard_stats():
+    # Mirrors ModernAdminDashboard.create_stats_cards()
+    def run():
+        return (User.count(), len(Restaurant.get_all()), len(Order.get_all_orders()), len(Review.get_all_reviews()))
+    return run
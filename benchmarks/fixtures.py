@@ -0,0 +1,47 @@
+import os
+import shutil
+import sqlite3
+
+from utils import database
+from utils.query_cache import query_cache
+from utils.datagen import PRESETS, DEFAULT_PASSWORD, generate
+
+BENCH_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "benchmarks")
+BENCH_PASSWORD = DEFAULT_PASSWORD # Password of every generated user
+SIZES = PRESETS
+
+def build_database(path, size, seed=42):
+    """Creates a database at path with the current schema and the generated rows of the given size preset."""
+    if os.path.exists(path):
+        os.remove(path)
+    generate(path, seed=seed, **SIZES[size])
+    # Copies of the cached file must be complete on their own, without a -wal file beside them
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute("PRAGMA journal_mode = DELETE")
+    finally:
+        conn.close()
+
+def prepare_database(size, seed=42, rebuild=False):
+    """
+    Returns the path of a fresh working copy of the benchmark database for size.
+
+    The generated database is cached in data/benchmarks/ and only rebuilt when
+    missing or when rebuild is set; benchmarks run against a copy so write
+    benchmarks don't change the cached data between runs.
+    """
+    os.makedirs(BENCH_DATA_DIR, exist_ok=True)
+    cached = os.path.join(BENCH_DATA_DIR, f"swigato_{size}_seed{seed}.db")
+    if rebuild or not os.path.exists(cached):
+        build_database(cached, size, seed)
+    working = os.path.join(BENCH_DATA_DIR, f"swigato_{size}_run.db")
+    # A previous run's connections, -wal and -shm files would otherwise be applied to the fresh copy
+    query_cache.close()
+    database.close_connections()
+    for suffix in ("-wal", "-shm"):
+        if os.path.exists(working + suffix):
+            os.remove(working + suffix)
+    shutil.copyfile(cached, working)
+    database.set_database_path(working)
+    database.initialize_database()  # Brings cached databases from older schema versions up to date
+    return working
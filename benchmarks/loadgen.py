@@ -0,0 +1,323 @@
+"""
+Multi-threaded (and optionally multi-process) load generator for the model layer.
+
+Simulated customers and admins call the same model functions as the GUI against
+a generated benchmark database, so lock contention on the shared SQLite file
+can be measured headlessly:
+
+    python -m benchmarks.loadgen --size 100k --threads 8 --duration 30 --rate 200
+
+With --rate 0 every worker runs operations back to back (closed loop).
+Otherwise arrivals are Poisson at the given total rate (open loop) and latency
+is measured from the scheduled arrival time, so time spent queued behind a
+slow operation counts.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sqlite3
+import sys
+import threading
+import time
+
+from utils import database
+from utils.query_cache import query_cache
+from utils.write_queue import write_queue
+
+# Default operation mix (relative weights)
+DEFAULT_MIX = {"log_in": 5, "search": 35, "add_to_cart": 25, "create_order": 15, "add_review": 8, "update_status": 12}
+SEARCH_TERMS = ["Biryani", "Paneer", "Chicken", "Dosa", "Pizza", "Coffee", "Momos", "Lassi"]
+ORDER_STATUSES = ["Preparing", "Out for Delivery", "Delivered"]
+
+# SQLite errors raised on the current thread since the last _take_db_errors() call
+_db_errors = threading.local()
+
+def _record_db_error(error):
+    if write_queue.is_writer_thread():
+        return  # Reaches the waiting worker through the job's Future instead, see _observe_write
+    errors = getattr(_db_errors, "errors", None)
+    if errors is None:
+        errors = _db_errors.errors = []
+    errors.append(error)
+
+def _take_db_errors():
+    errors = getattr(_db_errors, "errors", None) or []
+    _db_errors.errors = []
+    return errors
+
+def _take_busy_retries():
+    retries = getattr(_db_errors, "busy_retries", 0)
+    _db_errors.busy_retries = 0
+    return retries
+
+def _observe_write(future):
+    """
+    Write-queue observer. create_order, add_review and update_status run on the
+    writer thread, so their SQLite errors and busy retries are recorded for the
+    worker that waited on them.
+    """
+    error = future.exception()
+    if isinstance(error, sqlite3.Error):
+        _record_db_error(error)
+    _db_errors.busy_retries = getattr(_db_errors, "busy_retries", 0) + future.busy_retries
+
+class _ErrorRecordingCursor(database.InstrumentedCursor):
+    def execute(self, sql, parameters=()):
+        try:
+            return super().execute(sql, parameters)
+        except sqlite3.Error as e:
+            _record_db_error(e)
+            raise
+
+    def executemany(self, sql, seq_of_parameters):
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        except sqlite3.Error as e:
+            _record_db_error(e)
+            raise
+
+class ErrorRecordingConnection(database.InstrumentedConnection):
+    """Connection that notes SQLite errors before the models catch and log them."""
+
+    def cursor(self, factory=_ErrorRecordingCursor):
+        return super().cursor(factory)
+
+    def commit(self):
+        try:
+            return super().commit()
+        except sqlite3.Error as e:
+            _record_db_error(e)
+            raise
+
+def classify(errors, succeeded):
+    """Outcome of one operation: ok, busy (SQLITE_BUSY), locked (SQLITE_LOCKED) or failed."""
+    for error in errors:
+        name = getattr(error, "sqlite_errorname", "")
+        message = str(error)
+        if name.startswith("SQLITE_BUSY") or "database is locked" in message:
+            return "busy"
+        if name.startswith("SQLITE_LOCKED") or "table is locked" in message:
+            return "locked"
+    if errors or not succeeded:
+        return "failed"
+    return "ok"
+
+class Worker:
+    """One simulated client: a customer with a cart, who may also act as an admin."""
+
+    def __init__(self, worker_id, seed, usernames, password, max_order_id):
+        from cart.models import Cart
+        self.rng = random.Random(seed * 1000 + worker_id)
+        self.usernames = usernames
+        self.password = password
+        self.max_order_id = max_order_id
+        self.user = None
+        self.cart = Cart()
+        self.search_results = []
+
+    # --- Operations; each returns a truthy value on success ---
+
+    def log_in(self):
+        from users.auth import log_in
+        self.user = log_in(self.rng.choice(self.usernames), self.password)
+        if self.user:
+            self.cart.user_id = self.user.user_id
+        return self.user
+
+    def search(self):
+        from restaurants.models import MenuItem
+        self.search_results = MenuItem.search(self.rng.choice(SEARCH_TERMS))
+        return True
+
+    def add_to_cart(self):
+        if not self.search_results:
+            self.search()
+        if not self.search_results:
+            return False
+        item = self.rng.choice(self.search_results)
+        if self.cart.items and next(iter(self.cart.items.values())).menu_item.restaurant_id != item.restaurant_id:
+            self.cart.clear_cart()  # One restaurant per order, as in the app
+        return self.cart.add_item(item, self.rng.randint(1, 3))
+
+    def create_order(self):
+        from orders.models import create_order
+        from restaurants.models import Restaurant
+        if self.user is None and not self.log_in():
+            return False
+        if not self.cart.items and not self.add_to_cart():
+            return False
+        items = self.cart.get_items_for_order()
+        restaurant = Restaurant.get_by_id(items[0].menu_item.restaurant_id)
+        order = create_order(self.user.user_id, restaurant.restaurant_id, restaurant.name, items,
+                             self.cart.get_total_price(), self.user.address)
+        if order:
+            self.cart.clear_cart()
+        return order
+
+    def add_review(self):
+        from reviews.models import add_review
+        if self.user is None and not self.log_in():
+            return False
+        if not self.search_results:
+            self.search()
+        if not self.search_results:
+            return False
+        restaurant_id = self.rng.choice(self.search_results).restaurant_id
+        return add_review(self.user.user_id, self.user.username, restaurant_id, self.rng.randint(1, 5), "Load test review.")
+
+    def update_status(self):
+        from orders.models import Order
+        return Order.update_status(self.rng.randint(1, self.max_order_id), self.rng.choice(ORDER_STATUSES))
+
+def _run_worker(worker, operations, weights, rate, deadline, samples):
+    """Runs operations until deadline, appending (operation, latency_ms, outcome) to samples."""
+    next_arrival = time.perf_counter()
+    while True:
+        if rate > 0:
+            next_arrival += worker.rng.expovariate(rate)
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            scheduled = next_arrival
+        else:
+            scheduled = time.perf_counter()
+        if scheduled >= deadline:
+            return
+        operation = worker.rng.choices(operations, weights=weights)[0]
+        _take_db_errors()
+        _take_busy_retries()
+        try:
+            succeeded = bool(getattr(worker, operation)())
+        except sqlite3.Error as e:
+            _record_db_error(e)
+            succeeded = False
+        except Exception:
+            succeeded = False
+        samples.append((operation, (time.perf_counter() - scheduled) * 1000, classify(_take_db_errors(), succeeded),
+                        _take_busy_retries()))
+
+def run_process(database_path, process_index, threads, mix, rate, duration, seed, password):
+    """Runs threads workers in this process; returns their samples."""
+    database.set_database_path(database_path)
+    database.set_connection_factory(ErrorRecordingConnection)
+    write_queue.observer = _observe_write
+    conn = sqlite3.connect(database_path)
+    try:
+        usernames = [row[0] for row in conn.execute("SELECT username FROM users WHERE is_admin = 0 ORDER BY user_id LIMIT 1000")]
+        max_order_id = conn.execute("SELECT COALESCE(MAX(order_id), 1) FROM orders").fetchone()[0]
+    finally:
+        conn.close()
+
+    operations, weights = list(mix), list(mix.values())
+    per_worker_rate = rate / threads if rate > 0 else 0
+    deadline = time.perf_counter() + duration
+    samples = []
+    workers = [threading.Thread(target=_run_worker,
+                                args=(Worker(process_index * threads + n, seed, usernames, password, max_order_id),
+                                      operations, weights, per_worker_rate, deadline, samples),
+                                name=f"loadgen-{process_index}-{n}")
+               for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    # Pool workers exit without running atexit hooks, so close every connection here. The query cache's
+    # read-only watch connection goes first: whichever connection closes last removes the -wal and -shm
+    # files, and only the writer can checkpoint
+    query_cache.close()
+    database.close_connections()
+    return samples
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+def summarize(samples, duration):
+    """Per-operation throughput, latency percentiles and error rates."""
+    by_operation = {}
+    for operation, latency_ms, outcome, busy_retries in samples:
+        by_operation.setdefault(operation, []).append((latency_ms, outcome, busy_retries))
+    summary = {}
+    for operation, results in sorted(by_operation.items()):
+        latencies = sorted(latency for latency, _, _ in results)
+        outcomes = [outcome for _, outcome, _ in results]
+        count = len(results)
+        summary[operation] = {
+            "count": count,
+            "throughput_per_s": round(count / duration, 2),
+            "p50_ms": round(_percentile(latencies, 0.50), 2),
+            "p95_ms": round(_percentile(latencies, 0.95), 2),
+            "p99_ms": round(_percentile(latencies, 0.99), 2),
+            "busy_rate": round(outcomes.count("busy") / count, 4),
+            "locked_rate": round(outcomes.count("locked") / count, 4),
+            "failed_rate": round(outcomes.count("failed") / count, 4),
+            # Busy errors the write queue absorbed by backing off and retrying
+            "busy_retries": sum(retries for _, _, retries in results),
+        }
+    return summary
+
+def format_summary(summary, duration):
+    lines = [f"  {'operation':<14} {'count':>7} {'ops/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'busy':>7} {'locked':>7} {'failed':>7} {'retries':>8}"]
+    for operation, stats in summary.items():
+        lines.append(f"  {operation:<14} {stats['count']:7} {stats['throughput_per_s']:8.1f} {stats['p50_ms']:9.2f} "
+                     f"{stats['p95_ms']:9.2f} {stats['p99_ms']:9.2f} {stats['busy_rate']:7.2%} "
+                     f"{stats['locked_rate']:7.2%} {stats['failed_rate']:7.2%} {stats['busy_retries']:8}")
+    total = sum(stats["count"] for stats in summary.values())
+    lines.append(f"  {total} operations in {duration:.0f} s ({total / duration:.1f} ops/s)")
+    return "\n".join(lines)
+
+def parse_mix(text):
+    """Parses "search=40,create_order=10" into a weight dict."""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        if name.strip() not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown operation '{name.strip()}'. Expected one of: {', '.join(DEFAULT_MIX)}.")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+def parse_args(argv=None):
+    from benchmarks.fixtures import SIZES
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.loadgen", description="Swigato concurrent load generator")
+    parser.add_argument("--size", choices=list(SIZES), default="1k", help="Dataset size preset (default: 1k).")
+    parser.add_argument("--threads", type=int, default=4, help="Worker threads per process.")
+    parser.add_argument("--processes", type=int, default=1, help="Worker processes, each with --threads threads.")
+    parser.add_argument("--rate", type=float, default=0, help="Total arrivals per second (0 = closed loop, as fast as possible).")
+    parser.add_argument("--duration", type=float, default=10, help="Seconds to run.")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="Operation weights, e.g. search=40,create_order=10 (operations: " + ", ".join(DEFAULT_MIX) + ").")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the dataset and the workers' choices.")
+    parser.add_argument("--output", help="Write the summary as JSON to this file.")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    from benchmarks.fixtures import BENCH_PASSWORD, prepare_database
+    args = parse_args(argv)
+    database_path = prepare_database(args.size, seed=args.seed)
+    workers = args.threads * args.processes
+    print(f"Running {workers} worker(s) ({args.processes} process(es) x {args.threads} thread(s)) for {args.duration:.0f} s "
+          f"on the {args.size} dataset, {'closed loop' if args.rate <= 0 else f'{args.rate:g} arrivals/s'}...")
+
+    process_rate = args.rate / args.processes if args.rate > 0 else 0
+    worker_args = [(database_path, index, args.threads, args.mix, process_rate, args.duration, args.seed, BENCH_PASSWORD)
+                   for index in range(args.processes)]
+    if args.processes == 1:
+        samples = run_process(*worker_args[0])
+    else:
+        with multiprocessing.Pool(args.processes) as pool:
+            samples = [sample for result in pool.starmap(run_process, worker_args) for sample in result]
+
+    summary = summarize(samples, args.duration)
+    print(format_summary(summary, args.duration))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"config": {key: value for key, value in vars(args).items() if key != "output"},
+                       "operations": summary}, f, indent=2)
+        print(f"Summary written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
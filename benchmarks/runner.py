@@ -0,0 +1,134 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import time
+
+# Next to the generated datasets in data/benchmarks/, so one machine's timings are not committed
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "benchmarks", "baselines")
+
+def time_benchmark(run, repeat, warmup):
+    """Calls run() warmup times untimed, then repeat times; returns timing statistics in ms."""
+    for _ in range(warmup):
+        run()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "runs": repeat,
+        "min_ms": round(samples[0], 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+        "max_ms": round(samples[-1], 3),
+    }
+
+def run_benchmarks(size, repeat=10, warmup=1, only=None, seed=42, rebuild=False):
+    from benchmarks.fixtures import prepare_database
+    from benchmarks.cases import BENCHMARKS
+    from utils.query_cache import query_cache
+
+    # Repeated runs would otherwise time cache hits instead of the queries
+    query_cache.enabled = False
+    database_path = prepare_database(size, seed=seed, rebuild=rebuild)
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if only and not any(pattern in name for pattern in only):
+            continue
+        results[name] = time_benchmark(setup(), repeat, warmup)
+        print(f"  {name:<36} median {results[name]['median_ms']:10.3f} ms   p95 {results[name]['p95_ms']:10.3f} ms")
+    return {
+        "meta": {
+            "size": size,
+            "seed": seed,
+            "repeat": repeat,
+            "database": database_path,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+
+def compare(current, baseline, threshold=0.10):
+    """
+    Compares median timings against a baseline run.
+
+    Returns (lines, regressions): a printable comparison table and the names of
+    benchmarks whose median grew by more than threshold (0.10 = 10%).
+    """
+    lines = [f"  {'benchmark':<36} {'baseline':>12} {'current':>12} {'change':>9}"]
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            lines.append(f"  {name:<36} {'-':>12} {result['median_ms']:12.3f}       new")
+            continue
+        change = (result["median_ms"] - base["median_ms"]) / base["median_ms"] if base["median_ms"] else 0.0
+        marker = ""
+        if change > threshold:
+            regressions.append(name)
+            marker = "  REGRESSION"
+        lines.append(f"  {name:<36} {base['median_ms']:12.3f} {result['median_ms']:12.3f} {change:+8.1%}{marker}")
+    return lines, regressions
+
+def baseline_path(size):
+    return os.path.join(BASELINE_DIR, f"baseline_{size}.json")
+
+def parse_args(argv=None):
+    from benchmarks.fixtures import SIZES
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Swigato model benchmarks")
+    parser.add_argument("--size", choices=list(SIZES), default="1k", help="Dataset size preset (default: 1k).")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per benchmark.")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs before timing.")
+    parser.add_argument("--only", nargs="*", help="Only run benchmarks whose name contains one of these strings.")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the generated dataset.")
+    parser.add_argument("--rebuild", action="store_true", help="Regenerate the cached dataset.")
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against (default: baselines/baseline_<size>.json).")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline for --size.")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Median slowdown counted as a regression (default 0.10).")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    print(f"Running benchmarks on the {args.size} dataset...")
+    current = run_benchmarks(args.size, repeat=args.repeat, warmup=args.warmup, only=args.only,
+                             seed=args.seed, rebuild=args.rebuild)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    exit_code = 0
+    baseline_file = args.baseline or baseline_path(args.size)
+    if os.path.exists(baseline_file) and not args.save_baseline:
+        with open(baseline_file, encoding="utf-8") as f:
+            baseline = json.load(f)
+        lines, regressions = compare(current, baseline, args.threshold)
+        print(f"Compared with {baseline_file} ({baseline['meta'].get('timestamp', 'unknown date')}):")
+        print("\n".join(lines))
+        if regressions:
+            print(f"{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+            exit_code = 1
+    elif not args.save_baseline:
+        print(f"No baseline at {baseline_file}; run with --save-baseline to store one.")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(baseline_path(args.size)), exist_ok=True)
+        with open(baseline_path(args.size), "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+        print(f"Baseline saved to {baseline_path(args.size)}")
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ from gui_Light import (
     GRAY_TEXT_COLOR, SECONDARY_COLOR, ACCENT_COLOR
 )
 from utils.image_loader import load_image
+from utils.scheduler import scheduler
 from cart.models import CartItem
 
 class CartScreen(ctk.CTkFrame):
@@ -326,28 +327,28 @@ class CartScreen(ctk.CTkFrame):
         # Navigate to main app first
         self.show_main_app_callback(self.user)
         # Schedule switching to orders content after the main app loads
-        self.after(100, self._switch_to_orders)
+        scheduler.call_later(self.app, 100, self._switch_to_orders)
 
     def show_favorites(self):
         """Show favorites - navigate to main app and switch to favorites content"""
         # Navigate to main app first
         self.show_main_app_callback(self.user)
         # Schedule switching to favorites content after the main app loads
-        self.after(100, self._switch_to_favorites)
+        scheduler.call_later(self.app, 100, self._switch_to_favorites)
 
     def show_profile(self):
         """Show profile - navigate to main app and switch to profile content"""
         # Navigate to main app first
         self.show_main_app_callback(self.user)
         # Schedule switching to profile content after the main app loads
-        self.after(100, self._switch_to_profile)
+        scheduler.call_later(self.app, 100, self._switch_to_profile)
 
     def logout(self):
         """Handle logout functionality"""
         # Navigate to main app and trigger logout
         self.show_main_app_callback(self.user)
         # Schedule logout after main app loads
-        self.after(100, self._trigger_logout)
+        scheduler.call_later(self.app, 100, self._trigger_logout)
 
     def _trigger_logout(self):
         """Helper method to trigger logout after main app loads"""
@@ -95,22 +95,16 @@ def set_swigato_icon(window):
                     except:
                         pass
                 
+                from utils.scheduler import scheduler
                 # Set icon immediately
                 apply_icon()
                 # Set icon multiple times with increasing delays to override CTK
                 for delay in [10, 50, 100, 200, 500, 1000]:
-                    window.after(delay, apply_icon)
+                    scheduler.call_later(window, delay, apply_icon)
                     
-                # Also set up a periodic check to maintain the icon
-                def maintain_icon():
-                    try:
-                        if window.winfo_exists():
-                            window.iconbitmap(icon_path)
-                            window.after(2000, maintain_icon)  # Check every 2 seconds
-                    except:
-                        pass
-                
-                window.after(1500, maintain_icon)  # Start maintaining after 1.5 seconds
+                # Also re-apply it periodically to maintain the icon; the scheduler
+                # stops this when the window is destroyed
+                scheduler.every(window, 2000, apply_icon, key="swigato_icon", first_delay_ms=1500)
             else:
                 logging.warning(f"Swigato icon file not found at {icon_path}.")
         except Exception as e:
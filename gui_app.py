@@ -1,18 +1,22 @@
+import time
+_STARTUP_T0 = time.perf_counter()  # Taken before the heavy imports so --profile-startup can measure them
+
 import customtkinter as ctk
 import os
 import json
+import argparse
+import threading
 from tkinter import messagebox
 
 # Import constants
 from gui_Light import BACKGROUND_COLOR, TEXT_COLOR, PRIMARY_COLOR, BUTTON_HOVER_COLOR, SUCCESS_COLOR, DISABLED_BUTTON_COLOR
 
-# Import screen components
+# Import screen components.
+# Only the screens needed for the first frame are imported up front; MainAppScreen,
+# MenuScreen, CartScreen and ModernAdminDashboard (with its admin table screens) are
+# imported inside their factory methods the first time they are shown.
 from Authentication.login_screen import LoginScreen
 from Authentication.signup_screen import SignupScreen
-from gui_components.main_app_screen import MainAppScreen
-from restaurants.menu_screen import MenuScreen
-from cart.cart_screen import CartScreen
-from admin.modern_admin_dashboard import ModernAdminDashboard  # Import Modern AdminDashboard
 from cart.models import Cart
 from users.auth import User
 from users.models import User  # Ensure User is imported
@@ -24,10 +28,20 @@ from restaurants.models import populate_sample_restaurant_data
 
 # Import logger
 from utils.logger import log
+from utils.startup_profile import startup_profiler
+from utils.sql_trace import sql_tracer
+from utils import metrics
+from utils.stall_monitor import stall_monitor
+from utils.leak_tracker import leak_tracker
+from utils.tasks import cancel_for
+from utils.scheduler import scheduler
+from gui_components.screen_cache import ScreenCache
 
 class App(ctk.CTk):
-    def __init__(self):
+    def __init__(self, seed_sample_data=True, warm_up=True):
         super().__init__()
+        startup_profiler.mark("Tk root created")
+        sql_tracer.bind_tk(self)
 
         self.title("Swigato Food Delivery")
 
@@ -52,6 +66,8 @@ class App(ctk.CTk):
 
         self.current_screen_frame = None
         self.admin_dashboard_instance = None  # Initialize admin_dashboard_instance attribute
+        # Hidden MainAppScreen / MenuScreen instances, shown again instead of rebuilt
+        self.screen_cache = ScreenCache.from_env()
 
         # Master list for user data, to be managed by the App instance
         self.master_users_data = [
@@ -62,9 +78,16 @@ class App(ctk.CTk):
             {'id': 5, 'username': 'Aayush', 'is_admin': False, 'address': 'Adhartal, Jabalpur, MP 482004'}
         ]
 
-        # Initialize database and populate sample data
+        # Initialize database (a single version check when the schema is current).
+        # Sample data is seeded on a background thread so it doesn't delay the first frame.
         initialize_database()
-        populate_sample_restaurant_data()
+        startup_profiler.mark("database initialized")
+        self._seed_thread = None
+        self._warm_up = warm_up
+        if seed_sample_data:
+            self._seed_thread = threading.Thread(target=populate_sample_restaurant_data,
+                                                 name="swigato-seed", daemon=True)
+            self._seed_thread.start()
 
         self.app_callbacks = {
             "show_signup_screen": self.show_signup_screen,
@@ -79,6 +102,13 @@ class App(ctk.CTk):
         }
 
         self.show_login_screen()
+        startup_profiler.mark("login screen built")
+
+    def _wait_for_seeding(self):
+        """Blocks until background seeding finishes; it only runs long on a brand-new database."""
+        if self._seed_thread and self._seed_thread.is_alive():
+            log("INFO: Waiting for sample data seeding to finish.")
+            self._seed_thread.join()
 
     def _center_window(self, width, height):
         screen_width = self.winfo_screenwidth()
@@ -99,9 +129,11 @@ class App(ctk.CTk):
         return SignupScreen(self, self.show_login_screen)
 
     def _create_main_app_screen(self):
+        from gui_components.main_app_screen import MainAppScreen
         return MainAppScreen(self, self.current_user, self.show_menu_screen, self.logout)
 
     def _create_menu_screen(self, restaurant):
+        from restaurants.menu_screen import MenuScreen
         # Ensure self.menu_screen_instance is created and stored
         self.menu_screen_instance = MenuScreen(
             app_ref=self,  # Pass self (the App instance) as app_ref
@@ -111,6 +143,7 @@ class App(ctk.CTk):
         return self.menu_screen_instance
 
     def _create_cart_screen(self):
+        from cart.cart_screen import CartScreen
         self.cart_screen_instance = CartScreen(
             self, 
             self.current_user, 
@@ -127,6 +160,7 @@ class App(ctk.CTk):
            not self.admin_dashboard_instance or \
            not self.admin_dashboard_instance.winfo_exists():
             log("INFO: Creating new ModernAdminDashboard instance.")
+            from admin.modern_admin_dashboard import ModernAdminDashboard
             self.admin_dashboard_instance = ModernAdminDashboard(self, self.app_callbacks, user)
         else:
             log("INFO: Returning existing ModernAdminDashboard instance.")
@@ -134,23 +168,54 @@ class App(ctk.CTk):
             self.admin_dashboard_instance.loggedInUser = user 
         return self.admin_dashboard_instance
 
-    def _switch_screen(self, screen_factory_method, *factory_args, title, width, height):
-        if self.current_screen_frame:
-            self.current_screen_frame.destroy()
-            self.current_screen_frame = None
-
-        self.current_screen_frame = screen_factory_method(*factory_args)
-        
-        self.current_screen_frame.pack(fill="both", expand=True)
-        self._set_window_properties(title, width, height)
-        
-        # If the current screen is ModernAdminDashboard, and it has refresh_data, call it.
-        if isinstance(self.current_screen_frame, ModernAdminDashboard):
-            if hasattr(self.current_screen_frame, 'refresh_data') and callable(getattr(self.current_screen_frame, 'refresh_data')):
-                log("INFO: ModernAdminDashboard is packed and current. Calling refresh_data().")
-                self.current_screen_frame.refresh_data()  # type: ignore[attr-defined]
+    def _switch_screen(self, screen_factory_method, *factory_args, title, width, height, cache_key=None):
+        """
+        Replaces the current screen with the one built by screen_factory_method(*factory_args).
+
+        Screens switched to with a cache_key are kept hidden in the screen cache
+        when left, and shown again (with a call to their on_show()) instead of
+        being rebuilt the next time the same key is switched to.
+        """
+        switch_started = time.perf_counter()
+        screen_name = screen_factory_method.__name__.removeprefix("_create_").removeprefix("_get_or_create_")
+        with stall_monitor.action(f"switch to {screen_name}"):
+            if self.current_screen_frame:
+                if self.current_screen_frame in self.screen_cache:
+                    self.screen_cache.hide(self.current_screen_frame)
+                else:
+                    # Drop background loads for the old screen so their results are never applied
+                    cancel_for(self.current_screen_frame)
+                    self.current_screen_frame.destroy()
+                self.current_screen_frame = None
+
+            cached_screen = None
+            if cache_key is not None and self.screen_cache.enabled:
+                cached_screen = self.screen_cache.get(cache_key)
+            if cached_screen is not None:
+                self.current_screen_frame = cached_screen
             else:
-                log("WARNING: ModernAdminDashboard instance does not have a callable refresh_data method.")
+                self.current_screen_frame = screen_factory_method(*factory_args)
+                if cache_key is not None:
+                    self.screen_cache.put(cache_key, self.current_screen_frame)
+            
+            self.current_screen_frame.pack(fill="both", expand=True)
+            self._set_window_properties(title, width, height)
+            if cached_screen is not None and callable(getattr(cached_screen, "on_show", None)):
+                cached_screen.on_show()
+            
+            # If the current screen is the ModernAdminDashboard, and it has refresh_data, call it.
+            if self.current_screen_frame is self.admin_dashboard_instance:
+                if hasattr(self.current_screen_frame, 'refresh_data') and callable(getattr(self.current_screen_frame, 'refresh_data')):
+                    log("INFO: ModernAdminDashboard is packed and current. Calling refresh_data().")
+                    self.current_screen_frame.refresh_data()  # type: ignore[attr-defined]
+                else:
+                    log("WARNING: ModernAdminDashboard instance does not have a callable refresh_data method.")
+
+        metrics.histogram("swigato_screen_load_seconds", "Time to tear down the old screen and build (or re-show) the new one.",
+                          screen=screen_name, source="cache" if cached_screen is not None else "build").observe(time.perf_counter() - switch_started)
+        if leak_tracker.enabled:
+            # Once pending idle work (geometry, deferred destroys) has run
+            self.after_idle(leak_tracker.checkpoint, self, screen_name)
 
     def _post_login_navigation(self, user: User):
         log(f"INFO: _post_login_navigation called for user: {user.username if user else 'None'}. Admin status: {user.is_admin if user else 'N/A'}")
@@ -162,6 +227,7 @@ class App(ctk.CTk):
 
         self.cart = Cart(user_id=user.user_id)
         log(f"INFO: User {user.username} logged in. Is Admin: {user.is_admin}")
+        self._wait_for_seeding()
         if user.is_admin:
             self.show_admin_screen(user)
         else:
@@ -177,7 +243,7 @@ class App(ctk.CTk):
         # Bring window to front and focus
         self.lift()
         self.focus_force()
-        self.after(100, self._focus_login_entries, username_to_fill)
+        scheduler.call_later(self, 100, self._focus_login_entries, username_to_fill)
 
     def _focus_login_entries(self, username_to_fill):
         if self.current_screen_frame and \
@@ -206,7 +272,8 @@ class App(ctk.CTk):
             self.cart = Cart(user_id=user.user_id)
             log(f"INFO: Cart initialized/updated for user {user.user_id} in show_main_app_screen.")
 
-        self._switch_screen(self._create_main_app_screen, title="Swigato - Home", width=900, height=700)
+        self._switch_screen(self._create_main_app_screen, title="Swigato - Home", width=900, height=700,
+                            cache_key=("main_app_screen", user.user_id))
 
     def show_menu_screen(self, restaurant):
         if not self.current_user:
@@ -214,7 +281,8 @@ class App(ctk.CTk):
             self.show_login_screen()
             return
         self.current_restaurant = restaurant
-        self._switch_screen(self._create_menu_screen, restaurant, title=f"Swigato - {restaurant.name}", width=900, height=750)
+        self._switch_screen(self._create_menu_screen, restaurant, title=f"Swigato - {restaurant.name}", width=900, height=750,
+                            cache_key=("menu_screen", self.current_user.user_id, restaurant.restaurant_id))
 
     def show_menu_screen_from_cart(self, restaurant):
         self.show_menu_screen(restaurant)
@@ -261,6 +329,7 @@ class App(ctk.CTk):
         self._switch_screen(_get_or_create_admin_screen_for_switch_factory, title="Swigato - Admin Panel", width=1000, height=700)
 
     def handle_review_submitted(self, restaurant_id):
+        from restaurants.menu_screen import MenuScreen
         if isinstance(self.current_screen_frame, MenuScreen) and self.current_screen_frame.restaurant.id == restaurant_id:
             self.current_screen_frame.refresh_reviews()
 
@@ -278,6 +347,7 @@ class App(ctk.CTk):
                 messagebox.showwarning("Empty Cart", "Your cart is empty. Please add items before checking out.")
             except Exception as e:
                 print(f"Error showing messagebox: {e}")
+            from cart.cart_screen import CartScreen
             if self.current_screen_frame and isinstance(self.current_screen_frame, CartScreen) and self.current_screen_frame.winfo_ismapped():
                 self.current_screen_frame.load_cart_items()
             return
@@ -332,6 +402,8 @@ class App(ctk.CTk):
             self.admin_dashboard_instance.destroy()
             self.admin_dashboard_instance = None
         self.show_login_screen()
+        # Cached screens belong to the user who just logged out
+        self.screen_cache.clear()
         log(f"INFO: Logout complete. Showing login screen.")
 
     def show_main_app_cart(self):
@@ -348,10 +420,58 @@ class App(ctk.CTk):
         if self.current_screen_frame and hasattr(self.current_screen_frame, 'handle_nav_click'):
             self.current_screen_frame.handle_nav_click('cart')
 
+    def _on_first_frame(self):
+        startup_profiler.mark("first frame")
+        startup_profiler.print_report()
+        if self._warm_up:
+            # Fill the caches the post-login screens use while the user is still logging in.
+            # Imported here: warm-up pulls in PIL and the image loader, which the login screen does not need
+            from utils.warmup import warmup
+            warmup.start(wait_for=self._seed_thread)
+
     def run(self):
+        # after_idle fires once the initial geometry and redraw events have been processed
+        self.after_idle(self._on_first_frame)
         self.mainloop()
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Swigato Food Delivery (GUI)")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Print a breakdown of the time taken to reach the first frame.")
+    parser.add_argument("--skip-seed", action="store_true",
+                        help="Don't populate sample restaurant data on start-up.")
+    parser.add_argument("--no-warmup", action="store_true",
+                        help="Don't preload restaurants, menus and images in the background while the login screen shows.")
+    parser.add_argument("--trace-sql", action="store_true",
+                        help="Record every SQL statement, flag likely N+1 queries and write a report at exit.")
+    parser.add_argument("--stall-monitor", type=int, nargs="?", const=200, metavar="MS",
+                        help="Report event-loop stalls longer than MS milliseconds (default 200) to data/stall_reports.log.")
+    parser.add_argument("--track-leaks", action="store_true",
+                        help="Record widgets, after() callbacks, images and memory at every screen switch to data/leak_report.log.")
+    parser.add_argument("--metrics-file", metavar="PATH",
+                        help="Periodically write Prometheus-format metrics to PATH.")
+    parser.add_argument("--metrics-port", type=int, metavar="PORT",
+                        help="Serve Prometheus-format metrics at http://127.0.0.1:PORT/metrics.")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    app = App()
+    args = parse_args()
+    if args.profile_startup:
+        startup_profiler.enable(origin=_STARTUP_T0)
+        startup_profiler.mark("imports")
+    if args.trace_sql:
+        sql_tracer.enable()
+    if args.track_leaks:
+        leak_tracker.enable()
+    metrics.start_exporters_from_env()
+    if args.metrics_file:
+        metrics.start_file_exporter(args.metrics_file)
+    if args.metrics_port:
+        metrics.start_http_server(args.metrics_port)
+    app = App(seed_sample_data=not args.skip_seed, warm_up=not args.no_warmup)
+    stall_threshold_ms = args.stall_monitor or int(os.environ.get("SWIGATO_STALL_MS", "0"))
+    if stall_threshold_ms:
+        stall_monitor.start(app, stall_threshold_ms)
     app.run()
@@ -1,4 +1,3 @@
 # GUI Components Package
-from .main_app_screen import MainAppScreen
-
-__all__ = ['MainAppScreen']
+# Screens are imported from their modules when first shown (see gui_app.App), so
+# importing a submodule here must not pull in the others.
@@ -0,0 +1,426 @@
+import bisect
+import time
+from tkinter import ttk
+import customtkinter as ctk
+
+from utils.logger import log
+from utils.tasks import load_async
+
+SAMPLE_ROWS = 200  # Rows measured when sizing columns, so width does not depend on the row count
+SORT_ARROWS = {False: " ▲", True: " ▼"}
+SYNC_SORT_ROWS = 50000  # Larger grids sort on the worker pool so the window stays responsive
+DEFAULT_COLORS = ["#242424", "#1f1f1f"]
+DEFAULT_TEXT_COLOR = "#e0e0e0"
+
+def sorted_order(rows, column, descending=False):
+    """Indices of rows ordered by column. Safe to run off the Tk thread."""
+    values = [row[column] if column < len(row) else None for row in rows]
+    try:
+        keys = list(map(float, values))  # Fast path for all-numeric columns
+    except (TypeError, ValueError):
+        keys = list(map(_sort_key, values))
+    return sorted(range(len(rows)), key=keys.__getitem__, reverse=descending)
+
+def _sort_key(value):
+    """Numbers (including numeric strings such as "12.50" or "4/5") sort numerically, before text."""
+    if isinstance(value, (int, float)):
+        return (0, value, "")
+    text = "" if value is None else str(value)
+    try:
+        return (0, float(text.split("/", 1)[0]), text)
+    except ValueError:
+        return (1, 0, text.lower())
+
+class DataGrid(ctk.CTkFrame):
+    """
+    Table for the admin screens that stays fast with any number of rows.
+
+    CTkTable creates a widget per cell, so 10k orders x 8 columns is 80k
+    widgets. DataGrid is a ttk.Treeview holding only as many items as fit in
+    the viewport; scrolling re-binds those items to other rows, so the cost of
+    showing, scrolling and resizing does not depend on the row count.
+
+    values has the same layout as for CTkTable (header row first). Clicking a
+    heading sorts by that column (again to reverse). command receives the same
+    event data as CTkTable's command, {"row", "column", "value"}, where "row"
+    is the row's position in values (1 for the first data row) regardless of
+    how the grid is sorted or scrolled, so existing _on_cell_click handlers
+    work unchanged. Cells are single-line; text wider than the column
+    (at most max_column_width pixels) is clipped.
+
+    Rows are identified by the value in key_column (the primary key), so a
+    screen can patch_row(), remove_rows() and insert_rows() after an edit
+    instead of reloading the whole table. Screens keep their own list of
+    records in step with the rows, which keeps "row" pointing at the same
+    record in both. empty_text is shown once the last row is removed.
+
+    With selectable=True rows can be selected for bulk actions: a click
+    selects a row, Ctrl+click toggles one, Shift+click selects a range,
+    Ctrl+A selects everything and Escape clears the selection. The selection
+    is kept by key, so it survives sorting, scrolling and patching, and
+    on_select(keys) is called whenever it changes.
+    """
+
+    def __init__(self, master, values, name, command=None, font=None, header_font=None,
+                 header_color=None, header_text_color=None, text_color=None, hover_color=None,
+                 colors=None, border_color=None, border_width=1, corner_radius=8,
+                 max_column_width=180, row_padding=10, key_column=0, empty_text="No rows.",
+                 selectable=False, select_color=None, on_select=None, **kwargs):
+        super().__init__(master, fg_color="transparent", border_color=border_color,
+                         border_width=border_width if border_color else 0, corner_radius=corner_radius, **kwargs)
+        started = time.perf_counter()
+        self.name = name
+        self.command = command
+        self.header = [str(h) for h in values[0]]
+        self.rows = values[1:]
+        self.max_column_width = max_column_width
+        self.key_column = key_column
+        self._key_index = None  # key -> index into rows, built on first lookup
+        self._sort_pending = False
+        self.selectable = selectable
+        self.on_select = on_select
+        self._selection = {}  # Selected keys in the order they were selected (a dict as an ordered set)
+        self._anchor = None  # Key Shift+click extends the selection from
+        self.sort_column = None
+        self.sort_descending = False
+        self._order = range(len(self.rows))  # Display position -> index into rows
+        self._top = 0  # Display position of the first row in view
+        self._slots = []  # Treeview item ids, one per row in view
+        self._hover_slot = None
+
+        colors = colors or DEFAULT_COLORS
+        text_color = text_color or DEFAULT_TEXT_COLOR
+        header_color = header_color or colors[0]
+        self._font = font or ctk.CTkFont(size=13)
+        self._header_font = header_font or ctk.CTkFont(family=self._font.cget("family"),
+                                                       size=self._font.cget("size"), weight="bold")
+        self._row_height = self._font.metrics("linespace") + row_padding
+
+        # Styles are named per grid so screens with different themes do not restyle each other
+        self._style_name = f"{name}_{id(self)}.Treeview"
+        style = ttk.Style(self)
+        if style.theme_use() not in ("clam", "alt", "default"):
+            style.theme_use("clam")  # Native themes (vista, aqua) ignore heading and row colours
+        style.configure(self._style_name, background=colors[0], fieldbackground=colors[0],
+                        foreground=text_color, font=self._font, rowheight=self._row_height, borderwidth=0)
+        style.configure(f"{self._style_name}.Heading", background=header_color, foreground=header_text_color or text_color,
+                        font=self._header_font, relief="flat", padding=(6, 6))
+        style.map(f"{self._style_name}.Heading", background=[("active", hover_color or header_color)])
+        style.layout(self._style_name, [("Treeview.treearea", {"sticky": "nswe"})])  # No border around the rows
+
+        columns = [str(i) for i in range(len(self.header))]
+        inset = max(border_width if border_color else 0, int(corner_radius / 2))
+        self.tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="none",
+                                 style=self._style_name, takefocus=True)
+        # Tags configured first take precedence, so hover and selection go before the stripes
+        self.tree.tag_configure("hover", background=hover_color or colors[0])
+        self.tree.tag_configure("selected", background=select_color or hover_color or colors[0])
+        self.tree.tag_configure("even", background=colors[0], foreground=text_color)
+        self.tree.tag_configure("odd", background=colors[1 % len(colors)], foreground=text_color)
+        for i, heading in enumerate(self.header):
+            self.tree.heading(columns[i], text=heading, anchor="w", command=lambda c=i: self.sort_by(c))
+            self.tree.column(columns[i], width=self._column_width(i), minwidth=40, stretch=True, anchor="w")
+        self.tree.pack(side="left", fill="both", expand=True, padx=(inset, 0), pady=inset)
+
+        self.scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self.scrollbar.pack(side="right", fill="y", padx=(0, inset), pady=inset)
+        self._empty_label = ctk.CTkLabel(self, text=empty_text, font=self._font, text_color=text_color)
+        self._empty_shown = False
+
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<ButtonRelease-1>", self._on_click)
+        self.tree.bind("<Motion>", self._on_motion)
+        self.tree.bind("<Leave>", lambda event: self._set_hover(None))
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(sequence, self._on_mousewheel)
+        self.tree.bind("<Prior>", lambda event: self.scroll(-max(len(self._slots) - 1, 1)))
+        self.tree.bind("<Next>", lambda event: self.scroll(max(len(self._slots) - 1, 1)))
+        self.tree.bind("<Home>", lambda event: self.scroll_to(0))
+        self.tree.bind("<End>", lambda event: self.scroll_to(len(self.rows)))
+        if selectable:
+            self.tree.bind("<Control-a>", lambda event: (self.select_all(), "break")[1])
+            self.tree.bind("<Escape>", lambda event: self.clear_selection())
+
+        self._resize_slots(1)
+        log(f"DataGrid {name}: {len(self.rows)} rows x {len(self.header)} columns in "
+            f"{(time.perf_counter() - started) * 1000:.1f} ms.")
+
+    # --- Public API ---
+
+    def set_rows(self, rows, keep_scroll=True):
+        """Replaces the data rows (without a header), keeping the current sort."""
+        top = self._top
+        self.rows = list(rows)
+        self._order = range(len(self.rows))
+        self._key_index = None
+        self._hover_slot = None
+        self._resize_slots(self._fitting_slots())
+        if self.sort_column is not None:
+            self._start_sort()
+        if self._selection:
+            present = {row[self.key_column] for row in self.rows}
+            self._set_selection([key for key in self._selection if key in present])
+        self.scroll_to(top if keep_scroll else 0)
+
+    def update_row(self, index, row):
+        """Replaces one data row (0-based index into the rows) in place. Does not re-sort."""
+        if self._key_index is not None:
+            self._key_index.pop(self.rows[index][self.key_column], None)
+            self._key_index[row[self.key_column]] = index
+        self.rows[index] = row
+        self._render()
+
+    def index_of(self, key):
+        """Index into the rows of the row whose key_column value is key, or None."""
+        if self._key_index is None:
+            self._key_index = {row[self.key_column]: i for i, row in enumerate(self.rows)}
+        return self._key_index.get(key)
+
+    def patch_row(self, key, row):
+        """Replaces the row with this key where it is shown. Returns False if there is no such row."""
+        index = self.index_of(key)
+        if index is None:
+            return False
+        self.update_row(index, row)
+        return True
+
+    def patch_rows(self, rows):
+        """patch_row() for many rows at once, keyed by their key_column value. Returns how many were patched."""
+        patched = 0
+        for row in rows:
+            index = self.index_of(row[self.key_column])
+            if index is not None:
+                self.rows[index] = row
+                patched += 1
+        if patched:
+            self._render()
+        return patched
+
+    def remove_rows(self, keys):
+        """Removes the rows with these keys; the rows below move up. Returns how many were removed."""
+        dead = sorted({index for index in map(self.index_of, keys) if index is not None})
+        if not dead:
+            return 0
+        dead_set = set(dead)
+        self.rows = [row for i, row in enumerate(self.rows) if i not in dead_set]
+        if isinstance(self._order, range):
+            self._order = range(len(self.rows))
+        else:
+            self._order = [i - bisect.bisect_left(dead, i) for i in self._order if i not in dead_set]
+        self._rows_changed()
+        keys = set(keys)
+        if any(key in keys for key in self._selection):
+            self._set_selection([key for key in self._selection if key not in keys])
+        return len(dead)
+
+    def insert_rows(self, rows, index=0):
+        """
+        Inserts rows before the row at index (into the rows; records lists
+        kept in step should insert at the same index). In a sorted grid the
+        new rows are shown at the top until the next sort.
+        """
+        rows = list(rows)
+        if not rows:
+            return
+        count = len(rows)
+        self.rows[index:index] = rows
+        if isinstance(self._order, range):
+            self._order = range(len(self.rows))
+        else:
+            self._order = list(range(index, index + count)) + [i + count if i >= index else i for i in self._order]
+        self._rows_changed()
+
+    def selected_keys(self):
+        """Keys of the selected rows, in the order they were selected."""
+        return list(self._selection)
+
+    def select_all(self):
+        self._set_selection([row[self.key_column] for row in self.rows])
+
+    def clear_selection(self):
+        self._set_selection([])
+
+    def sort_by(self, column, descending=None):
+        """Sorts by column; without descending, a second sort by the same column reverses it."""
+        reverse = descending is None and column == self.sort_column and isinstance(self._order, list)
+        if descending is None:
+            descending = not self.sort_descending if column == self.sort_column else False
+        self.sort_column, self.sort_descending = column, descending
+        if reverse:
+            self._order = self._order[::-1]  # Same column again: no need to sort from scratch
+            self._sorted()
+        else:
+            self._start_sort()
+
+    def scroll(self, rows):
+        self.scroll_to(self._top + rows)
+
+    def scroll_to(self, position):
+        """Scrolls so the row at display position is at the top (as far as the row count allows)."""
+        self._top = max(0, min(int(position), len(self.rows) - len(self._slots)))
+        self._render()
+
+    def visible_rows(self):
+        """Indices into the rows of the rows in view, top to bottom."""
+        return [self._order[self._top + slot] for slot in range(len(self._slots))]
+
+    # --- Rendering ---
+
+    def _column_width(self, column):
+        texts = [self.header[column]] + [str(row[column]) for row in self.rows[:SAMPLE_ROWS] if column < len(row)]
+        widest = max(self._header_font.measure(texts[0] + SORT_ARROWS[True]),
+                     max((self._font.measure(text) for text in texts[1:]), default=0))
+        return min(widest + 16, self.max_column_width)
+
+    def _start_sort(self):
+        rows, column, descending = self.rows, self.sort_column, self.sort_descending
+        if len(rows) <= SYNC_SORT_ROWS:
+            self._sort_pending = False
+            self._order = sorted_order(rows, column, descending)
+            self._sorted()
+            return
+        self.tree.heading(str(column), text=self.header[column] + " …")
+        self._sort_pending = True
+        started = time.perf_counter()
+
+        def on_sorted(order):
+            if rows is not self.rows or (column, descending) != (self.sort_column, self.sort_descending):
+                return  # The data or the requested sort changed meanwhile
+            self._sort_pending = False
+            log(f"DataGrid {self.name}: sorted {len(rows)} rows by {self.header[column]!r} in "
+                f"{(time.perf_counter() - started) * 1000:.0f} ms.")
+            self._order = order
+            self._sorted()
+        load_async(self, lambda: sorted_order(rows, column, descending), on_sorted, key="sort")
+
+    def _sorted(self):
+        for i, heading in enumerate(self.header):
+            arrow = SORT_ARROWS[self.sort_descending] if i == self.sort_column else ""
+            self.tree.heading(str(i), text=heading + arrow)
+        self.scroll_to(0)
+
+    def _rows_changed(self):
+        self._key_index = None
+        self._hover_slot = None
+        if self._sort_pending:
+            self._start_sort()  # The pending sort was computed for the old rows
+        self._resize_slots(self._fitting_slots())
+
+    def _fitting_slots(self):
+        header_height = self._header_font.metrics("linespace") + 14
+        height = self.tree.winfo_height() - header_height
+        return max(height // self._row_height, 1)
+
+    def _resize_slots(self, count):
+        count = min(count, len(self.rows))
+        while len(self._slots) > count:
+            self.tree.delete(self._slots.pop())
+            if self._hover_slot is not None and self._hover_slot >= len(self._slots):
+                self._hover_slot = None
+        while len(self._slots) < count:
+            self._slots.append(self.tree.insert("", "end", values=()))
+        self.scroll_to(self._top)
+
+    def _render(self):
+        for slot, item in enumerate(self._slots):
+            position = self._top + slot
+            row = self.rows[self._order[position]]
+            tags = ["odd" if position % 2 else "even"]
+            if slot == self._hover_slot:
+                tags.append("hover")
+            if self._selection and row[self.key_column] in self._selection:
+                tags.append("selected")
+            self.tree.item(item, values=row, tags=tags)
+        total = len(self.rows)
+        if (total == 0) != self._empty_shown:
+            self._empty_shown = total == 0
+            if self._empty_shown:
+                self._empty_label.place(relx=0.5, rely=0.5, anchor="center")
+            else:
+                self._empty_label.place_forget()
+        if total:
+            self.scrollbar.set(self._top / total, (self._top + len(self._slots)) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _set_selection(self, keys):
+        keys = dict.fromkeys(keys)
+        if list(keys) == list(self._selection):
+            return
+        self._selection = keys
+        if self._anchor not in keys:
+            self._anchor = None
+        self._render()
+        if self.on_select:
+            self.on_select(list(keys))
+
+    def _click_select(self, position, event):
+        key = self.rows[self._order[position]][self.key_column]
+        if event.state & 0x0004:  # Control: toggle this row
+            keys = [k for k in self._selection if k != key] + ([] if key in self._selection else [key])
+            self._set_selection(keys)
+            self._anchor = key
+        elif event.state & 0x0001 and self._anchor is not None:  # Shift: range from the anchor
+            anchor_index = self.index_of(self._anchor)
+            anchor = self._order.index(anchor_index) if anchor_index is not None else position
+            first, last = min(anchor, position), max(anchor, position)
+            anchor_key = self._anchor
+            self._set_selection(self.rows[self._order[p]][self.key_column] for p in range(first, last + 1))
+            self._anchor = anchor_key
+        else:
+            self._set_selection([key])
+            self._anchor = key
+
+    def _set_hover(self, slot):
+        if slot != self._hover_slot:
+            self._hover_slot = slot
+            self._render()
+
+    # --- Events ---
+
+    def _on_configure(self, event):
+        self._resize_slots(self._fitting_slots())
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(value) * len(self.rows))
+        elif action == "scroll":
+            step = int(value) * (max(len(self._slots) - 1, 1) if unit == "pages" else 1)
+            self.scroll(step)
+
+    def _on_mousewheel(self, event):
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        elif abs(event.delta) >= 120:
+            step = -int(event.delta / 120) * 3  # Windows reports multiples of 120
+        else:
+            step = -event.delta  # macOS reports small deltas
+        self.scroll(step)
+        return "break"  # The Treeview holds no rows outside the view to scroll to
+
+    def _slot_at(self, y):
+        item = self.tree.identify_row(y)
+        return self._slots.index(item) if item in self._slots else None
+
+    def _on_motion(self, event):
+        region = self.tree.identify_region(event.x, event.y)
+        self._set_hover(self._slot_at(event.y) if region == "cell" else None)
+
+    def _on_click(self, event):
+        self.tree.focus_set()
+        if self.tree.identify_region(event.x, event.y) != "cell":
+            return  # Heading clicks sort through the heading command
+        slot = self._slot_at(event.y)
+        column_id = self.tree.identify_column(event.x)  # "#1" is the first column
+        if slot is None or not column_id:
+            return
+        if self.selectable:
+            self._click_select(self._top + slot, event)
+        if self.command is None:
+            return
+        column = int(column_id[1:]) - 1
+        index = self._order[self._top + slot]
+        row = self.rows[index]
+        self.command({"row": index + 1, "column": column, "value": row[column] if column < len(row) else None})
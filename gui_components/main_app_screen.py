@@ -1,5 +1,6 @@
 import customtkinter as ctk
 import os
+import tkinter
 from tkinter import messagebox
 from PIL import Image, ImageTk
 
@@ -9,12 +10,270 @@ from gui_Light import (
     SECONDARY_COLOR, GRAY_TEXT_COLOR, ERROR_COLOR, BUTTON_TEXT_COLOR,
     HOVER_BG_COLOR, LIGHT_ORANGE_BG, set_swigato_icon
 )
-from utils.image_loader import load_image
+from utils.image_loader import load_image_cached
 from utils.logger import log
+from utils.tasks import load_async
+from utils.query_cache import query_cache
+from utils.prefetch import menu_prefetcher, HOVER_DELAY_MS, VISIBLE_DELAY_MS
+from utils.scheduler import scheduler
 from orders.models import get_orders_by_user_id, create_order
 from cart.models import Cart
 from restaurants.models import Restaurant, MenuItem
 from users.favorites_ui import FavoritesListComponent
+from gui_components.virtual_list import VirtualCardList
+
+def rating_display(avg_rating, review_count):
+    """Returns (text, color) for a restaurant's star rating line."""
+    if review_count <= 0:
+        return "⭐ No reviews yet - Be the first to review!", GRAY_TEXT_COLOR
+
+    # Generate star display with visual stars
+    filled_stars = int(avg_rating)
+    half_star = 1 if (avg_rating - filled_stars) >= 0.5 else 0
+    empty_stars = 5 - filled_stars - half_star
+
+    stars = "⭐" * filled_stars
+    if half_star:
+        stars += "⭐"  # You could use a half-star unicode if available
+    stars += "☆" * empty_stars
+
+    rating_text = f"{stars} {avg_rating:.1f} ({review_count} review{'s' if review_count != 1 else ''})"
+
+    # Color based on rating quality
+    if avg_rating >= 4.5:
+        rating_color = "#059669"  # Excellent (dark green)
+    elif avg_rating >= 4.0:
+        rating_color = SUCCESS_COLOR  # Very good (green)
+    elif avg_rating >= 3.5:
+        rating_color = "#F59E0B"  # Good (amber)
+    elif avg_rating >= 3.0:
+        rating_color = "#EF4444"  # Average (orange-red)
+    else:
+        rating_color = "#DC2626"  # Poor (red)
+    return rating_text, rating_color
+
+class RestaurantCard(ctk.CTkFrame):
+    """Restaurant card for the virtual restaurant list; set_restaurant() re-binds it to another restaurant."""
+    HEIGHT = 160
+
+    def __init__(self, parent, project_root, show_menu_callback):
+        # Ultra-modern restaurant card with advanced styling
+        super().__init__(
+            parent,
+            fg_color=FRAME_FG_COLOR,
+            border_color=FRAME_BORDER_COLOR,
+            border_width=1,
+            corner_radius=20  # More rounded for modern look
+        )
+        self.project_root = project_root
+        self.show_menu_callback = show_menu_callback
+        self.restaurant = None
+        self._prefetch_jobs = {}  # reason -> scheduled menu_prefetcher.prefetch() call
+        self.grid_columnconfigure(0, weight=0)  # Image
+        self.grid_columnconfigure(1, weight=1)  # Details
+        self.grid_columnconfigure(2, weight=0)  # Actions
+
+        # Modern image container with enhanced styling
+        image_container = ctk.CTkFrame(self, fg_color="transparent", corner_radius=16)
+        image_container.grid(row=0, column=0, rowspan=3, padx=20, pady=20, sticky="ns")
+        self.image_label = ctk.CTkLabel(image_container, text="", corner_radius=16)
+        # Modern placeholder with gradient-like effect
+        self.placeholder_label = ctk.CTkLabel(
+            image_container,
+            text="🍽️",
+            width=120,
+            height=120,
+            fg_color=PRIMARY_COLOR,
+            text_color="white",
+            font=ctk.CTkFont(size=48),
+            corner_radius=16
+        )
+
+        # Details frame
+        details_frame = ctk.CTkFrame(self, fg_color="transparent")
+        details_frame.grid(row=0, column=1, rowspan=3, padx=(0, 20), pady=20, sticky="nsew")
+        details_frame.grid_rowconfigure(3, weight=1) # Spacer
+
+        self.name_label = ctk.CTkLabel(
+            details_frame,
+            text="",
+            font=ctk.CTkFont(size=20, weight="bold"),
+            text_color=TEXT_COLOR,
+            anchor="w"
+        )
+        self.name_label.grid(row=0, column=0, sticky="ew")
+
+        self.cuisine_label = ctk.CTkLabel(
+            details_frame,
+            text="",
+            font=ctk.CTkFont(size=14),
+            text_color=GRAY_TEXT_COLOR,
+            anchor="w"
+        )
+        self.cuisine_label.grid(row=1, column=0, sticky="ew", pady=(5, 0))
+
+        self.rating_label = ctk.CTkLabel(
+            details_frame,
+            text="",
+            font=ctk.CTkFont(size=13, weight="bold"),
+            text_color=GRAY_TEXT_COLOR,
+            anchor="w"
+        )
+        self.rating_label.grid(row=2, column=0, sticky="ew", pady=(5, 0))
+
+        # Actions frame
+        actions_frame = ctk.CTkFrame(self, fg_color="transparent")
+        actions_frame.grid(row=0, column=2, rowspan=3, padx=20, pady=20, sticky="nse")
+
+        view_menu_btn = ctk.CTkButton(
+            actions_frame,
+            text="View Menu",
+            command=lambda: self.restaurant and self.show_menu_callback(self.restaurant),
+            fg_color=PRIMARY_COLOR,
+            hover_color=BUTTON_HOVER_COLOR,
+            text_color="white",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            height=40,
+            corner_radius=12
+        )
+        view_menu_btn.pack(expand=True, anchor="e")
+
+        # Start loading the menu while the user is still deciding. Bound on the frame itself
+        # (customtkinter's bind() would bind its canvas), which sees the pointer enter and
+        # leave the whole card rather than each label inside it.
+        tkinter.Misc.bind(self, "<Enter>", lambda event: self._schedule_prefetch("hover", HOVER_DELAY_MS), add="+")
+        tkinter.Misc.bind(self, "<Leave>", self._on_leave, add="+")
+
+    def _on_leave(self, event):
+        if event.detail != "NotifyInferior":  # Moving onto a child widget is still within the card
+            self._cancel_prefetch("hover", running=False)
+
+    def _schedule_prefetch(self, reason, delay_ms):
+        if self.restaurant is None or reason in self._prefetch_jobs:
+            return
+        restaurant_id = self.restaurant.restaurant_id
+        def start():
+            self._prefetch_jobs.pop(reason, None)
+            menu_prefetcher.prefetch(restaurant_id, reason)
+        self._prefetch_jobs[reason] = scheduler.call_later(self, delay_ms, start)
+
+    def _cancel_prefetch(self, reason, running=True):
+        """Cancels a scheduled prefetch and, if running, the prefetch it already started."""
+        job = self._prefetch_jobs.pop(reason, None)
+        if job is not None:
+            scheduler.cancel(job)
+        elif running and self.restaurant is not None:
+            menu_prefetcher.cancel(self.restaurant.restaurant_id, reason)
+
+    def on_release(self):
+        """Called by VirtualCardList when the card scrolls out of view and goes back to the pool."""
+        self._cancel_prefetch("hover")
+        self._cancel_prefetch("visible")
+
+    def set_restaurant(self, restaurant):
+        if self.restaurant is not None and restaurant.restaurant_id != self.restaurant.restaurant_id:
+            # Scrolled out of view (the card is being reused for another restaurant)
+            self._cancel_prefetch("hover")
+            self._cancel_prefetch("visible")
+        self.restaurant = restaurant
+        self._schedule_prefetch("visible", VISIBLE_DELAY_MS)
+
+        ctk_image = None
+        if restaurant.image_filename:
+            image_path = os.path.join(self.project_root, "assets", "restaurants", restaurant.image_filename)
+            ctk_image = load_image_cached(image_path, size=(120, 120))
+        if ctk_image:
+            self.placeholder_label.pack_forget()
+            self.image_label.configure(image=ctk_image)
+            self.image_label.pack()
+        else:
+            self.image_label.pack_forget()
+            self.placeholder_label.pack()
+
+        self.name_label.configure(text=restaurant.name)
+        self.cuisine_label.configure(text=f"🍴 {restaurant.cuisine_type or 'Variety'}")
+
+        # Rating and reviews section
+        try:
+            rating_text, rating_color = rating_display(restaurant.rating, restaurant.get_review_count())
+        except Exception as e:
+            log(f"Error displaying rating for restaurant {restaurant.name}: {e}")
+            rating_text, rating_color = "⭐ Rating unavailable", GRAY_TEXT_COLOR
+        self.rating_label.configure(text=rating_text, text_color=rating_color)
+
+class OrderCard(ctk.CTkFrame):
+    """Order history card for the virtual orders list; set_order() re-binds it to another order."""
+    HEIGHT = 180
+
+    def __init__(self, parent, status_color_func):
+        super().__init__(
+            parent,
+            fg_color=FRAME_FG_COLOR,
+            corner_radius=16,
+            border_width=1,
+            border_color=FRAME_BORDER_COLOR
+        )
+        self.status_color_func = status_color_func
+        self.grid_columnconfigure(1, weight=1)
+
+        # Order status icon
+        self.status_icon_label = ctk.CTkLabel(self, text="", font=ctk.CTkFont(size=24))
+        self.status_icon_label.grid(row=0, column=0, padx=20, pady=20, sticky="ns")
+
+        # Order details
+        details_frame = ctk.CTkFrame(self, fg_color="transparent")
+        details_frame.grid(row=0, column=1, padx=(0, 20), pady=20, sticky="nsew")
+        details_frame.grid_columnconfigure(0, weight=1)
+
+        # Order ID and date with restaurant name
+        self.header_label = ctk.CTkLabel(details_frame, text="", font=ctk.CTkFont(size=16, weight="bold"),
+                                         text_color=TEXT_COLOR, anchor="w")
+        self.header_label.grid(row=0, column=0, sticky="ew", pady=(0, 5))
+
+        self.restaurant_label = ctk.CTkLabel(details_frame, text="", font=ctk.CTkFont(size=14),
+                                             text_color="#4B5563", anchor="w")
+        self.restaurant_label.grid(row=1, column=0, sticky="ew", pady=(0, 5))
+
+        self.total_label = ctk.CTkLabel(details_frame, text="", font=ctk.CTkFont(size=16, weight="bold"),
+                                        text_color=PRIMARY_COLOR, anchor="w")
+        self.total_label.grid(row=2, column=0, sticky="ew", pady=(0, 5))
+
+        # Only one status label, below the total, with correct color
+        self.status_label = ctk.CTkLabel(details_frame, text="", font=ctk.CTkFont(size=14, weight="bold"), anchor="w")
+        self.status_label.grid(row=3, column=0, sticky="ew", pady=(0, 5))
+
+        self.address_label = ctk.CTkLabel(details_frame, text="", font=ctk.CTkFont(size=12), anchor="w")
+        self.address_label.grid(row=4, column=0, sticky="ew", pady=(0, 5))
+
+    def set_order(self, order):
+        delivered = order.status.lower() == "delivered"
+        self.status_icon_label.configure(text="✅" if delivered else "🕒",
+                                         text_color=SUCCESS_COLOR if delivered else PRIMARY_COLOR)
+        self.header_label.configure(text=f"Order #{order.order_id} • {order.order_date.strftime('%B %d, %Y')}")
+
+        # Restaurant name (if available)
+        if getattr(order, 'restaurant_name', None):
+            self.restaurant_label.configure(text=f"🏪 {order.restaurant_name}")
+            self.restaurant_label.grid()
+        else:
+            self.restaurant_label.grid_remove()
+
+        self.total_label.configure(text=f"💰 Total: ₹{order.total_amount:.2f}")
+        self.status_label.configure(text=f"📦 Status: {order.status.title()}",
+                                    text_color=self.status_color_func(order.status))
+
+        # Delivery address; older orders were stored without one
+        if getattr(order, 'delivery_address', None):
+            self.address_label.configure(text=f"📍 Delivered to: {order.delivery_address}", text_color="#6B7280")
+        else:
+            self.address_label.configure(text="📍 Address: Not available", text_color="#9CA3AF")
+
+# Tables each tab's content is read from; on_show() reloads a tab only after one of them changed
+TAB_TABLES = {
+    "home": ("restaurants", "reviews"),
+    "orders": ("orders", "order_items"),
+    "favorites": ("user_favorites", "restaurants", "menu_items"),
+}
 
 class MainAppScreen(ctk.CTkFrame):
     def __init__(self, app_ref, user, show_menu_callback, logout_callback):
@@ -24,6 +283,8 @@ class MainAppScreen(ctk.CTkFrame):
         self.show_menu_callback = show_menu_callback
         self.logout_callback = logout_callback
         self.restaurants = []
+        self._tab_versions = {}  # tab -> TAB_TABLES versions its shown content was read at
+        self._shown_cart = None  # _cart_signature() when the cart tab was last built
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
@@ -98,6 +359,50 @@ class MainAppScreen(ctk.CTkFrame):
         # --- Bottom Navigation Bar ---
         self.create_bottom_nav_bar()
 
+    def on_show(self):
+        """
+        Called when the screen is shown again from the screen cache.
+
+        Refreshes the visible tab only if what it shows changed while the
+        screen was hidden: the cart's contents, or for the other tabs the
+        versions of their TAB_TABLES (written by this process or another).
+        """
+        self.update_cart_count_in_nav()
+        tab = self.current_nav_tab
+        if tab == "cart":
+            if self._cart_signature() != self._shown_cart:
+                self.load_cart_items()
+            return
+        if tab not in TAB_TABLES:
+            tab = "home"
+        versions = query_cache.table_versions(TAB_TABLES[tab])
+        if versions is not None and versions == self._tab_versions.get(tab):
+            return
+        if tab == "orders":
+            self.load_order_history()
+        elif tab == "favorites":
+            self.load_favorites()
+        else:
+            # The list keeps its cards and scroll position and re-binds only the ones in view
+            self._load_tab("home", Restaurant.get_all_with_stats, self._on_restaurants_refreshed, key="restaurants")
+
+    def _load_tab(self, tab, query, on_result, **kwargs):
+        """load_async() for a tab's content, remembering the table versions it was read at (see on_show)."""
+        versions = query_cache.table_versions(TAB_TABLES[tab])
+        def on_loaded(result):
+            self._tab_versions[tab] = versions
+            on_result(result)
+        load_async(self, query, on_loaded, **kwargs)
+
+    def load_favorites(self):
+        versions = query_cache.table_versions(TAB_TABLES["favorites"])
+        self.favorites_list_component.load_favorites()
+        self._tab_versions["favorites"] = versions
+
+    def _cart_signature(self):
+        cart = self.app_ref.cart
+        return tuple((item_id, cart_item.quantity) for item_id, cart_item in cart.items.items()) if cart else ()
+
     def get_status_color(self, status):
         status = status.lower()
         if status == "delivered":
@@ -319,15 +624,19 @@ class MainAppScreen(ctk.CTkFrame):
         )
         filter_btn.grid(row=0, column=2, padx=(0, 15), pady=10)
         
-        # Modern Restaurant List Scrollable Frame
-        self.restaurant_scroll_frame = ctk.CTkScrollableFrame(
-            self.restaurant_container, 
-            fg_color=BACKGROUND_COLOR, 
-            border_width=0,
-            corner_radius=0
+        # Restaurant list; only the cards in view exist and they are reused while scrolling
+        self.restaurant_list = VirtualCardList(
+            self.restaurant_container,
+            create_row=lambda parent, kind: RestaurantCard(parent, self.app_ref.project_root, self.show_menu_callback),
+            bind_row=lambda card, restaurant, index: card.set_restaurant(restaurant),
+            row_height=RestaurantCard.HEIGHT,
+            row_spacing=25
         )
-        self.restaurant_scroll_frame.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
-        self.restaurant_scroll_frame.grid_columnconfigure(0, weight=1)
+        self.restaurant_list.grid(row=1, column=0, padx=10, pady=10, sticky="nsew")
+        self.restaurant_list.set_empty_widget(ctk.CTkLabel(self.restaurant_list.canvas,
+                                                           text="No restaurants match your search.",
+                                                           text_color=TEXT_COLOR,
+                                                           font=ctk.CTkFont(size=16)))
         
         # Modern Favorites content frame
         self.favorites_content_frame = ctk.CTkFrame(self.main_content_frame, fg_color=BACKGROUND_COLOR)
@@ -365,14 +674,14 @@ class MainAppScreen(ctk.CTkFrame):
         )
         orders_heading.grid(row=0, column=0, pady=(15, 10), sticky="n")
 
-        self.orders_scroll_frame = ctk.CTkScrollableFrame(
-            self.orders_content_frame, 
-            fg_color=BACKGROUND_COLOR, 
-            corner_radius=0, 
-            border_width=0
+        self.orders_list = VirtualCardList(
+            self.orders_content_frame,
+            create_row=lambda parent, kind: OrderCard(parent, self.get_status_color),
+            bind_row=lambda card, order, index: card.set_order(order),
+            row_height=OrderCard.HEIGHT
         )
-        self.orders_scroll_frame.grid(row=1, column=0, padx=0, pady=0, sticky="nsew")
-        self.orders_scroll_frame.grid_columnconfigure(0, weight=1)
+        self.orders_list.grid(row=1, column=0, padx=0, pady=0, sticky="nsew")
+        self.orders_list.set_empty_widget(self._create_orders_empty_state(self.orders_list.canvas))
 
         # Modern Cart content frame
         self.cart_content_frame = ctk.CTkFrame(self.main_content_frame, fg_color=BACKGROUND_COLOR)
@@ -419,7 +728,7 @@ class MainAppScreen(ctk.CTkFrame):
         
         # Show favorites
         self.favorites_content_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-        self.favorites_list_component.load_favorites()
+        self.load_favorites()
 
     def show_orders_content(self):
         """Show orders content"""
@@ -442,317 +751,80 @@ class MainAppScreen(ctk.CTkFrame):
         self.cart_content_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
         self.load_cart_items()
 
-    def load_order_history(self):
-        """Load and display order history in the orders content area (only one colored status label per order)"""
-        # Clear existing widgets
-        for widget in self.orders_scroll_frame.winfo_children():
-            widget.destroy()
-
-        # Get user orders
-        try:
-            orders = get_orders_by_user_id(self.user.user_id)
-        except Exception as e:
-            log(f"Error loading orders: {e}")
-            orders = []
+    def _create_orders_empty_state(self, parent):
+        """Modern empty state shown when the user has no orders."""
+        empty_frame = ctk.CTkFrame(
+            parent,
+            fg_color=FRAME_FG_COLOR,
+            corner_radius=16,
+            border_width=1,
+            border_color=FRAME_BORDER_COLOR
+        )
 
-        if not orders:
-            # Modern empty state
-            empty_frame = ctk.CTkFrame(
-                self.orders_scroll_frame,
-                fg_color=FRAME_FG_COLOR,
-                corner_radius=16,
-                border_width=1,
-                border_color=FRAME_BORDER_COLOR
-            )
-            empty_frame.grid(row=0, column=0, padx=20, pady=20, sticky="ew")
-            
-            empty_icon = ctk.CTkLabel(
-                empty_frame,
-                text="📋",
-                font=ctk.CTkFont(size=48),
-                text_color=GRAY_TEXT_COLOR
-            )
-            empty_icon.pack(pady=(30, 10))
-            
-            empty_label = ctk.CTkLabel(
-                empty_frame,
-                text="No orders yet!",
-                font=ctk.CTkFont(size=18, weight="bold"),
-                text_color=GRAY_TEXT_COLOR
-            )
-            empty_label.pack(pady=(0, 10))
-            
-            empty_desc = ctk.CTkLabel(
-                empty_frame,
-                text="Your order history will appear here",
-                font=ctk.CTkFont(size=14),
-                text_color=GRAY_TEXT_COLOR
-            )
-            empty_desc.pack(pady=(0, 30))
-            return
+        empty_icon = ctk.CTkLabel(
+            empty_frame,
+            text="📋",
+            font=ctk.CTkFont(size=48),
+            text_color=GRAY_TEXT_COLOR
+        )
+        empty_icon.pack(pady=(30, 10))
 
-        # Display orders
-        for i, order in enumerate(orders):
-            order_card = ctk.CTkFrame(
-                self.orders_scroll_frame,
-                fg_color=FRAME_FG_COLOR,
-                corner_radius=16,
-                border_width=1,
-                border_color=FRAME_BORDER_COLOR
-            )
-            order_card.grid(row=i, column=0, padx=20, pady=(0, 15), sticky="ew")
-            order_card.grid_columnconfigure(1, weight=1)
-
-            # Order status icon
-            status_icon = "✅" if order.status.lower() == "delivered" else "🕒"
-            status_label = ctk.CTkLabel(
-                order_card,
-                text=status_icon,
-                font=ctk.CTkFont(size=24),
-                text_color=SUCCESS_COLOR if order.status.lower() == "delivered" else PRIMARY_COLOR
-            )
-            status_label.grid(row=0, column=0, padx=20, pady=20, sticky="ns")
+        empty_label = ctk.CTkLabel(
+            empty_frame,
+            text="No orders yet!",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color=GRAY_TEXT_COLOR
+        )
+        empty_label.pack(pady=(0, 10))
 
-            # Order details
-            details_frame = ctk.CTkFrame(order_card, fg_color="transparent")
-            details_frame.grid(row=0, column=1, padx=(0, 20), pady=20, sticky="nsew")
-            details_frame.grid_columnconfigure(0, weight=1)
+        empty_desc = ctk.CTkLabel(
+            empty_frame,
+            text="Your order history will appear here",
+            font=ctk.CTkFont(size=14),
+            text_color=GRAY_TEXT_COLOR
+        )
+        empty_desc.pack(pady=(0, 30))
+        return empty_frame
 
-            # Order ID and date with restaurant name
-            order_header = ctk.CTkLabel(
-                details_frame,
-                text=f"Order #{order.order_id} • {order.order_date.strftime('%B %d, %Y')}",
-                font=ctk.CTkFont(size=16, weight="bold"),
-                text_color=TEXT_COLOR,
-                anchor="w"
-            )
-            order_header.grid(row=0, column=0, sticky="ew", pady=(0, 5))
-
-            # Restaurant name (if available)
-            if hasattr(order, 'restaurant_name') and order.restaurant_name:
-                restaurant_info = ctk.CTkLabel(
-                    details_frame,
-                    text=f"🏪 {order.restaurant_name}",
-                    font=ctk.CTkFont(size=14),
-                    text_color="#4B5563",
-                    anchor="w"
-                )
-                restaurant_info.grid(row=1, column=0, sticky="ew", pady=(0, 5))
+    def load_order_history(self):
+        """Load and display order history in the orders content area (only one colored status label per order)"""
+        self.orders_list.set_loading(True, "Loading your orders...")
+        self._load_tab("orders", lambda: get_orders_by_user_id(self.user.user_id), self._on_orders_loaded,
+                       on_error=self._on_orders_load_failed, key="orders")
 
-            # Order total
-            total_label = ctk.CTkLabel(
-                details_frame,
-                text=f"💰 Total: ₹{order.total_amount:.2f}",
-                font=ctk.CTkFont(size=16, weight="bold"),
-                text_color=PRIMARY_COLOR,
-                anchor="w"
-            )
-            total_label.grid(row=2, column=0, sticky="ew", pady=(0, 5))
+    def _on_orders_loaded(self, orders):
+        self.orders_list.set_loading(False)
+        self.orders_list.set_items(orders)
 
-            # Only one status label, below the total, with correct color
-            status_color = self.get_status_color(order.status)
-            status_display = ctk.CTkLabel(
-                details_frame,
-                text=f"📦 Status: {order.status.title()}",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                text_color=status_color,
-                anchor="w"
-            )
-            status_display.grid(row=3, column=0, sticky="ew", pady=(0, 5))
-
-            # Delivery address (if available)
-            if hasattr(order, 'delivery_address') and order.delivery_address:
-                address_display = ctk.CTkLabel(
-                    details_frame,
-                    text=f"📍 Delivered to: {order.delivery_address}",
-                    font=ctk.CTkFont(size=12),
-                    text_color="#6B7280",
-                    anchor="w"
-                )
-                address_display.grid(row=4, column=0, sticky="ew", pady=(0, 5))
-            else:
-                # Show "Address not available" for older orders without address data
-                address_display = ctk.CTkLabel(
-                    details_frame,
-                    text="📍 Address: Not available",
-                    font=ctk.CTkFont(size=12),
-                    text_color="#9CA3AF",
-                    anchor="w"
-                )
-                address_display.grid(row=4, column=0, sticky="ew", pady=(0, 5))
+    def _on_orders_load_failed(self, error):
+        log(f"Error loading orders: {error}")
+        self._on_orders_loaded([])
 
     def load_restaurants(self):
         log("MainAppScreen.load_restaurants called")
-        self.restaurants = Restaurant.get_all()
+        self.restaurant_list.set_loading(True, "Loading restaurants...")
+        self._load_tab("home", Restaurant.get_all_with_stats, self._on_restaurants_loaded, key="restaurants")
+
+    def _on_restaurants_loaded(self, restaurants):
+        self.restaurants = restaurants
         log(f"Loaded {len(self.restaurants)} restaurants.")
-        self.display_restaurants(self.restaurants)
+        self.restaurant_list.set_loading(False)
+        # Keep the user's filter if they started typing while the list was loading
+        if self.search_entry.get():
+            self.on_search_change()
+        else:
+            self.display_restaurants(self.restaurants)
+
+    def _on_restaurants_refreshed(self, restaurants):
+        self.restaurants = restaurants
+        if self.search_entry.get():
+            self.on_search_change()
+        else:
+            self.restaurant_list.set_items(restaurants, keep_scroll=True)
 
     def display_restaurants(self, restaurants):
         log(f"Displaying {len(restaurants)} restaurants.")
-        # Clear existing restaurant widgets
-        for widget in self.restaurant_scroll_frame.winfo_children():
-            widget.destroy()
-
-        if not restaurants:
-            no_restaurants_label = ctk.CTkLabel(self.restaurant_scroll_frame,
-                                                text="No restaurants match your search.",
-                                                text_color=TEXT_COLOR,
-                                                font=ctk.CTkFont(size=16))
-            no_restaurants_label.grid(row=0, column=0, pady=20)
-            return
-
-        for i, restaurant in enumerate(restaurants):
-            # Ultra-modern restaurant card with advanced styling
-            restaurant_card = ctk.CTkFrame(
-                self.restaurant_scroll_frame,
-                fg_color=FRAME_FG_COLOR,
-                border_color=FRAME_BORDER_COLOR,
-                border_width=1,
-                corner_radius=20,  # More rounded for modern look
-                height=160
-            )
-            restaurant_card.grid(row=i, column=0, pady=(0, 25), padx=20, sticky="ew")
-            restaurant_card.grid_columnconfigure(0, weight=0)  # Image
-            restaurant_card.grid_columnconfigure(1, weight=1)  # Details
-            restaurant_card.grid_columnconfigure(2, weight=0)  # Actions
-            restaurant_card.pack_propagate(False)
-
-            # Modern image container with enhanced styling
-            image_container = ctk.CTkFrame(
-                restaurant_card, 
-                fg_color="transparent", 
-                corner_radius=16
-            )
-            image_container.grid(row=0, column=0, rowspan=3, padx=20, pady=20, sticky="ns")
-            
-            image_label = None
-            if restaurant.image_filename:
-                project_root = self.app_ref.project_root
-                image_path = os.path.join(project_root, "assets", "restaurants", restaurant.image_filename)
-                log(f"Attempting to load restaurant image from: {image_path}")
-                ctk_image = load_image(image_path, size=(120, 120))
-                if ctk_image:
-                    image_label = ctk.CTkLabel(
-                        image_container, 
-                        image=ctk_image, 
-                        text="", 
-                        corner_radius=16
-                    )
-                    image_label.pack()
-            
-            if not image_label:
-                # Modern placeholder with gradient-like effect
-                image_label = ctk.CTkLabel(
-                    image_container, 
-                    text="🍽️", 
-                    width=120, 
-                    height=120,
-                    fg_color=PRIMARY_COLOR,
-                    text_color="white",
-                    font=ctk.CTkFont(size=48),
-                    corner_radius=16
-                )
-                image_label.pack()
-
-            # Details frame
-            details_frame = ctk.CTkFrame(restaurant_card, fg_color="transparent")
-            details_frame.grid(row=0, column=1, rowspan=3, padx=(0, 20), pady=20, sticky="nsew")
-            details_frame.grid_rowconfigure(0, weight=0)
-            details_frame.grid_rowconfigure(1, weight=0)
-            details_frame.grid_rowconfigure(2, weight=0)
-            details_frame.grid_rowconfigure(3, weight=1) # Spacer
-
-            # Restaurant name
-            name_label = ctk.CTkLabel(
-                details_frame,
-                text=restaurant.name,
-                font=ctk.CTkFont(size=20, weight="bold"),
-                text_color=TEXT_COLOR,
-                anchor="w"
-            )
-            name_label.grid(row=0, column=0, sticky="ew")
-
-            # Cuisine type
-            cuisine_text = restaurant.cuisine_type or "Variety"
-            cuisine_label = ctk.CTkLabel(
-                details_frame,
-                text=f"🍴 {cuisine_text}",
-                font=ctk.CTkFont(size=14),
-                text_color=GRAY_TEXT_COLOR,
-                anchor="w"
-            )
-            cuisine_label.grid(row=1, column=0, sticky="ew", pady=(5, 0))
-
-            # Rating and reviews section
-            try:
-                avg_rating = restaurant.rating
-                review_count = restaurant.get_review_count()
-                
-                if review_count > 0:
-                    # Generate star display with visual stars
-                    filled_stars = int(avg_rating)
-                    half_star = 1 if (avg_rating - filled_stars) >= 0.5 else 0
-                    empty_stars = 5 - filled_stars - half_star
-                    
-                    stars = "⭐" * filled_stars
-                    if half_star:
-                        stars += "⭐"  # You could use a half-star unicode if available
-                    stars += "☆" * empty_stars
-                    
-                    rating_text = f"{stars} {avg_rating:.1f} ({review_count} review{'s' if review_count != 1 else ''})"
-                    
-                    # Color based on rating quality
-                    if avg_rating >= 4.5:
-                        rating_color = "#059669"  # Excellent (dark green)
-                    elif avg_rating >= 4.0:
-                        rating_color = SUCCESS_COLOR  # Very good (green)
-                    elif avg_rating >= 3.5:
-                        rating_color = "#F59E0B"  # Good (amber)
-                    elif avg_rating >= 3.0:
-                        rating_color = "#EF4444"  # Average (orange-red)
-                    else:
-                        rating_color = "#DC2626"  # Poor (red)
-                else:
-                    rating_text = "⭐ No reviews yet - Be the first to review!"
-                    rating_color = GRAY_TEXT_COLOR
-                
-                rating_label = ctk.CTkLabel(
-                    details_frame,
-                    text=rating_text,
-                    font=ctk.CTkFont(size=13, weight="bold"),
-                    text_color=rating_color,
-                    anchor="w"
-                )
-                rating_label.grid(row=2, column=0, sticky="ew", pady=(5, 0))
-            except Exception as e:
-                log(f"Error displaying rating for restaurant {restaurant.name}: {e}")
-                # Fallback if rating calculation fails
-                no_rating_label = ctk.CTkLabel(
-                    details_frame,
-                    text="⭐ Rating unavailable",
-                    font=ctk.CTkFont(size=13),
-                    text_color=GRAY_TEXT_COLOR,
-                    anchor="w"
-                )
-                no_rating_label.grid(row=2, column=0, sticky="ew", pady=(5, 0))
-
-            # Actions frame
-            actions_frame = ctk.CTkFrame(restaurant_card, fg_color="transparent")
-            actions_frame.grid(row=0, column=2, rowspan=3, padx=20, pady=20, sticky="nse")
-
-            # View Menu button
-            view_menu_btn = ctk.CTkButton(
-                actions_frame,
-                text="View Menu",
-                command=lambda r=restaurant: self.show_menu_callback(r),
-                fg_color=PRIMARY_COLOR,
-                hover_color=BUTTON_HOVER_COLOR,
-                text_color="white",
-                font=ctk.CTkFont(size=14, weight="bold"),
-                height=40,
-                corner_radius=12
-            )
-            view_menu_btn.pack(expand=True, anchor="e")
+        self.restaurant_list.set_items(restaurants)
 
     def load_cart_items(self):
         """Load and display cart items in the cart content area."""
@@ -761,6 +833,7 @@ class MainAppScreen(ctk.CTkFrame):
             widget.destroy()
 
         cart = self.app_ref.cart
+        self._shown_cart = self._cart_signature()
         if not cart or not cart.items:
             # Modern empty cart message
             empty_frame = ctk.CTkFrame(
@@ -1273,7 +1346,7 @@ class MainAppScreen(ctk.CTkFrame):
         self.total_spent_value = self.stat_values.get("Total Spent")
         
         # Favorite Restaurants
-        fav_restaurants = len(self.user.get_favorite_restaurants())
+        fav_restaurants = len(self.user.favorite_restaurant_ids())
         self.create_stat_card(stats_frame, "⭐", "Favorites", str(fav_restaurants), 2)
 
     def create_stat_card(self, parent, icon, label, value, column):
@@ -1692,7 +1765,7 @@ class MainAppScreen(ctk.CTkFrame):
         )
         self.temp_message_label.place(relx=0.5, rely=0.95, anchor="center")
           # Remove message after 3 seconds
-        self.profile_window.after(3000, lambda: self.temp_message_label.destroy() if hasattr(self, 'temp_message_label') else None)
+        scheduler.call_later(self.temp_message_label, 3000, self.temp_message_label.destroy)
 
     def update_profile_stats(self):
         """Update the user statistics in the profile panel."""
@@ -1731,7 +1804,7 @@ class MainAppScreen(ctk.CTkFrame):
         )
         # Place it at the bottom of the profile window
         temp_label.place(relx=0.5, rely=0.98, anchor="s")
-        self.profile_window.after(3000, temp_label.destroy)
+        scheduler.call_later(temp_label, 3000, temp_label.destroy)
 
     def on_search_change(self, event=None):
         search_term = self.search_entry.get().lower()
@@ -1739,6 +1812,12 @@ class MainAppScreen(ctk.CTkFrame):
             self.load_restaurants()
             return
 
+        # The menu item search runs in the background; while typing, only the latest term is shown.
+        # Shares the "restaurants" key with load_restaurants() so a stale full list cannot overwrite the results.
+        load_async(self, lambda: MenuItem.search(search_term),
+                   lambda menu_items: self._show_search_results(search_term, menu_items), key="restaurants")
+
+    def _show_search_results(self, search_term, menu_items):
         # Filter restaurants by name or cuisine
         filtered_restaurants = [
             r for r in self.restaurants 
@@ -1746,8 +1825,7 @@ class MainAppScreen(ctk.CTkFrame):
                (r.cuisine_type and search_term in r.cuisine_type.lower())
         ]
 
-        # Filter menu items and get their restaurant IDs
-        menu_items = MenuItem.search(search_term)
+        # Restaurant IDs of the matching menu items
         restaurant_ids_from_items = {item.restaurant_id for item in menu_items}
 
         # Combine and de-duplicate
@@ -1775,7 +1853,7 @@ class MainAppScreen(ctk.CTkFrame):
         set_swigato_icon(dialog)
         
         # Center the dialog
-        dialog.after(10, lambda: self.center_window(dialog))
+        scheduler.call_later(dialog, 10, self.center_window, dialog)
         
         # Configure the dialog styling with light theme
         dialog.configure(fg_color="white")
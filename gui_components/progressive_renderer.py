@@ -0,0 +1,103 @@
+import time
+
+from utils.logger import log
+from utils.scheduler import scheduler
+
+# Statistics of the most recent render per name, see get_render_metrics()
+_render_metrics = {}
+
+def get_render_metrics(name=None):
+    """Returns the last render statistics for one name, or a copy of all of them."""
+    if name is not None:
+        return _render_metrics.get(name)
+    return dict(_render_metrics)
+
+class ProgressiveRenderer:
+    """
+    Builds a long list of rows in time-sliced chunks on the Tk event loop.
+
+    render_batch(start_index, items) is called with consecutive slices of
+    items. The first slice (first_batch items) is rendered synchronously by
+    start(), so the first screenful appears straight away. The remaining
+    slices are rendered from one-shot utils.scheduler jobs owned by widget;
+    each keeps rendering batches until budget_ms has passed and then yields
+    back to the event loop.
+
+    Rendering stops by itself when the owning widget is destroyed (the
+    scheduler drops its jobs), and cancel() stops it explicitly (e.g. when
+    the list is reloaded before it finished).
+    """
+
+    def __init__(self, widget, items, render_batch, name, first_batch=15, batch_size=5,
+                 budget_ms=12, on_complete=None):
+        self.widget = widget
+        self.items = items
+        self.render_batch = render_batch
+        self.name = name
+        self.first_batch = first_batch
+        self.batch_size = batch_size
+        self.budget_ms = budget_ms
+        self.on_complete = on_complete
+
+        self.position = 0
+        self.done = False
+        self._job = None
+        self._started_at = None
+        self._slices = 0
+        self._longest_slice_ms = 0.0
+        self._first_screen_ms = 0.0
+
+    def start(self):
+        self._started_at = time.perf_counter()
+        self._render_next(self.first_batch)
+        self._first_screen_ms = (time.perf_counter() - self._started_at) * 1000
+        self._slices = 1
+        self._longest_slice_ms = self._first_screen_ms
+        self._schedule_or_finish()
+        return self
+
+    def cancel(self):
+        if self._job is not None:
+            scheduler.cancel(self._job)
+            self._job = None
+        self.done = True
+
+    def _render_next(self, count):
+        batch = self.items[self.position:self.position + count]
+        if batch:
+            self.render_batch(self.position, batch)
+            self.position += len(batch)
+
+    def _schedule_or_finish(self):
+        if self.position >= len(self.items):
+            self._finish()
+        else:
+            self._job = scheduler.call_later(self.widget, 1, self._run_slice)
+
+    def _run_slice(self):
+        self._job = None
+        if self.done:
+            return
+        slice_start = time.perf_counter()
+        deadline = slice_start + self.budget_ms / 1000
+        while self.position < len(self.items) and time.perf_counter() < deadline:
+            self._render_next(self.batch_size)
+        slice_ms = (time.perf_counter() - slice_start) * 1000
+        self._slices += 1
+        self._longest_slice_ms = max(self._longest_slice_ms, slice_ms)
+        self._schedule_or_finish()
+
+    def _finish(self):
+        self.done = True
+        metrics = {
+            "rows": len(self.items),
+            "first_screen_ms": round(self._first_screen_ms, 1),
+            "total_ms": round((time.perf_counter() - self._started_at) * 1000, 1),
+            "slices": self._slices,
+            "longest_slice_ms": round(self._longest_slice_ms, 1),
+        }
+        _render_metrics[self.name] = metrics
+        log(f"Rendered {metrics['rows']} rows for {self.name}: first screen {metrics['first_screen_ms']} ms, "
+            f"total {metrics['total_ms']} ms in {metrics['slices']} slice(s), longest {metrics['longest_slice_ms']} ms.")
+        if self.on_complete:
+            self.on_complete()
@@ -0,0 +1,155 @@
+import os
+from collections import OrderedDict
+
+from utils import metrics
+from utils.logger import log
+from utils.tasks import cancel_for
+
+DEFAULT_MAX_SCREENS = 4
+DEFAULT_MAX_WIDGETS = 4000  # Widgets kept alive across all hidden screens
+SIZE_ENV_VAR = "SWIGATO_SCREEN_CACHE_SIZE"
+RSS_ENV_VAR = "SWIGATO_SCREEN_CACHE_MAX_RSS_MB"
+
+def _process_rss_mb():
+    """Resident set size of this process in MB, or None where it cannot be read cheaply."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def _widget_count(widget):
+    count = 0
+    pending = [widget]
+    while pending:
+        current = pending.pop()
+        count += 1
+        pending.extend(current.winfo_children())
+    return count
+
+class ScreenCache:
+    """
+    LRU of hidden screen instances, keyed by (screen name, arguments).
+
+    Instead of destroying a screen when navigating away, App hides it here
+    and shows it again on the next visit to the same key, calling the
+    screen's on_show() (if it has one) so it can bring just the changed parts
+    up to date. Screens beyond max_screens are destroyed least recently used
+    first, as are hidden screens while they hold more than max_widgets widgets
+    in total or the process is above max_rss_mb (when that can be measured).
+    max_screens = 0 disables caching.
+    """
+
+    def __init__(self, max_screens=DEFAULT_MAX_SCREENS, max_widgets=DEFAULT_MAX_WIDGETS, max_rss_mb=None):
+        self.max_screens = max_screens
+        self.max_widgets = max_widgets
+        self.max_rss_mb = max_rss_mb
+        self._screens = OrderedDict()  # key -> screen, least recently used first
+        self._widget_counts = {}  # key -> widgets in the screen when it was hidden
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls):
+        max_rss_mb = os.environ.get(RSS_ENV_VAR)
+        return cls(max_screens=int(os.environ.get(SIZE_ENV_VAR, DEFAULT_MAX_SCREENS)),
+                   max_rss_mb=float(max_rss_mb) if max_rss_mb else None)
+
+    @property
+    def enabled(self):
+        return self.max_screens > 0
+
+    def __contains__(self, screen):
+        return any(cached is screen for cached in self._screens.values())
+
+    def __len__(self):
+        return len(self._screens)
+
+    def get(self, key):
+        """The cached screen for key, marked most recently used, or None."""
+        screen = self._screens.get(key)
+        if screen is not None and not screen.winfo_exists():
+            self._forget(key)
+            screen = None
+        if screen is None:
+            self.misses += 1
+            metrics.counter("swigato_screen_cache_total", "Screen cache lookups.", result="miss").inc()
+            return None
+        self._screens.move_to_end(key)
+        self.hits += 1
+        metrics.counter("swigato_screen_cache_total", "Screen cache lookups.", result="hit").inc()
+        return screen
+
+    def put(self, key, screen):
+        """Starts tracking screen under key, evicting older screens if over budget."""
+        if not self.enabled:
+            return
+        if key in self._screens and self._screens[key] is not screen:
+            self._evict(key)
+        self._screens[key] = screen
+        self._screens.move_to_end(key)
+        self._trim(keep=key)
+
+    def hide(self, screen):
+        """Hides a cached screen that is being navigated away from."""
+        key = self._key_of(screen)
+        # Results of loads still in flight would land on a hidden screen; on_show() reloads instead
+        cancel_for(screen)
+        screen.pack_forget()
+        self._widget_counts[key] = _widget_count(screen)
+        # The screen just left is the likeliest to be revisited, so it is the last to go
+        self._trim(keep=key)
+
+    def evict_where(self, predicate):
+        """Destroys the cached screens whose key matches predicate(key), e.g. on logout."""
+        for key in [key for key in self._screens if predicate(key)]:
+            self._evict(key)
+
+    def clear(self):
+        self.evict_where(lambda key: True)
+
+    def _key_of(self, screen):
+        return next(key for key, cached in self._screens.items() if cached is screen)
+
+    def _hidden_keys(self):
+        return [key for key, screen in self._screens.items() if not screen.winfo_ismapped()]
+
+    def _trim(self, keep):
+        while len(self._screens) > self.max_screens:
+            self._evict(next(key for key in self._screens if key != keep), "size")
+        while self._over_memory_budget():
+            candidates = [key for key in self._hidden_keys() if key != keep]
+            if not candidates:
+                break
+            self._evict(candidates[0], "memory")
+
+    def _over_memory_budget(self):
+        hidden_widgets = sum(self._widget_counts.get(key, 0) for key in self._hidden_keys())
+        if hidden_widgets > self.max_widgets:
+            return True
+        if self.max_rss_mb is not None:
+            rss_mb = _process_rss_mb()
+            return rss_mb is not None and rss_mb > self.max_rss_mb
+        return False
+
+    def _evict(self, key, reason=None):
+        screen = self._forget(key)
+        if screen is None:
+            return
+        if reason:
+            log(f"Screen cache: evicting {key} ({reason}).")
+            metrics.counter("swigato_screen_cache_evictions_total", "Screens dropped from the screen cache.", reason=reason).inc()
+        try:
+            cancel_for(screen)
+            screen.destroy()
+        except Exception as e:
+            log(f"Screen cache: error destroying {key}: {e}")
+
+    def _forget(self, key):
+        self._widget_counts.pop(key, None)
+        return self._screens.pop(key, None)
@@ -0,0 +1,286 @@
+import bisect
+import weakref
+import tkinter as tk
+import customtkinter as ctk
+
+from gui_Light import BACKGROUND_COLOR, GRAY_TEXT_COLOR
+
+# Lists that currently exist, used by the single application-wide mouse wheel handler
+_live_lists = weakref.WeakSet()
+_wheel_bound_roots = set()
+
+def _dispatch_mousewheel(event):
+    """Scrolls the virtual list under the pointer, if any."""
+    widget_path = str(event.widget)
+    for virtual_list in list(_live_lists):
+        canvas_path = str(virtual_list.canvas)
+        if widget_path == canvas_path or widget_path.startswith(canvas_path + "."):
+            virtual_list._on_mousewheel(event)
+            break
+
+def _ensure_wheel_binding(widget):
+    """Installs the shared mouse wheel handler once per Tk root."""
+    root = widget._root()
+    if str(root) in _wheel_bound_roots:
+        return
+    _wheel_bound_roots.add(str(root))
+    root.bind_all("<MouseWheel>", _dispatch_mousewheel, add="+")
+    root.bind_all("<Button-4>", _dispatch_mousewheel, add="+")
+    root.bind_all("<Button-5>", _dispatch_mousewheel, add="+")
+
+class VirtualCardList(ctk.CTkFrame):
+    """
+    Scrollable list of cards that only creates widgets for the rows in view.
+
+    Rows are described by three callbacks:
+        create_row(parent, kind) -> widget   builds an empty card of the given kind
+        bind_row(widget, item, index)        fills a card with the data for one item
+        kind_of(item) -> kind                optional, for lists mixing card types
+
+    Cards scrolled out of view are returned to a pool for their kind and re-bound
+    to whichever items scroll into view, so the number of widgets depends on the
+    height of the viewport rather than the number of items. Every card of a kind
+    has the same height (row_height, or row_height[kind]); the card is sized to
+    that height minus row_spacing. A card with an on_release() method has it
+    called when it goes back to the pool, e.g. to cancel work started for the
+    item it showed.
+
+    An optional footer widget (created with list.canvas as parent) is shown below
+    the last row at its natural height; an optional empty_widget is shown in place
+    of the rows when there are no items.
+    """
+
+    def __init__(self, master, create_row, bind_row, row_height, kind_of=None,
+                 row_spacing=15, row_padx=20, overscan=2, fg_color=BACKGROUND_COLOR, **kwargs):
+        super().__init__(master, fg_color=fg_color, corner_radius=0, border_width=0, **kwargs)
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.row_height = row_height
+        self.kind_of = kind_of or (lambda item: "row")
+        self.row_spacing = row_spacing
+        self.row_padx = row_padx
+        self.overscan = overscan
+
+        self.items = []
+        self._offsets = [0]    # _offsets[i] is the top of row i; the last entry is the total height
+        self._visible = {}     # index -> (kind, widget, canvas window id)
+        self._pool = {}        # kind -> [(widget, canvas window id), ...]
+        self._footer = None
+        self._footer_window = None
+        self._empty_widget = None
+        self._empty_window = None
+        self._loading = False
+        self._loading_label = None
+        self._loading_window = None
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.canvas = tk.Canvas(self, highlightthickness=0, borderwidth=0,
+                                bg=self._apply_appearance_mode(self.cget("fg_color")),
+                                yscrollincrement=self._scaled(20))
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.canvas.configure(yscrollcommand=self._on_canvas_scrolled)
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+
+        _live_lists.add(self)
+        _ensure_wheel_binding(self)
+
+    # --- Public API ---
+
+    def set_items(self, items, keep_scroll=False):
+        """Replaces the list contents. Existing cards are kept for reuse."""
+        for index in list(self._visible):
+            self._release(index)
+        self.items = list(items)
+        self._recompute_offsets()
+        self._layout_static_widgets()
+        if not keep_scroll:
+            self.canvas.yview_moveto(0)
+        self._refresh_view()
+
+    def refresh_visible(self):
+        """Re-binds the cards currently in view, e.g. after the items changed in place."""
+        for index, (kind, widget, window) in self._visible.items():
+            self.bind_row(widget, self.items[index], index)
+
+    def update_item(self, index, item):
+        """Replaces a single item, re-binding its card if it is visible."""
+        self.items[index] = item
+        if index in self._visible:
+            kind, widget, window = self._visible[index]
+            if kind == self.kind_of(item):
+                self.bind_row(widget, item, index)
+            else:
+                self._release(index)
+                self._refresh_view()
+
+    def set_footer(self, widget):
+        """Shows widget below the last row. Pass None to remove the footer."""
+        if self._footer_window is not None:
+            self.canvas.delete(self._footer_window)
+            self._footer_window = None
+        self._footer = widget
+        if widget is not None:
+            self._footer_window = self.canvas.create_window(0, 0, window=widget, anchor="nw")
+            widget.bind("<Configure>", lambda event: self._update_scrollregion(), add="+")
+        self._layout_static_widgets()
+
+    def set_empty_widget(self, widget):
+        """Sets the widget shown instead of the rows when the list is empty."""
+        if self._empty_window is not None:
+            self.canvas.delete(self._empty_window)
+            self._empty_window = None
+        self._empty_widget = widget
+        if widget is not None:
+            self._empty_window = self.canvas.create_window(0, 0, window=widget, anchor="nw", state="hidden")
+            widget.bind("<Configure>", lambda event: self._layout_static_widgets(), add="+")
+        self._layout_static_widgets()
+
+    def set_loading(self, loading, text="Loading..."):
+        """
+        Shows a loading message while the list has no items yet. When reloading a
+        list that already has items, they stay visible until set_items() replaces them.
+        """
+        self._loading = loading
+        if loading and self._loading_label is None:
+            self._loading_label = ctk.CTkLabel(self.canvas, text=text, text_color=GRAY_TEXT_COLOR,
+                                               font=ctk.CTkFont(size=16))
+            self._loading_window = self.canvas.create_window(0, 0, window=self._loading_label, anchor="nw")
+        elif self._loading_label is not None:
+            self._loading_label.configure(text=text)
+        self._layout_static_widgets()
+
+    def scroll_to_index(self, index):
+        if 0 <= index < len(self.items):
+            total = max(self._content_height(), 1)
+            self.canvas.yview_moveto(self._offsets[index] / total)
+
+    def widget_count(self):
+        """Number of cards that currently exist (visible plus pooled)."""
+        return len(self._visible) + sum(len(pool) for pool in self._pool.values())
+
+    def destroy(self):
+        _live_lists.discard(self)
+        super().destroy()
+
+    # --- Layout ---
+
+    def _scaled(self, value):
+        return int(self._apply_widget_scaling(value))
+
+    def _slot_height(self, kind):
+        height = self.row_height[kind] if isinstance(self.row_height, dict) else self.row_height
+        return self._scaled(height + self.row_spacing)
+
+    def _recompute_offsets(self):
+        offsets = [0]
+        for item in self.items:
+            offsets.append(offsets[-1] + self._slot_height(self.kind_of(item)))
+        self._offsets = offsets
+
+    def _rows_height(self):
+        if not self.items and self._empty_widget is not None:
+            return self._empty_widget.winfo_reqheight() + self._scaled(self.row_spacing)
+        return self._offsets[-1]
+
+    def _content_height(self):
+        height = self._rows_height()
+        if self._footer is not None:
+            height += self._footer.winfo_reqheight()
+        return height
+
+    def _row_width(self):
+        return max(self.canvas.winfo_width() - 2 * self._scaled(self.row_padx), 1)
+
+    def _layout_static_widgets(self):
+        """Positions the empty-state and footer widgets around the rows."""
+        padx = self._scaled(self.row_padx)
+        if self._loading_window is not None:
+            state = "normal" if self._loading and not self.items else "hidden"
+            self.canvas.coords(self._loading_window, padx, self._scaled(self.row_spacing))
+            self.canvas.itemconfigure(self._loading_window, width=self._row_width(), state=state)
+        if self._empty_window is not None:
+            state = "normal" if not self.items and not self._loading else "hidden"
+            self.canvas.coords(self._empty_window, padx, 0)
+            self.canvas.itemconfigure(self._empty_window, width=self._row_width(), state=state)
+        if self._footer_window is not None:
+            self.canvas.coords(self._footer_window, padx, self._rows_height())
+            self.canvas.itemconfigure(self._footer_window, width=self._row_width())
+        self._update_scrollregion()
+
+    def _update_scrollregion(self):
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), self._content_height()))
+
+    def _visible_range(self):
+        if not self.items:
+            return range(0)
+        top = self.canvas.canvasy(0)
+        bottom = top + self.canvas.winfo_height()
+        first = max(bisect.bisect_right(self._offsets, top) - 1 - self.overscan, 0)
+        last = min(bisect.bisect_left(self._offsets, bottom) + self.overscan, len(self.items))
+        return range(first, last)
+
+    def _refresh_view(self):
+        """Binds cards to the rows in (or near) the viewport and pools the rest."""
+        wanted = self._visible_range()
+        for index in list(self._visible):
+            if index not in wanted:
+                self._release(index)
+        width = self._row_width()
+        padx = self._scaled(self.row_padx)
+        for index in wanted:
+            if index in self._visible:
+                continue
+            item = self.items[index]
+            kind = self.kind_of(item)
+            widget, window = self._acquire(kind)
+            height = self._slot_height(kind) - self._scaled(self.row_spacing)
+            self.canvas.coords(window, padx, self._offsets[index])
+            self.canvas.itemconfigure(window, width=width, height=height, state="normal")
+            self.bind_row(widget, item, index)
+            self._visible[index] = (kind, widget, window)
+
+    def _acquire(self, kind):
+        pool = self._pool.setdefault(kind, [])
+        if pool:
+            return pool.pop()
+        widget = self.create_row(self.canvas, kind)
+        window = self.canvas.create_window(0, 0, window=widget, anchor="nw", state="hidden")
+        return widget, window
+
+    def _release(self, index):
+        kind, widget, window = self._visible.pop(index)
+        self.canvas.itemconfigure(window, state="hidden")
+        on_release = getattr(widget, "on_release", None)
+        if on_release is not None:
+            on_release()
+        self._pool.setdefault(kind, []).append((widget, window))
+
+    # --- Events ---
+
+    def _on_canvas_scrolled(self, first, last):
+        self.scrollbar.set(first, last)
+        self._refresh_view()
+
+    def _on_canvas_configure(self, event):
+        width = self._row_width()
+        for kind, widget, window in self._visible.values():
+            self.canvas.itemconfigure(window, width=width)
+        self._layout_static_widgets()
+        self._refresh_view()
+
+    def _on_mousewheel(self, event):
+        if self.canvas.yview() == (0.0, 1.0):
+            return  # Everything fits, nothing to scroll
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        elif abs(event.delta) >= 120:
+            step = -int(event.delta / 120) * 3  # Windows reports multiples of 120
+        else:
+            step = -event.delta  # macOS reports small deltas
+        self.canvas.yview_scroll(step, "units")
@@ -2,6 +2,7 @@ from rich.console import Console
 from rich.table import Table
 from utils.logger import log
 from utils.database import initialize_database  # Import for database initialization
+from utils import metrics
 from users.auth import sign_up, log_in, log_out, get_current_user
 from users.models import User  # To get user address
 from restaurants.models import Restaurant, populate_sample_restaurant_data  # Import Restaurant for type hinting and populate_sample_restaurant_data
@@ -506,4 +507,5 @@ def run_app():
     console.print("[bold blue]Thank you for using Swigato![/bold blue]")
 
 if __name__ == "__main__":
+    metrics.start_exporters_from_env()
     run_app()
@@ -1,6 +1,9 @@
 import datetime
 from utils.logger import log
-from utils.database import get_db_connection
+from utils.database import get_read_connection, get_write_connection, id_chunks
+from utils import metrics
+from utils.write_queue import write_queue
+import time
 import sqlite3
 
 class OrderItem:
@@ -71,7 +74,7 @@ class Order:
     @staticmethod
     def get_all_orders():
         """Retrieves all orders from the database, ordered by date descending."""
-        conn = get_db_connection()
+        conn = get_read_connection()
         cursor = conn.cursor()
         orders = []
         try:
@@ -108,13 +111,10 @@ class Order:
 
     @staticmethod
     def update_status(order_id, new_status):
-        """Updates the status of an order in the database."""
-        conn = get_db_connection()
+        """Updates the status of an order in the database (through the write queue)."""
         try:
-            cursor = conn.cursor()
-            cursor.execute("UPDATE orders SET status = ? WHERE order_id = ?", (new_status, order_id))
-            conn.commit()
-            if cursor.rowcount > 0:
+            updated = write_queue.run(_update_status, order_id, new_status)
+            if updated:
                 log(f"Order {order_id} status updated to {new_status}.")
                 return True
             else:
@@ -123,47 +123,87 @@ class Order:
         except Exception as e:
             log(f"Error updating order status for order {order_id}: {e}")
             return False
+
+    @staticmethod
+    def update_status_many(order_ids, new_status):
+        """
+        Sets the status of several orders in a single transaction.
+
+        Returns {order_id: True/False}, False for orders that do not exist. If
+        the transaction fails nothing is changed and every order maps to False.
+        """
+        order_ids = list(dict.fromkeys(order_ids))
+        results = dict.fromkeys(order_ids, False)
+        if not order_ids:
+            return results
+        conn = get_write_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")  # Take the write lock first so the existence check stays true
+            for chunk in id_chunks(order_ids):
+                placeholders = ','.join('?' for _ in chunk)
+                cursor.execute(f"SELECT order_id FROM orders WHERE order_id IN ({placeholders})", chunk)
+                for row in cursor.fetchall():
+                    results[row['order_id']] = True
+                cursor.execute(f"UPDATE orders SET status = ? WHERE order_id IN ({placeholders})", [new_status] + chunk)
+            conn.commit()
+            updated = sum(results.values())
+            log(f"{updated} of {len(order_ids)} order(s) updated to {new_status} in one transaction.")
+            return results
+        except Exception as e:
+            conn.rollback()
+            log(f"Error updating status of {len(order_ids)} order(s) to {new_status}: {e}")
+            return dict.fromkeys(order_ids, False)
         finally:
             conn.close()
 
-def create_order(user_id, restaurant_id, restaurant_name, cart_items, total_amount, user_address=None):
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    try:
-        current_time = datetime.datetime.now()
-        cursor.execute("""
-            INSERT INTO orders (user_id, restaurant_id, restaurant_name, total_amount, delivery_address, order_date, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (user_id, restaurant_id, restaurant_name, total_amount, user_address, current_time, "Pending Confirmation"))
-        
-        order_id = cursor.lastrowid
-        if not order_id:
-            raise Exception("Failed to create order, no order_id returned.")
+def _update_status(cursor, order_id, new_status):
+    """Write-queue job for Order.update_status; returns whether the order exists."""
+    cursor.execute("UPDATE orders SET status = ? WHERE order_id = ?", (new_status, order_id))
+    return cursor.rowcount > 0
 
-        log(f"Order {order_id} created in DB. Adding items...")
+def _insert_order(cursor, user_id, restaurant_id, restaurant_name, cart_items, total_amount, user_address, current_time):
+    """Write-queue job for create_order; returns (order_id, list of OrderItem)."""
+    cursor.execute("""
+        INSERT INTO orders (user_id, restaurant_id, restaurant_name, total_amount, delivery_address, order_date, status)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, (user_id, restaurant_id, restaurant_name, total_amount, user_address, current_time, "Pending Confirmation"))
 
-        created_order_items = []
-        # cart_items is now expected to be a list of CartItem objects
-        for cart_item_obj in cart_items: 
-            cursor.execute("""
-                INSERT INTO order_items (order_id, item_id, name, price, quantity)
-                VALUES (?, ?, ?, ?, ?)
-            """, (order_id, cart_item_obj.menu_item.item_id, cart_item_obj.menu_item.name, 
-                  cart_item_obj.menu_item.price, cart_item_obj.quantity))
-            order_item_id = cursor.lastrowid
-            created_order_items.append(
-                OrderItem(
-                    order_item_id=order_item_id,
-                    order_id=order_id,
-                    item_id=cart_item_obj.menu_item.item_id,
-                    name=cart_item_obj.menu_item.name,
-                    price=cart_item_obj.menu_item.price,
-                    quantity=cart_item_obj.quantity
-                )
+    order_id = cursor.lastrowid
+    if not order_id:
+        raise Exception("Failed to create order, no order_id returned.")
+
+    created_order_items = []
+    # cart_items is now expected to be a list of CartItem objects
+    for cart_item_obj in cart_items: 
+        cursor.execute("""
+            INSERT INTO order_items (order_id, item_id, name, price, quantity)
+            VALUES (?, ?, ?, ?, ?)
+        """, (order_id, cart_item_obj.menu_item.item_id, cart_item_obj.menu_item.name, 
+              cart_item_obj.menu_item.price, cart_item_obj.quantity))
+        order_item_id = cursor.lastrowid
+        created_order_items.append(
+            OrderItem(
+                order_item_id=order_item_id,
+                order_id=order_id,
+                item_id=cart_item_obj.menu_item.item_id,
+                name=cart_item_obj.menu_item.name,
+                price=cart_item_obj.menu_item.price,
+                quantity=cart_item_obj.quantity
             )
-        
-        conn.commit()
+        )
+    return order_id, created_order_items
+
+def create_order(user_id, restaurant_id, restaurant_name, cart_items, total_amount, user_address=None):
+    start = time.perf_counter()
+    try:
+        current_time = datetime.datetime.now()
+        # Committed by the write queue, possibly together with other pending writes
+        order_id, created_order_items = write_queue.run(_insert_order, user_id, restaurant_id, restaurant_name,
+                                                        list(cart_items), total_amount, user_address, current_time)
         log(f"Order {order_id} and its {len(created_order_items)} item(s) committed to database.")
+        metrics.histogram("swigato_order_create_seconds", "Time to write an order and its items.").observe(time.perf_counter() - start)
+        metrics.counter("swigato_orders_created_total", "create_order() calls, by result.", result="success").inc()
         
         return Order(
             order_id=order_id,
@@ -179,13 +219,11 @@ def create_order(user_id, restaurant_id, restaurant_name, cart_items, total_amou
 
     except Exception as e:
         log(f"Error creating order and saving to DB: {e}")
-        conn.rollback()
+        metrics.counter("swigato_orders_created_total", "create_order() calls, by result.", result="failure").inc()
         return None
-    finally:
-        conn.close()
 
 def get_order_items_for_order(order_id):
-    conn = get_db_connection()
+    conn = get_read_connection()
     cursor = conn.cursor()
     items = []
     try:
@@ -201,7 +239,7 @@ def get_order_items_for_order(order_id):
         conn.close()
 
 def get_orders_by_user_id(user_id):
-    conn = get_db_connection()
+    conn = get_read_connection()
     cursor = conn.cursor()
     orders = []
     try:
@@ -220,7 +258,7 @@ def get_orders_by_user_id(user_id):
         conn.close()
 
 def get_order_by_id(order_id):
-    conn = get_db_connection()
+    conn = get_read_connection()
     cursor = conn.cursor()
     try:
         cursor.execute("SELECT * FROM orders WHERE order_id = ?", (order_id,))
@@ -3,13 +3,176 @@ import os
 from PIL import Image
 from gui_Light import BACKGROUND_COLOR, TEXT_COLOR, PRIMARY_COLOR, BUTTON_HOVER_COLOR, FRAME_BORDER_COLOR, FRAME_FG_COLOR, SECONDARY_COLOR, SUCCESS_COLOR, ERROR_COLOR, GRAY_TEXT_COLOR, MODERN_BORDER, HOVER_BG_COLOR
 from restaurants.models import MenuItem
-from utils.image_loader import load_image
+from utils.image_loader import load_image_cached
 from utils.logger import log
-from reviews.models import get_reviews_for_restaurant, add_review
-from users.models import User
+from utils.tasks import load_async
+from utils.prefetch import menu_prefetcher
+from utils.scheduler import scheduler
+from reviews.models import get_review_feed, add_review
 from tkinter import messagebox
+from gui_components.virtual_list import VirtualCardList
+
+class CategoryHeaderRow(ctk.CTkFrame):
+    """Category heading row of the virtual menu list."""
+    HEIGHT = 60
+
+    def __init__(self, parent):
+        super().__init__(parent, fg_color=BACKGROUND_COLOR)
+        self.category_label = ctk.CTkLabel(
+            self,
+            text="",
+            font=ctk.CTkFont(size=22, weight="bold"),
+            text_color=TEXT_COLOR
+        )
+        self.category_label.pack(anchor="w", pady=(15, 0))
+        # Category underline
+        underline = ctk.CTkFrame(
+            self,
+            fg_color=PRIMARY_COLOR,
+            height=3,
+            corner_radius=2
+        )
+        underline.pack(anchor="w", fill="x", pady=(5, 0))
+
+    def set_category(self, category):
+        self.category_label.configure(text=category)
+
+class MenuItemCard(ctk.CTkFrame):
+    """Food item card of the virtual menu list; set_item() re-binds it to another menu item."""
+    HEIGHT = 170
+    DESCRIPTION_LIMIT = 100  # Cards have a fixed height, so long descriptions are cut to about two lines
+
+    def __init__(self, parent, project_root, on_toggle_favorite, on_add_to_cart):
+        # Modern food item card
+        super().__init__(
+            parent,
+            fg_color=FRAME_FG_COLOR,
+            corner_radius=20,
+            border_width=1,
+            border_color=MODERN_BORDER
+        )
+        self.project_root = project_root
+        self.item = None
+        self.grid_columnconfigure(1, weight=1)
+
+        # Food image, with a modern fallback when the item has none
+        self.image_label = ctk.CTkLabel(self, text="", corner_radius=16)
+        self.fallback_label = ctk.CTkLabel(
+            self,
+            text="🍽️",
+            width=120,
+            height=120,
+            fg_color=HOVER_BG_COLOR,
+            text_color=GRAY_TEXT_COLOR,
+            font=ctk.CTkFont(size=40),
+            corner_radius=16
+        )
+
+        # Item details section
+        details_frame = ctk.CTkFrame(self, fg_color="transparent")
+        details_frame.grid(row=0, column=1, padx=(0, 20), pady=20, sticky="nsew")
+        details_frame.grid_columnconfigure(0, weight=1)
+
+        self.name_label = ctk.CTkLabel(
+            details_frame,
+            text="",
+            font=ctk.CTkFont(size=18, weight="bold"),
+            text_color=TEXT_COLOR,
+            anchor="w"
+        )
+        self.name_label.grid(row=0, column=0, sticky="ew", pady=(0, 5))
+
+        self.description_label = ctk.CTkLabel(
+            details_frame,
+            text="",
+            font=ctk.CTkFont(size=14),
+            text_color=GRAY_TEXT_COLOR,
+            wraplength=350,
+            justify="left",
+            anchor="w"
+        )
+        self.description_label.grid(row=1, column=0, sticky="ew", pady=(0, 10))
+
+        # Price and actions row
+        bottom_frame = ctk.CTkFrame(details_frame, fg_color="transparent")
+        bottom_frame.grid(row=2, column=0, sticky="ew")
+        bottom_frame.grid_columnconfigure(0, weight=1)
+
+        self.price_label = ctk.CTkLabel(
+            bottom_frame,
+            text="",
+            font=ctk.CTkFont(size=20, weight="bold"),
+            text_color=PRIMARY_COLOR,
+            anchor="w"
+        )
+        self.price_label.grid(row=0, column=0, sticky="w")
+
+        # Action buttons container
+        actions_frame = ctk.CTkFrame(bottom_frame, fg_color="transparent")
+        actions_frame.grid(row=0, column=1, sticky="e")
+
+        # Heart/Favorite button
+        self.heart_button = ctk.CTkButton(
+            actions_frame,
+            text="♡",
+            width=45,
+            height=45,
+            fg_color="transparent",
+            hover_color=HOVER_BG_COLOR,
+            font=ctk.CTkFont(size=20, weight="bold"),
+            text_color=GRAY_TEXT_COLOR,
+            corner_radius=12,
+            command=lambda: self.item and on_toggle_favorite(self.item, self.heart_button)
+        )
+        self.heart_button.pack(side="left", padx=(0, 10))
+
+        # Modern Add to Cart button
+        add_to_cart_button = ctk.CTkButton(
+            actions_frame,
+            text="+ Add to Cart",
+            fg_color=PRIMARY_COLOR,
+            hover_color=BUTTON_HOVER_COLOR,
+            text_color="white",
+            font=ctk.CTkFont(size=14, weight="bold"),
+            height=45,
+            corner_radius=16,
+            command=lambda: self.item and on_add_to_cart(self.item)
+        )
+        add_to_cart_button.pack(side="left")
+
+    def set_item(self, item, is_favorite):
+        self.item = item
+
+        ctk_image = None
+        if item.image_filename:
+            image_path = os.path.join(self.project_root, "assets", "menu_items", item.image_filename)
+            ctk_image = load_image_cached(image_path, size=(120, 120))
+        if ctk_image:
+            self.fallback_label.grid_remove()
+            self.image_label.configure(image=ctk_image)
+            self.image_label.grid(row=0, column=0, padx=20, pady=20, sticky="ns")
+        else:
+            self.image_label.grid_remove()
+            self.fallback_label.grid(row=0, column=0, padx=20, pady=20, sticky="ns")
+
+        description = item.description or ""
+        if len(description) > self.DESCRIPTION_LIMIT:
+            description = description[:self.DESCRIPTION_LIMIT - 1].rstrip() + "…"
+        self.name_label.configure(text=item.name)
+        self.description_label.configure(text=description)
+        self.price_label.configure(text=f"₹{item.price:.2f}")
+        self.set_favorite(is_favorite)
+
+    def set_favorite(self, is_favorite):
+        # Use unicode hearts that can change color
+        self.heart_button.configure(text="♥" if is_favorite else "♡",
+                                    text_color="#E53935" if is_favorite else GRAY_TEXT_COLOR)
 
 class MenuScreen(ctk.CTkFrame):
+    REVIEWS_PAGE_SIZE = 10
+    # Labels shown in the review sort menu -> sort names understood by get_review_feed
+    REVIEW_SORT_OPTIONS = {"Newest": "newest", "Highest rated": "highest", "Lowest rated": "lowest"}
+
     def __init__(self, app_ref, user, restaurant):
         super().__init__(app_ref, fg_color=BACKGROUND_COLOR)
         self.app_ref = app_ref
@@ -30,19 +193,33 @@ class MenuScreen(ctk.CTkFrame):
         self.placeholder_text = "Share your thoughts..."
         self.is_placeholder_active = True
         self.write_review_button_widget = None
-        self.inline_review_form_actual_frame = None        # --- Modern Header Frame with Enhanced Styling ---
+        self.inline_review_form_actual_frame = None
+        # Review feed paging state; the cursor points past the last review shown
+        self.review_sort = "newest"
+        self.review_cursor = None
+        self.load_more_reviews_button = None
+        # Menu and first review page loaded ahead of time by the restaurant list, if any
+        prefetched = menu_prefetcher.take(restaurant.restaurant_id) if restaurant else None
+        self._prefetched_menu = prefetched.menu_items if prefetched else None
+        self._prefetched_review_page = prefetched.review_page if prefetched else None
+        # --- Modern Header Frame with Enhanced Styling ---
         self._create_modern_header()
         
-        # --- Main Scrollable Frame ---
-        self.main_scroll_frame = ctk.CTkScrollableFrame(
-            self, 
-            fg_color=BACKGROUND_COLOR, 
-            border_width=0,
-            corner_radius=0
+        # --- Main Scrollable List ---
+        # Category headers and item cards are virtualized; the review section is the list footer.
+        self.menu_list = VirtualCardList(
+            self,
+            create_row=self._create_menu_row,
+            bind_row=self._bind_menu_row,
+            row_height={"category": CategoryHeaderRow.HEIGHT, "item": MenuItemCard.HEIGHT},
+            kind_of=lambda entry: entry[0],
+            row_padx=5
         )
-        self.main_scroll_frame.grid(row=1, column=0, padx=20, pady=(10, 20), sticky="nsew")
-        self.main_scroll_frame.grid_columnconfigure(0, weight=1)
-        
+        self.menu_list.grid(row=1, column=0, padx=20, pady=(10, 20), sticky="nsew")
+        self.review_footer_frame = ctk.CTkFrame(self.menu_list.canvas, fg_color=BACKGROUND_COLOR)
+        self.review_footer_frame.grid_columnconfigure(0, weight=1)
+        self.menu_list.set_footer(self.review_footer_frame)
+
         self._populate_main_scroll_content()
 
         # --- Modern Status Label ---
@@ -56,6 +233,13 @@ class MenuScreen(ctk.CTkFrame):
           # --- Bottom Navigation Bar ---
         self.create_bottom_nav_bar()
 
+    def on_show(self):
+        """Called when the screen is shown again from the screen cache."""
+        # The cart and favorites may have changed on other screens; the menu itself is unchanged
+        self.update_cart_count_in_nav()
+        self.menu_list.refresh_visible()
+        self.status_label.configure(text="")
+
     def _create_modern_header(self):
         """Create a modern, elegant header with better visual hierarchy"""
         header_frame = ctk.CTkFrame(
@@ -93,7 +277,7 @@ class MenuScreen(ctk.CTkFrame):
         view_cart_button.grid(row=0, column=1, padx=20, pady=15, sticky="e")
 
     def _clear_main_scroll_content(self):
-        for widget in self.main_scroll_frame.winfo_children():
+        for widget in self.review_footer_frame.winfo_children():
             widget.destroy()
         self.write_review_button_widget = None
         self.inline_review_form_actual_frame = None
@@ -102,58 +286,33 @@ class MenuScreen(ctk.CTkFrame):
 
     def _populate_main_scroll_content(self):
         log("MenuScreen._populate_main_scroll_content called")
+        self._populate_menu_items()
+        self._populate_review_footer()
+
+    def _populate_review_footer(self):
+        """Rebuilds the review section below the menu without touching the menu cards."""
         self._clear_main_scroll_content()
-        
         current_row = 0
-        current_row = self._populate_menu_items_to_scroll_frame(self.main_scroll_frame, current_row)
-        current_row = self._build_review_section_with_form_container(self.main_scroll_frame, current_row)
-        current_row = self._populate_reviews_to_scroll_frame(self.main_scroll_frame, current_row)
+        current_row = self._build_review_section_with_form_container(self.review_footer_frame, current_row)
+        current_row = self._populate_reviews_to_scroll_frame(self.review_footer_frame, current_row)
 
-    def _populate_menu_items_to_scroll_frame(self, parent_frame, start_row):
-        """Create modern, beautiful food item cards with enhanced styling"""
-        current_row = start_row
-        log(f"_populate_menu_items_to_scroll_frame for restaurant: {self.restaurant.name if self.restaurant else 'None'}")
+    def _populate_menu_items(self):
+        """Fills the virtual menu list with category headers followed by their items."""
+        log(f"_populate_menu_items for restaurant: {self.restaurant.name if self.restaurant else 'None'}")
 
         if not self.restaurant:
-            # Modern empty state
-            empty_frame = ctk.CTkFrame(
-                parent_frame,
-                fg_color=FRAME_FG_COLOR,
-                corner_radius=20,
-                border_width=1,
-                border_color=MODERN_BORDER
-            )
-            empty_frame.grid(row=current_row, column=0, pady=20, sticky="ew")
-            
-            no_restaurant_label = ctk.CTkLabel(
-                empty_frame,
-                text="🍽️ No restaurant selected",
-                text_color=GRAY_TEXT_COLOR,
-                font=ctk.CTkFont(size=18, weight="bold")
-            )
-            no_restaurant_label.pack(pady=40)
-            return current_row + 1
+            self.menu_list.set_empty_widget(self._create_menu_empty_state("🍽️ No restaurant selected"))
+            self.menu_list.set_items([])
+            return
 
-        menu_items = self.restaurant.menu
+        if self._prefetched_menu is not None:
+            menu_items, self._prefetched_menu = self._prefetched_menu, None
+        else:
+            menu_items = self.restaurant.menu
         if not menu_items:
-            # Modern empty menu state
-            empty_frame = ctk.CTkFrame(
-                parent_frame,
-                fg_color=FRAME_FG_COLOR,
-                corner_radius=20,
-                border_width=1,
-                border_color=MODERN_BORDER
-            )
-            empty_frame.grid(row=current_row, column=0, pady=20, sticky="ew")
-            
-            no_items_label = ctk.CTkLabel(
-                empty_frame,
-                text="📋 Menu coming soon!",
-                text_color=GRAY_TEXT_COLOR,
-                font=ctk.CTkFont(size=18, weight="bold")
-            )
-            no_items_label.pack(pady=40)
-            return current_row + 1
+            self.menu_list.set_empty_widget(self._create_menu_empty_state("📋 Menu coming soon!"))
+            self.menu_list.set_items([])
+            return
 
         # Categorize menu items
         categorized_menu = {}
@@ -162,161 +321,55 @@ class MenuScreen(ctk.CTkFrame):
                 categorized_menu[item.category] = []
             categorized_menu[item.category].append(item)
 
-        # Display each category with modern styling
+        entries = []
         for category, items_in_category in categorized_menu.items():
-            # Modern category header
-            category_container = ctk.CTkFrame(parent_frame, fg_color="transparent")
-            category_container.grid(row=current_row, column=0, pady=(30, 15), sticky="ew")
-            
-            category_label = ctk.CTkLabel(
-                category_container,
-                text=category,
-                font=ctk.CTkFont(size=22, weight="bold"),
-                text_color=TEXT_COLOR
-            )
-            category_label.pack(anchor="w")
-              # Category underline
-            underline = ctk.CTkFrame(
-                category_container,
-                fg_color=PRIMARY_COLOR,
-                height=3,
-                corner_radius=2
-            )
-            underline.pack(anchor="w", fill="x", pady=(5, 0))
-            
-            current_row += 1
-
-            # Display items in this category
-            for item in items_in_category:
-                # Modern food item card
-                item_card = ctk.CTkFrame(
-                    parent_frame,
-                    fg_color=FRAME_FG_COLOR,
-                    corner_radius=20,
-                    border_width=1,
-                    border_color=MODERN_BORDER
-                )
-                item_card.grid(row=current_row, column=0, pady=(0, 15), sticky="ew")
-                item_card.grid_columnconfigure(1, weight=1)
-
-                # Food image
-                self._create_food_image(item_card, item)
-
-                # Item details section
-                details_frame = ctk.CTkFrame(item_card, fg_color="transparent")
-                details_frame.grid(row=0, column=1, padx=(0, 20), pady=20, sticky="nsew")
-                details_frame.grid_columnconfigure(0, weight=1)
-
-                # Item name
-                item_name_label = ctk.CTkLabel(
-                    details_frame,
-                    text=item.name,
-                    font=ctk.CTkFont(size=18, weight="bold"),
-                    text_color=TEXT_COLOR,
-                    anchor="w"
-                )
-                item_name_label.grid(row=0, column=0, sticky="ew", pady=(0, 5))
-
-                # Item description
-                item_desc_label = ctk.CTkLabel(
-                    details_frame,
-                    text=item.description,
-                    font=ctk.CTkFont(size=14),
-                    text_color=GRAY_TEXT_COLOR,
-                    wraplength=350,
-                    justify="left",
-                    anchor="w"
-                )
-                item_desc_label.grid(row=1, column=0, sticky="ew", pady=(0, 10))
-
-                # Price and actions row
-                bottom_frame = ctk.CTkFrame(details_frame, fg_color="transparent")
-                bottom_frame.grid(row=2, column=0, sticky="ew")
-                bottom_frame.grid_columnconfigure(0, weight=1)                # Price
-                price_label = ctk.CTkLabel(
-                    bottom_frame,
-                    text=f"₹{item.price:.2f}",
-                    font=ctk.CTkFont(size=20, weight="bold"),
-                    text_color=PRIMARY_COLOR,
-                    anchor="w"
-                )
-                price_label.grid(row=0, column=0, sticky="w")
-
-                # Action buttons container
-                actions_frame = ctk.CTkFrame(bottom_frame, fg_color="transparent")
-                actions_frame.grid(row=0, column=1, sticky="e")                # Heart/Favorite button
-                is_fav = self.user.is_favorite_menu_item(item.item_id)
-                heart_text = "♥" if is_fav else "♡"  # Use unicode hearts that can change color
-                heart_color = "#E53935" if is_fav else GRAY_TEXT_COLOR
-                heart_button = ctk.CTkButton(
-                    actions_frame,
-                    text=heart_text,
-                    width=45,
-                    height=45,
-                    fg_color="transparent",
-                    hover_color=HOVER_BG_COLOR,
-                    font=ctk.CTkFont(size=20, weight="bold"),
-                    text_color=heart_color,
-                    corner_radius=12,
-                    command=lambda i=item, b=None: self._toggle_favorite_menu_item(i, b)
-                )
-                heart_button.pack(side="left", padx=(0, 10))
-                heart_button.configure(command=lambda i=item, b=heart_button: self._toggle_favorite_menu_item(i, b))                # Modern Add to Cart button
-                add_to_cart_button = ctk.CTkButton(
-                    actions_frame,
-                    text="+ Add to Cart",
-                    fg_color=PRIMARY_COLOR,
-                    hover_color=BUTTON_HOVER_COLOR,
-                    text_color="white",
-                    font=ctk.CTkFont(size=14, weight="bold"),
-                    height=45,
-                    corner_radius=16,
-                    command=lambda i=item: self._add_to_cart(i)
-                )
-                add_to_cart_button.pack(side="left")
-
-                current_row += 1
-        return current_row
-
-    def _create_food_image(self, parent_frame, item):
-        """Create a modern food image with rounded corners and fallback"""
-        if item.image_filename:
-            project_root = self.app_ref.project_root
-            image_path = os.path.join(project_root, "assets", "menu_items", item.image_filename)
-            ctk_image = load_image(image_path, size=(120, 120))
-            if ctk_image:
-                image_label = ctk.CTkLabel(
-                    parent_frame,
-                    image=ctk_image,
-                    text="",
-                    corner_radius=16
-                )
-                image_label.grid(row=0, column=0, padx=20, pady=20, sticky="ns")
-                return
-
-        # Modern fallback image
-        fallback_label = ctk.CTkLabel(
-            parent_frame,
-            text="🍽️",
-            width=120,
-            height=120,
-            fg_color=HOVER_BG_COLOR,
+            entries.append(("category", category))
+            entries.extend(("item", item) for item in items_in_category)
+        self.menu_list.set_items(entries)
+
+    def _create_menu_empty_state(self, text):
+        # Modern empty state
+        empty_frame = ctk.CTkFrame(
+            self.menu_list.canvas,
+            fg_color=FRAME_FG_COLOR,
+            corner_radius=20,
+            border_width=1,
+            border_color=MODERN_BORDER
+        )
+        no_items_label = ctk.CTkLabel(
+            empty_frame,
+            text=text,
             text_color=GRAY_TEXT_COLOR,
-            font=ctk.CTkFont(size=40),
-            corner_radius=16
+            font=ctk.CTkFont(size=18, weight="bold")
         )
-        fallback_label.grid(row=0, column=0, padx=20, pady=20, sticky="ns")
+        no_items_label.pack(pady=40)
+        return empty_frame
+
+    def _create_menu_row(self, parent, kind):
+        if kind == "category":
+            return CategoryHeaderRow(parent)
+        return MenuItemCard(parent, self.app_ref.project_root,
+                            on_toggle_favorite=self._toggle_favorite_menu_item,
+                            on_add_to_cart=self._add_to_cart)
+
+    def _bind_menu_row(self, row, entry, index):
+        kind, value = entry
+        if kind == "category":
+            row.set_category(value)
+        else:
+            row.set_item(value, self.user.is_favorite_menu_item(value.item_id))
 
     def _toggle_favorite_menu_item(self, menu_item, button):
         """Toggle favorite status with proper color changes"""
+        # Favorite state comes from the user's in-memory favorites set; only the write hits the database
         is_fav = self.user.is_favorite_menu_item(menu_item.item_id)
         if is_fav:
-            self.user.remove_favorite_menu_item(menu_item.item_id)
+            changed = self.user.remove_favorite_menu_item(menu_item.item_id)
         else:
-            self.user.add_favorite_menu_item(menu_item.item_id)
+            changed = self.user.add_favorite_menu_item(menu_item.item_id)
         
         # Update button appearance with proper unicode hearts and colors
-        new_is_fav = self.user.is_favorite_menu_item(menu_item.item_id)
+        new_is_fav = (not is_fav) if changed else is_fav
         new_text = "♥" if new_is_fav else "♡"  # Filled vs empty heart
         new_color = "#E53935" if new_is_fav else GRAY_TEXT_COLOR  # Red vs gray
         
@@ -325,7 +378,7 @@ class MenuScreen(ctk.CTkFrame):
         # Show feedback message
         status_msg = f"{'Added to' if new_is_fav else 'Removed from'} favorites ✨"
         self.status_label.configure(text=status_msg, text_color=SUCCESS_COLOR)
-        self.after(2000, lambda: self.status_label.configure(text=""))
+        scheduler.call_later(self.status_label, 2000, lambda: self.status_label.configure(text=""))
 
     def _build_review_section_with_form_container(self, parent_frame, start_row):
         """Create modern review section with enhanced styling"""
@@ -356,7 +409,26 @@ class MenuScreen(ctk.CTkFrame):
             font=ctk.CTkFont(size=22, weight="bold"),
             text_color=TEXT_COLOR
         )
-        reviews_title_label.grid(row=0, column=0, sticky="w")        # Modern write review button
+        reviews_title_label.grid(row=0, column=0, sticky="w")
+
+        sort_labels = list(self.REVIEW_SORT_OPTIONS)
+        current_sort_label = next(label for label, sort in self.REVIEW_SORT_OPTIONS.items() if sort == self.review_sort)
+        self.review_sort_menu = ctk.CTkOptionMenu(
+            review_header_frame,
+            values=sort_labels,
+            command=self._on_review_sort_changed,
+            fg_color=FRAME_FG_COLOR,
+            button_color=PRIMARY_COLOR,
+            button_hover_color=BUTTON_HOVER_COLOR,
+            text_color=TEXT_COLOR,
+            width=140,
+            height=40,
+            corner_radius=16
+        )
+        self.review_sort_menu.set(current_sort_label)
+        self.review_sort_menu.grid(row=0, column=1, padx=(0, 10), sticky="e")
+
+        # Modern write review button
         button_text = "✖️ Cancel" if self.is_review_form_visible else "✍️ Write Review"
         button_color = ERROR_COLOR if self.is_review_form_visible else PRIMARY_COLOR
         button_hover = "#DC2626" if self.is_review_form_visible else BUTTON_HOVER_COLOR
@@ -372,7 +444,7 @@ class MenuScreen(ctk.CTkFrame):
             height=40,
             corner_radius=16
         )
-        self.write_review_button_widget.grid(row=0, column=1, sticky="e")
+        self.write_review_button_widget.grid(row=0, column=2, sticky="e")
         current_row += 1
 
         # Modern review form container
@@ -542,7 +614,7 @@ class MenuScreen(ctk.CTkFrame):
         
         if rating == 0:
             self.status_label.configure(text="Please select a rating (1-5 stars).", text_color=ERROR_COLOR)
-            self.after(3000, lambda: self.status_label.configure(text=""))
+            scheduler.call_later(self.status_label, 3000, lambda: self.status_label.configure(text=""))
             return
             
         if not self.user:
@@ -553,7 +625,7 @@ class MenuScreen(ctk.CTkFrame):
         if not self.restaurant:
             log("Error: Restaurant context lost for review submission.")
             self.status_label.configure(text="Error: Restaurant context lost. Cannot submit.", text_color=ERROR_COLOR)
-            self.after(3000, lambda: self.status_label.configure(text=""))
+            scheduler.call_later(self.status_label, 3000, lambda: self.status_label.configure(text=""))
             return
 
         try:
@@ -581,7 +653,7 @@ class MenuScreen(ctk.CTkFrame):
             log(f"Error: Exception submitting review: {e}")
             self.status_label.configure(text="An error occurred while submitting your review.", text_color=ERROR_COLOR)
         
-        self.after(4000, lambda: self.status_label.configure(text=""))
+        scheduler.call_later(self.status_label, 4000, lambda: self.status_label.configure(text=""))
 
     def _on_textbox_focus_in(self, event):
         """Handle focus in event - clear placeholder text"""
@@ -610,6 +682,8 @@ class MenuScreen(ctk.CTkFrame):
     def _populate_reviews_to_scroll_frame(self, parent_frame, start_row):
         current_row = start_row
         log(f"_populate_reviews_to_scroll_frame for restaurant: {self.restaurant.name if self.restaurant else 'None'}")
+        self.review_cursor = None
+        self.load_more_reviews_button = None
 
         if not self.restaurant:
             no_restaurant_label = ctk.CTkLabel(parent_frame,
@@ -618,52 +692,119 @@ class MenuScreen(ctk.CTkFrame):
             no_restaurant_label.grid(row=current_row, column=0, pady=20, sticky="ew")
             return current_row + 1
 
-        reviews = get_reviews_for_restaurant(self.restaurant.restaurant_id)
-        log(f"Found {len(reviews)} reviews for restaurant ID {self.restaurant.restaurant_id}")
+        # Reviews load in the background; a placeholder holds their place until they arrive
+        loading_label = ctk.CTkLabel(parent_frame, text="Loading reviews...",
+                                     text_color=GRAY_TEXT_COLOR, font=ctk.CTkFont(size=14))
+        loading_label.grid(row=current_row, column=0, pady=20, sticky="ew")
+        restaurant_id = self.restaurant.restaurant_id
+        sort = self.review_sort
+        if self._prefetched_review_page is not None and sort == "newest":
+            page, self._prefetched_review_page = self._prefetched_review_page, None
+            self._show_reviews(parent_frame, current_row, loading_label, page)
+            return current_row + 1
+        load_async(self, lambda: get_review_feed(restaurant_id, sort, limit=self.REVIEWS_PAGE_SIZE),
+                   lambda page: self._show_reviews(parent_frame, current_row, loading_label, page),
+                   key="reviews")
+        return current_row + 1
+
+    def _show_reviews(self, parent_frame, start_row, loading_label, page):
+        reviews, next_cursor = page
+        loading_label.destroy()
+        log(f"Loaded first {len(reviews)} reviews ({self.review_sort}) for restaurant ID {self.restaurant.restaurant_id}")
 
         if not reviews:
             no_reviews_label = ctk.CTkLabel(parent_frame,
                                             text="Be the first to review this restaurant!",
                                             text_color=TEXT_COLOR, font=ctk.CTkFont(size=14))
-            no_reviews_label.grid(row=current_row, column=0, pady=20, sticky="ew")
-            return current_row + 1
+            no_reviews_label.grid(row=start_row, column=0, pady=20, sticky="ew")
+            return
 
-        for review_data in reviews:
-            review_card = ctk.CTkFrame(parent_frame, fg_color=FRAME_FG_COLOR,
-                                     border_color=FRAME_BORDER_COLOR, border_width=1, corner_radius=8)
-            review_card.grid(row=current_row, column=0, pady=(0, 10), padx=5, sticky="ew")
-            review_card.grid_columnconfigure(0, weight=1)
+        self._append_reviews(parent_frame, start_row, reviews, next_cursor)
 
-            reviewer = User.get_by_id(review_data.user_id)
-            username = reviewer.username if reviewer else "Anonymous"
-            
-            reviewer_rating_frame = ctk.CTkFrame(review_card, fg_color="transparent")
-            reviewer_rating_frame.grid(row=0, column=0, padx=10, pady=(5,2), sticky="ew")
-            reviewer_rating_frame.grid_columnconfigure(0, weight=1)
-            reviewer_rating_frame.grid_columnconfigure(1, weight=0)
-
-            username_label = ctk.CTkLabel(reviewer_rating_frame, text=username,
-                                          font=ctk.CTkFont(size=14, weight="bold"),
-                                          text_color=TEXT_COLOR)
-            username_label.grid(row=0, column=0, sticky="w")
-
-            rating_text = f"{'★' * review_data.rating}{'☆' * (5 - review_data.rating)}"
-            rating_label = ctk.CTkLabel(reviewer_rating_frame, text=rating_text,
-                                        font=ctk.CTkFont(size=14), text_color=PRIMARY_COLOR)
-            rating_label.grid(row=0, column=1, sticky="e")
-            
-            if review_data.comment:
-                comment_label = ctk.CTkLabel(review_card, text=review_data.comment,
-                                             font=ctk.CTkFont(size=12), text_color=TEXT_COLOR,
-                                             wraplength=self.winfo_width() - 60,
-                                             justify="left", anchor="w")
-                comment_label.grid(row=1, column=0, padx=10, pady=(0,5), sticky="ew")
-
-            date_label = ctk.CTkLabel(review_card, text=review_data.review_date.strftime("%Y-%m-%d"),
-                                      font=ctk.CTkFont(size=10), text_color=SECONDARY_COLOR)
-            date_label.grid(row=2, column=0, padx=10, pady=(0,5), sticky="e")
+    def _append_reviews(self, parent_frame, start_row, reviews, next_cursor):
+        """Adds one page of review cards and moves the "Load more" button below them."""
+        current_row = start_row
+        for review_data in reviews:
+            self._create_review_card(parent_frame, review_data).grid(row=current_row, column=0, pady=(0, 10), padx=5, sticky="ew")
             current_row += 1
-        return current_row
+
+        self.review_cursor = next_cursor
+        if next_cursor is None:
+            if self.load_more_reviews_button is not None:
+                self.load_more_reviews_button.destroy()
+                self.load_more_reviews_button = None
+            return
+
+        if self.load_more_reviews_button is None:
+            self.load_more_reviews_button = ctk.CTkButton(
+                parent_frame,
+                text="Load more reviews",
+                fg_color="transparent",
+                hover_color=HOVER_BG_COLOR,
+                text_color=PRIMARY_COLOR,
+                border_width=1,
+                border_color=PRIMARY_COLOR,
+                font=ctk.CTkFont(size=14, weight="bold"),
+                height=36,
+                corner_radius=16
+            )
+        self.load_more_reviews_button.configure(
+            text="Load more reviews", state="normal",
+            command=lambda: self._load_more_reviews(parent_frame, current_row)
+        )
+        self.load_more_reviews_button.grid(row=current_row, column=0, pady=(5, 20))
+
+    def _load_more_reviews(self, parent_frame, start_row):
+        if self.review_cursor is None or self.load_more_reviews_button is None:
+            return
+        self.load_more_reviews_button.configure(text="Loading...", state="disabled")
+        restaurant_id = self.restaurant.restaurant_id
+        sort, cursor = self.review_sort, self.review_cursor
+        load_async(self, lambda: get_review_feed(restaurant_id, sort, cursor, limit=self.REVIEWS_PAGE_SIZE),
+                   lambda page: self._append_reviews(parent_frame, start_row, *page),
+                   key="reviews")
+
+    def _create_review_card(self, parent_frame, review_data):
+        review_card = ctk.CTkFrame(parent_frame, fg_color=FRAME_FG_COLOR,
+                                 border_color=FRAME_BORDER_COLOR, border_width=1, corner_radius=8)
+        review_card.grid_columnconfigure(0, weight=1)
+
+        # Reviews store the reviewer's username, so no per-review user lookup is needed
+        username = review_data.username or "Anonymous"
+
+        reviewer_rating_frame = ctk.CTkFrame(review_card, fg_color="transparent")
+        reviewer_rating_frame.grid(row=0, column=0, padx=10, pady=(5,2), sticky="ew")
+        reviewer_rating_frame.grid_columnconfigure(0, weight=1)
+        reviewer_rating_frame.grid_columnconfigure(1, weight=0)
+
+        username_label = ctk.CTkLabel(reviewer_rating_frame, text=username,
+                                      font=ctk.CTkFont(size=14, weight="bold"),
+                                      text_color=TEXT_COLOR)
+        username_label.grid(row=0, column=0, sticky="w")
+
+        rating_text = f"{'★' * review_data.rating}{'☆' * (5 - review_data.rating)}"
+        rating_label = ctk.CTkLabel(reviewer_rating_frame, text=rating_text,
+                                    font=ctk.CTkFont(size=14), text_color=PRIMARY_COLOR)
+        rating_label.grid(row=0, column=1, sticky="e")
+
+        if review_data.comment:
+            comment_label = ctk.CTkLabel(review_card, text=review_data.comment,
+                                         font=ctk.CTkFont(size=12), text_color=TEXT_COLOR,
+                                         wraplength=self.winfo_width() - 60,
+                                         justify="left", anchor="w")
+            comment_label.grid(row=1, column=0, padx=10, pady=(0,5), sticky="ew")
+
+        date_label = ctk.CTkLabel(review_card, text=review_data.review_date.strftime("%Y-%m-%d"),
+                                  font=ctk.CTkFont(size=10), text_color=SECONDARY_COLOR)
+        date_label.grid(row=2, column=0, padx=10, pady=(0,5), sticky="e")
+        return review_card
+
+    def _on_review_sort_changed(self, choice):
+        sort = self.REVIEW_SORT_OPTIONS.get(choice, "newest")
+        if sort == self.review_sort:
+            return
+        self.review_sort = sort
+        self.refresh_reviews()
 
     def _add_to_cart(self, menu_item: MenuItem):
         """Add item to cart with modern feedback"""
@@ -686,7 +827,7 @@ class MenuScreen(ctk.CTkFrame):
                 text="❌ Error: Cart not available",
                 text_color=ERROR_COLOR
             )
-        self.after(3000, lambda: self.status_label.configure(text=""))
+        scheduler.call_later(self.status_label, 3000, lambda: self.status_label.configure(text=""))
 
     def update_cart_count_in_nav(self):
         """Update the cart count display in navigation buttons"""
@@ -880,8 +1021,8 @@ class MenuScreen(ctk.CTkFrame):
         self.refresh_reviews()
 
     def refresh_reviews(self):
-        log("MenuScreen.refresh_reviews called, will repopulate main scroll content.")
-        self._populate_main_scroll_content()
+        log("MenuScreen.refresh_reviews called, will repopulate the review section.")
+        self._populate_review_footer()
 
     def show_cart_in_main_app(self):
         """Navigate back to main app and show cart content"""
@@ -890,7 +1031,7 @@ class MenuScreen(ctk.CTkFrame):
             self.app_ref.show_main_app_screen(self.user)
             
             # Wait a brief moment for the screen to be created, then switch to cart
-            self.after(100, self._switch_to_cart_after_navigation)
+            scheduler.call_later(self.app_ref, 100, self._switch_to_cart_after_navigation)
             
         except Exception as e:
             log(f"Error navigating to cart: {e}")
@@ -1,4 +1,5 @@
-from utils.database import get_db_connection
+from utils.database import get_read_connection, get_write_connection
+from utils.query_cache import query_cache
 from utils.logger import log
 from rich.table import Table
 from rich.text import Text
@@ -20,7 +21,7 @@ class MenuItem:
 
     @staticmethod
     def create(restaurant_id, name, description, price, category, image_filename=None):
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -46,14 +47,10 @@ class MenuItem:
 
     @staticmethod
     def get_by_id(item_id):
-        conn = get_db_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
         try:
-            cursor.execute("SELECT * FROM menu_items WHERE item_id = ?", (item_id,))
-            row = cursor.fetchone()
-            if row:
-                return MenuItem(**dict(row))
+            rows = query_cache.fetchall("SELECT * FROM menu_items WHERE item_id = ?", (item_id,), tables=("menu_items",))
+            if rows:
+                return MenuItem(**dict(rows[0]))
             return None
         except sqlite3.Error as e:
             log(f"SQLite error fetching MenuItem ID {item_id}: {e}")
@@ -63,15 +60,13 @@ class MenuItem:
         except Exception as e:
             log(f"General error fetching MenuItem ID {item_id}: {e}")
             return None
-        finally:
-            conn.close()
 
     @staticmethod
     def search(search_term):
         """
         Search for menu items by name or description.
         """
-        conn = get_db_connection()
+        conn = get_read_connection()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         items = []
@@ -96,14 +91,11 @@ class MenuItem:
     @staticmethod
     def get_for_restaurant(restaurant_id):
         log(f"MenuItem.get_for_restaurant called for restaurant_id: {restaurant_id}") 
-        conn = get_db_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
         menu = []
         try:
             # Modified SQL to order by item_id ASC
-            cursor.execute("SELECT * FROM menu_items WHERE restaurant_id = ? ORDER BY item_id ASC", (restaurant_id,))
-            rows = cursor.fetchall()
+            rows = query_cache.fetchall("SELECT * FROM menu_items WHERE restaurant_id = ? ORDER BY item_id ASC", (restaurant_id,),
+                                        tables=("menu_items",))
             log(f"Found {len(rows)} menu items for restaurant_id: {restaurant_id}") 
             for row in rows:
                 menu.append(MenuItem(**dict(row)))
@@ -116,15 +108,13 @@ class MenuItem:
         except Exception as e:
             log(f"General error fetching menu for restaurant ID {restaurant_id}: {e}")
             return []
-        finally:
-            conn.close()
 
     def update(self, name=None, description=None, price=None, category=None, image_filename=None):
         if not any([name, description, price, category, image_filename]):
             log(f"No update parameters provided for menu item ID {self.item_id}.")
             return False
 
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         fields_to_update = []
         parameters = []
@@ -175,7 +165,7 @@ class MenuItem:
             conn.close()
 
     def delete(self):
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("DELETE FROM menu_items WHERE item_id = ?", (self.item_id,))
@@ -190,7 +180,8 @@ class MenuItem:
             conn.close()
 
 class Restaurant:
-    def __init__(self, restaurant_id, name, cuisine_type, address, description=None, image_filename=None, created_at=None):
+    def __init__(self, restaurant_id, name, cuisine_type, address, description=None, image_filename=None, created_at=None,
+                 average_rating=None, review_count=None):
         self.restaurant_id = restaurant_id
         self.id = restaurant_id  # Add alias for compatibility if needed, or update all usages
         self.name = name
@@ -199,6 +190,9 @@ class Restaurant:
         self.description = description
         self.image_filename = image_filename
         self.created_at = created_at
+        # Review stats, filled in when the restaurant was loaded with get_all_with_stats()
+        self.average_rating = average_rating
+        self.review_count = review_count
 
     @property
     def menu(self):
@@ -209,7 +203,9 @@ class Restaurant:
 
     @property
     def rating(self):
-        conn = get_db_connection()
+        if self.average_rating is not None:
+            return self.average_rating
+        conn = get_read_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT AVG(rating) FROM reviews WHERE restaurant_id = ?", (self.restaurant_id,))
@@ -222,7 +218,9 @@ class Restaurant:
             conn.close()
 
     def get_review_count(self):
-        conn = get_db_connection()
+        if self.review_count is not None:
+            return self.review_count
+        conn = get_read_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT COUNT(*) FROM reviews WHERE restaurant_id = ?", (self.restaurant_id,))
@@ -235,7 +233,9 @@ class Restaurant:
             conn.close()
 
     def __repr__(self):
-        return f"<Restaurant {self.name} (ID: {self.restaurant_id}, Cuisine: {self.cuisine_type}, Img: {self.image_filename}) - {self.rating:.1f} stars>"
+        # Only show the rating when it was loaded with the restaurant; repr() must not query the database
+        rating = f" - {self.average_rating:.1f} stars" if self.average_rating is not None else ""
+        return f"<Restaurant {self.name} (ID: {self.restaurant_id}, Cuisine: {self.cuisine_type}, Img: {self.image_filename}){rating}>"
 
     def get_menu_by_category(self, category):
         return [item for item in self.menu if item.category.lower() == category.lower()]
@@ -296,7 +296,7 @@ class Restaurant:
             log("No update parameters provided for restaurant.")
             return False
 
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         fields_to_update = []
         parameters = []
@@ -344,7 +344,7 @@ class Restaurant:
             conn.close()
 
     def delete(self):
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("DELETE FROM reviews WHERE restaurant_id = ?", (self.restaurant_id,))
@@ -366,7 +366,7 @@ class Restaurant:
 
     @staticmethod
     def create(name, cuisine_type, address, description=None, image_filename=None):
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("""
@@ -392,14 +392,10 @@ class Restaurant:
 
     @staticmethod
     def get_by_id(restaurant_id):
-        conn = get_db_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
         try:
-            cursor.execute("SELECT * FROM restaurants WHERE restaurant_id = ?", (restaurant_id,))
-            row = cursor.fetchone()
-            if row:
-                return Restaurant(**dict(row))
+            rows = query_cache.fetchall("SELECT * FROM restaurants WHERE restaurant_id = ?", (restaurant_id,), tables=("restaurants",))
+            if rows:
+                return Restaurant(**dict(rows[0]))
             return None
         except sqlite3.Error as e:
             log(f"SQLite error fetching restaurant ID {restaurant_id}: {e}")
@@ -409,19 +405,13 @@ class Restaurant:
         except Exception as e:
             log(f"Error fetching restaurant ID {restaurant_id}: {e}")
             return None
-        finally:
-            conn.close()
 
     @staticmethod
     def get_all():
-        conn = get_db_connection()
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
         restaurants = []
         try:
             # Modified SQL to order by restaurant_id ASC
-            cursor.execute("SELECT * FROM restaurants ORDER BY restaurant_id ASC")
-            rows = cursor.fetchall()
+            rows = query_cache.fetchall("SELECT * FROM restaurants ORDER BY restaurant_id ASC", tables=("restaurants",))
             for row in rows:
                 restaurants.append(Restaurant(**dict(row)))
             return restaurants
@@ -433,14 +423,37 @@ class Restaurant:
         except Exception as e:
             log(f"Error fetching all restaurants: {e}")
             return []
-        finally:
-            conn.close()
+
+    @staticmethod
+    def get_all_with_stats():
+        """Like get_all(), but also loads each restaurant's average rating and review count in the same query."""
+        restaurants = []
+        try:
+            rows = query_cache.fetchall("""
+                SELECT
+                    r.*,
+                    COALESCE(AVG(rev.rating), 0) as average_rating,
+                    COUNT(rev.review_id) as review_count
+                FROM restaurants r
+                LEFT JOIN reviews rev ON r.restaurant_id = rev.restaurant_id
+                GROUP BY r.restaurant_id
+                ORDER BY r.restaurant_id ASC
+            """, tables=("restaurants", "reviews"))
+            for row in rows:
+                restaurants.append(Restaurant(**dict(row)))
+            return restaurants
+        except sqlite3.Error as e:
+            log(f"SQLite error fetching restaurants with stats: {e}")
+            return []
+        except Exception as e:
+            log(f"Error fetching restaurants with stats: {e}")
+            return []
 
     @staticmethod
     def search_by_name(search_term):
         """Search for restaurants by name (case-insensitive)."""
         log(f"Searching for restaurants with name like: {search_term}")
-        conn = get_db_connection()
+        conn = get_read_connection()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         restaurants = []
@@ -472,7 +485,7 @@ class Restaurant:
     def search_by_menu_item(search_term):
         """Search for restaurants based on menu item names (case-insensitive)."""
         log(f"Searching for restaurants with menu items like: {search_term}")
-        conn = get_db_connection()
+        conn = get_read_connection()
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
         
@@ -578,53 +591,44 @@ def populate_sample_restaurant_data():
         ]}
     ]
 
-    conn = get_db_connection()
+    conn = get_write_connection()
     cursor = conn.cursor()
     
     try:
+        # Load what already exists with two queries instead of one SELECT per restaurant and per item
+        cursor.execute("SELECT restaurant_id, name FROM restaurants")
+        existing_restaurant_ids = {row["name"]: row["restaurant_id"] for row in cursor.fetchall()}
+        cursor.execute("SELECT restaurant_id, name FROM menu_items")
+        existing_items = {(row["restaurant_id"], row["name"]) for row in cursor.fetchall()}
+
+        added_restaurants = 0
+        new_menu_rows = []
         for r_data in restaurants_to_add:
-            cursor.execute("SELECT restaurant_id FROM restaurants WHERE name = ?", (r_data["name"],))
-            existing_r_row = cursor.fetchone() # Renamed to avoid conflict
-            restaurant_id_to_use = None
-
-            if not existing_r_row:
+            restaurant_id_to_use = existing_restaurant_ids.get(r_data["name"])
+            if restaurant_id_to_use is None:
                 log(f"Adding restaurant: {r_data['name']} with image {r_data.get('image_filename')}")
-                new_r = Restaurant.create(
-                    r_data["name"], 
-                    r_data["cuisine"], 
-                    r_data["address"], 
-                    description=r_data.get("description"), 
-                    image_filename=r_data.get("image_filename")
-                )
-                if new_r:
-                    restaurant_id_to_use = new_r.restaurant_id
-            else:
-                log(f"Restaurant '{r_data['name']}' already exists. Checking/adding its menu items.")
-                restaurant_id_to_use = existing_r_row[0] # Get ID from existing restaurant
-
-            if restaurant_id_to_use:
-                for item_data in r_data["menu"]:
-                    # Check if this specific menu item already exists for this restaurant
-                    cursor.execute("SELECT item_id FROM menu_items WHERE restaurant_id = ? AND name = ?", 
-                                   (restaurant_id_to_use, item_data["name"]))
-                    existing_item = cursor.fetchone()
-                    if not existing_item:
-                        log(f"Adding menu item '{item_data['name']}' to restaurant ID {restaurant_id_to_use}") # ADDED LOG
-                        MenuItem.create(
-                            restaurant_id_to_use, 
-                            item_data["name"], 
-                            item_data["desc"], 
-                            item_data["price"], 
-                            item_data["cat"],
-                            image_filename=item_data.get("image_filename")
-                        )
-                    else:
-                        log(f"Menu item '{item_data['name']}' already exists for restaurant ID {restaurant_id_to_use}. Skipping.")
-            else:
-                log(f"Could not obtain restaurant_id for '{r_data['name']}', skipping menu item population for it.")
-
-        log("Sample restaurant data population check complete.")
+                cursor.execute("""
+                    INSERT INTO restaurants (name, cuisine_type, address, description, image_filename)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (r_data["name"], r_data["cuisine"], r_data["address"], r_data.get("description"), r_data.get("image_filename")))
+                restaurant_id_to_use = cursor.lastrowid
+                existing_restaurant_ids[r_data["name"]] = restaurant_id_to_use
+                added_restaurants += 1
+
+            for item_data in r_data["menu"]:
+                if (restaurant_id_to_use, item_data["name"]) not in existing_items:
+                    new_menu_rows.append((restaurant_id_to_use, item_data["name"], item_data["desc"],
+                                          item_data["price"], item_data["cat"], item_data.get("image_filename")))
+
+        if new_menu_rows:
+            cursor.executemany("""
+                INSERT INTO menu_items (restaurant_id, name, description, price, category, image_filename)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, new_menu_rows)
+        conn.commit()
+        log(f"Sample restaurant data population check complete ({added_restaurants} restaurant(s), {len(new_menu_rows)} menu item(s) added).")
     except Exception as e:
         log(f"Error during sample restaurant data population: {e}")
+        conn.rollback()
     finally:
         conn.close()
@@ -14,9 +14,11 @@ from gui_Light import (
     ADMIN_PRIMARY_ACCENT_COLOR, ADMIN_TABLE_TEXT_COLOR, set_swigato_icon, safe_focus, center_window
 )
 from restaurants.models import Restaurant, MenuItem
-from CTkTable import CTkTable
+from gui_components.data_grid import DataGrid
 from tkinter import messagebox
-from reviews.models import get_reviews_for_restaurant, Review
+from reviews.models import get_review_feed, Review
+from utils.scheduler import scheduler
+from utils.prefetch import menu_prefetcher
 import datetime
 
 # Setup logger for this module
@@ -26,6 +28,8 @@ ICON_PATH = os.path.join("assets", "swigato_icon.ico")
 DEFAULT_RESTAURANT_IMAGE = "assets/restaurants/default_restaurant.jpg"  # Fixed extension 
 DEFAULT_MENU_ITEM_IMAGE = "assets/menu_items/menu_default.jpg"
 MENU_ITEM_IMAGE_ASSETS_DIR = "assets/menu_items"
+REVIEWS_PAGE_SIZE = 25 # Reviews per page in the reviews table
+REVIEW_SORT_OPTIONS = {"Newest": "newest", "Highest rated": "highest", "Lowest rated": "lowest"}
 
 class RestaurantManagementScreen(ctk.CTkToplevel):
     def __init__(self, master, app_callbacks, loggedInUser, on_close_callback=None, restaurant_id=None, **kwargs):
@@ -239,25 +243,17 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
             return
 
         for item in menu_items_from_db:
-            self.menu_items_in_table.append({
-                "id": item.item_id, "name": item.name, "category": item.category, 
-                "price": item.price, "description": item.description, "image": item.image_filename
-            })
-            table_data.append([
-                item.item_id,
-                item.name,
-                item.category,
-                f"{item.price:.2f}",
-                item.description if item.description else "N/A",
-                "Edit / Delete"
-            ])
+            self.menu_items_in_table.append(self._menu_item_record(item))
+            table_data.append(self._menu_item_row(item))
         
         header_font = ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE, weight="bold")
         cell_font = ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE -1)
 
-        self.menu_table = CTkTable(master=self.menu_table_frame,
+        self.menu_table = DataGrid(master=self.menu_table_frame,
                                    values=table_data,
-                                   font=cell_font,  # type: ignore[arg-type]
+                                   name="restaurant_menu_items",
+                                   font=cell_font,
+                                   header_font=header_font,
                                    header_color=ADMIN_TABLE_HEADER_BG_COLOR,
                                    text_color=ADMIN_TABLE_TEXT_COLOR,
                                    hover_color=ADMIN_PRIMARY_ACCENT_COLOR,
@@ -266,11 +262,52 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
                                    border_width=1,
                                    border_color=ADMIN_TABLE_BORDER_COLOR,
                                    command=self._on_menu_item_cell_click,
-                                   wraplength=150 
+                                   max_column_width=220,
+                                   empty_text="No menu items found for this restaurant."
                                   )
         self.menu_table.pack(expand=True, fill="both", padx=5, pady=5)
         logger.info("Menu items table created and displayed.")
 
+    def _menu_item_record(self, item):
+        return {
+            "id": item.item_id, "name": item.name, "category": item.category,
+            "price": item.price, "description": item.description, "image": item.image_filename
+        }
+
+    def _menu_item_row(self, item):
+        return [
+            item.item_id,
+            item.name,
+            item.category,
+            f"{item.price:.2f}",
+            item.description if item.description else "N/A",
+            "Edit / Delete"
+        ]
+
+    # After an add, edit or delete only the affected row of the menu table changes
+
+    def _show_new_menu_item(self, item):
+        if self.menu_table is None:
+            self._load_menu_items()  # The table was empty, so there is no grid to insert into yet
+            return
+        self.menu_items_in_table.append(self._menu_item_record(item))
+        self.menu_table.insert_rows([self._menu_item_row(item)], index=len(self.menu_table.rows))
+
+    def _show_edited_menu_item(self, item_id):
+        item = MenuItem.get_by_id(item_id)
+        if item is None or self.menu_table is None:
+            self._load_menu_items()
+            return
+        for i, record in enumerate(self.menu_items_in_table):
+            if record["id"] == item_id:
+                self.menu_items_in_table[i] = self._menu_item_record(item)
+        self.menu_table.patch_row(item_id, self._menu_item_row(item))
+
+    def _remove_menu_item_row(self, item_id):
+        self.menu_items_in_table = [record for record in self.menu_items_in_table if record["id"] != item_id]
+        if self.menu_table is not None:
+            self.menu_table.remove_rows([item_id])
+
     def _on_menu_item_cell_click(self, event_data):
         row_clicked = event_data["row"]
         column_clicked = event_data["column"]
@@ -444,9 +481,10 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
         if new_item:
             logger.info(f"New menu item '{name}' created successfully for restaurant ID {self.restaurant_id}.")
             self.add_item_status_label.configure(text="Menu item added successfully!", text_color=ADMIN_PRIMARY_COLOR)
-            self._load_menu_items() 
+            menu_prefetcher.invalidate(self.restaurant_id)
+            self._show_new_menu_item(new_item)
             if hasattr(self, 'add_menu_item_dialog_instance') and self.add_menu_item_dialog_instance.winfo_exists():
-                self.add_menu_item_dialog_instance.after(1000, self.add_menu_item_dialog_instance.destroy)
+                scheduler.call_later(self.add_menu_item_dialog_instance, 1000, self.add_menu_item_dialog_instance.destroy)
         else:
             logger.error(f"Failed to create new menu item '{name}' for restaurant ID {self.restaurant_id}.")
             self.add_item_status_label.configure(text="Failed to add menu item. Check logs.", text_color=ERROR_COLOR)
@@ -532,9 +570,10 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
         if success:
             logger.info(f"Menu item ID {item_id} updated successfully.")
             self.edit_item_status_label.configure(text="Menu item updated successfully!", text_color=ADMIN_PRIMARY_COLOR)
-            self._load_menu_items() 
+            menu_prefetcher.invalidate(self.restaurant_id)
+            self._show_edited_menu_item(item_id)
             if hasattr(self, 'edit_menu_item_dialog_instance') and self.edit_menu_item_dialog_instance.winfo_exists():
-                self.edit_menu_item_dialog_instance.after(1000, self.edit_menu_item_dialog_instance.destroy) 
+                scheduler.call_later(self.edit_menu_item_dialog_instance, 1000, self.edit_menu_item_dialog_instance.destroy) 
         else:
             logger.error(f"Failed to update menu item ID {item_id}.")
             self.edit_item_status_label.configure(text="Failed to update menu item. Check logs.", text_color=ERROR_COLOR)
@@ -655,8 +694,9 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
             item_to_delete = MenuItem.get_by_id(menu_item_id)
             if item_to_delete:
                 if item_to_delete.delete():
+                    menu_prefetcher.invalidate(self.restaurant_id)
                     messagebox.showinfo("Success", f"Menu item '{menu_item_data['name']}' deleted successfully.", parent=self.edit_menu_item_dialog_instance if hasattr(self, 'edit_menu_item_dialog_instance') and self.edit_menu_item_dialog_instance.winfo_exists() else self)
-                    self._load_menu_items()
+                    self._remove_menu_item_row(menu_item_id)
                     if hasattr(self, 'edit_menu_item_dialog_instance') and self.edit_menu_item_dialog_instance.winfo_exists() and getattr(self.edit_menu_item_dialog_instance, "editing_item_id", None) == menu_item_id:
                         self.edit_menu_item_dialog_instance.destroy()
                 else:
@@ -670,6 +710,42 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
         tab_frame.grid_columnconfigure(0, weight=1)
         tab_frame.grid_rowconfigure(1, weight=1)
 
+        # Sort and paging controls; each page is one get_review_feed() call
+        reviews_controls_frame = ctk.CTkFrame(tab_frame, fg_color="transparent")
+        reviews_controls_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=(10, 0))
+        reviews_controls_frame.grid_columnconfigure(1, weight=1)
+
+        self.review_sort_menu = ctk.CTkOptionMenu(
+            reviews_controls_frame, values=list(REVIEW_SORT_OPTIONS),
+            command=self._on_review_sort_changed,
+            fg_color=ADMIN_BUTTON_FG_COLOR, button_color=ADMIN_BUTTON_FG_COLOR,
+            button_hover_color=ADMIN_BUTTON_HOVER_COLOR, text_color=ADMIN_BUTTON_TEXT_COLOR,
+            font=ctk.CTkFont(family=FONT_FAMILY, size=BUTTON_FONT_SIZE), corner_radius=8
+        )
+        self.review_sort_menu.grid(row=0, column=0, sticky="w")
+
+        self.prev_reviews_page_button = ctk.CTkButton(
+            reviews_controls_frame, text="◀ Previous", command=self._show_previous_reviews_page,
+            fg_color=ADMIN_BUTTON_FG_COLOR, hover_color=ADMIN_BUTTON_HOVER_COLOR, text_color=ADMIN_BUTTON_TEXT_COLOR,
+            font=ctk.CTkFont(family=FONT_FAMILY, size=BUTTON_FONT_SIZE), corner_radius=8, width=100, state="disabled"
+        )
+        self.prev_reviews_page_button.grid(row=0, column=2, padx=(0, 10))
+        self.reviews_page_label = ctk.CTkLabel(
+            reviews_controls_frame, text="Page 1",
+            font=ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE), text_color=ADMIN_TEXT_COLOR
+        )
+        self.reviews_page_label.grid(row=0, column=3, padx=(0, 10))
+        self.next_reviews_page_button = ctk.CTkButton(
+            reviews_controls_frame, text="Next ▶", command=self._show_next_reviews_page,
+            fg_color=ADMIN_BUTTON_FG_COLOR, hover_color=ADMIN_BUTTON_HOVER_COLOR, text_color=ADMIN_BUTTON_TEXT_COLOR,
+            font=ctk.CTkFont(family=FONT_FAMILY, size=BUTTON_FONT_SIZE), corner_radius=8, width=100, state="disabled"
+        )
+        self.next_reviews_page_button.grid(row=0, column=4)
+
+        self.review_sort = "newest"
+        self.review_page_cursors = [None] # Cursor of every page visited so far; the last one is the current page
+        self.next_review_page_cursor = None
+
         self.reviews_table_frame = ctk.CTkFrame(tab_frame, fg_color="transparent")
         self.reviews_table_frame.grid(row=1, column=0, sticky="nsew", padx=10, pady=10)
         self.reviews_table_frame.grid_columnconfigure(0, weight=1)
@@ -680,6 +756,7 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
     def _load_reviews(self):
         for widget in self.reviews_table_frame.winfo_children():
             widget.destroy()
+        self.reviews_table = None
 
         if not self.restaurant_id:
             ctk.CTkLabel(self.reviews_table_frame, text="Save the restaurant details first to manage reviews.",
@@ -687,8 +764,10 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
                          text_color=ADMIN_TEXT_COLOR).pack(expand=True, anchor="center", padx=20, pady=20)
             return
 
-        reviews = get_reviews_for_restaurant(self.restaurant_id)
+        reviews, self.next_review_page_cursor = get_review_feed(
+            self.restaurant_id, self.review_sort, self.review_page_cursors[-1], limit=REVIEWS_PAGE_SIZE)
         self.reviews_in_table = reviews
+        self._update_reviews_paging_controls()
 
         headers = ["ID", "User", "Rating", "Comment", "Date", "Actions"]
         table_data = [headers]
@@ -704,6 +783,11 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
                 "Delete"
             ])
 
+        if len(table_data) == 1 and len(self.review_page_cursors) > 1:
+            # The last review of this page was deleted; go back to the previous page
+            self.review_page_cursors.pop()
+            self._load_reviews()
+            return
         if len(table_data) == 1:
             ctk.CTkLabel(self.reviews_table_frame, text="No reviews found for this restaurant.",
                          font=ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE),
@@ -711,9 +795,10 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
             return
 
         cell_font = ctk.CTkFont(family=FONT_FAMILY, size=BODY_FONT_SIZE - 1)
-        self.reviews_table = CTkTable(master=self.reviews_table_frame,
+        self.reviews_table = DataGrid(master=self.reviews_table_frame,
                                       values=table_data,
-                                      font=cell_font,  # type: ignore[arg-type]
+                                      name="restaurant_reviews",
+                                      font=cell_font,
                                       header_color=ADMIN_TABLE_HEADER_BG_COLOR,
                                       text_color=ADMIN_TABLE_TEXT_COLOR,
                                       hover_color=ADMIN_PRIMARY_ACCENT_COLOR,
@@ -722,9 +807,29 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
                                       border_width=1,
                                       border_color=ADMIN_TABLE_BORDER_COLOR,
                                       command=self._on_review_table_cell_click,
-                                      wraplength=150)
+                                      max_column_width=220)
         self.reviews_table.pack(expand=True, fill="both", padx=5, pady=5)
 
+    def _on_review_sort_changed(self, choice):
+        self.review_sort = REVIEW_SORT_OPTIONS.get(choice, "newest")
+        self.review_page_cursors = [None]  # Sort changed, start again from the first page
+        self._load_reviews()
+
+    def _show_next_reviews_page(self):
+        if self.next_review_page_cursor is not None:
+            self.review_page_cursors.append(self.next_review_page_cursor)
+            self._load_reviews()
+
+    def _show_previous_reviews_page(self):
+        if len(self.review_page_cursors) > 1:
+            self.review_page_cursors.pop()
+            self._load_reviews()
+
+    def _update_reviews_paging_controls(self):
+        self.reviews_page_label.configure(text=f"Page {len(self.review_page_cursors)}")
+        self.prev_reviews_page_button.configure(state="normal" if len(self.review_page_cursors) > 1 else "disabled")
+        self.next_reviews_page_button.configure(state="normal" if self.next_review_page_cursor is not None else "disabled")
+
     def _on_review_table_cell_click(self, event_data):
         row_clicked = event_data["row"]
         column_clicked = event_data["column"]
@@ -745,7 +850,11 @@ class RestaurantManagementScreen(ctk.CTkToplevel):
         success = Review.delete_review(review_id)
         if success:
             messagebox.showinfo("Success", "Review deleted successfully.")
-            self._load_reviews()
+            self.reviews_in_table = [review for review in self.reviews_in_table if review.review_id != review_id]
+            if self.reviews_in_table and self.reviews_table is not None:
+                self.reviews_table.remove_rows([review_id])
+            else:
+                self._load_reviews()  # The page is empty now; _load_reviews steps back a page
         else:
             messagebox.showerror("Error", "Failed to delete review. It may not exist.")
 
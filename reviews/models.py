@@ -1,6 +1,8 @@
 import datetime
 from utils.logger import log
-from utils.database import get_db_connection
+from utils.database import get_read_connection, get_write_connection, id_chunks
+from utils.query_cache import query_cache
+from utils.write_queue import write_queue
 import sqlite3
 
 class Review:
@@ -34,7 +36,7 @@ class Review:
     @staticmethod
     def get_all_reviews():
         """Fetches all reviews from the database including restaurant name, ordered by review_id ASC."""
-        conn = get_db_connection()
+        conn = get_read_connection()
         cursor = conn.cursor()
         reviews = []
         try:
@@ -65,7 +67,7 @@ class Review:
     @staticmethod
     def delete_review(review_id):
         """Deletes a review from the database by its ID."""
-        conn = get_db_connection()
+        conn = get_write_connection()
         try:
             cursor = conn.cursor()
             cursor.execute("DELETE FROM reviews WHERE review_id = ?", (review_id,))
@@ -82,9 +84,47 @@ class Review:
         finally:
             conn.close()
 
+    @staticmethod
+    def delete_many(review_ids):
+        """
+        Deletes several reviews in a single transaction.
+
+        Returns {review_id: True/False}, False for reviews that do not exist. If
+        the transaction fails nothing is deleted and every review maps to False.
+        """
+        review_ids = list(dict.fromkeys(review_ids))
+        results = dict.fromkeys(review_ids, False)
+        if not review_ids:
+            return results
+        conn = get_write_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")  # Take the write lock first so the existence check stays true
+            for chunk in id_chunks(review_ids):
+                placeholders = ','.join('?' for _ in chunk)
+                cursor.execute(f"SELECT review_id FROM reviews WHERE review_id IN ({placeholders})", chunk)
+                for row in cursor.fetchall():
+                    results[row['review_id']] = True
+                cursor.execute(f"DELETE FROM reviews WHERE review_id IN ({placeholders})", chunk)
+            conn.commit()
+            log(f"{sum(results.values())} of {len(review_ids)} review(s) deleted in one transaction.")
+            return results
+        except Exception as e:
+            conn.rollback()
+            log(f"Error deleting {len(review_ids)} review(s): {e}")
+            return dict.fromkeys(review_ids, False)
+        finally:
+            conn.close()
+
+def _insert_review(cursor, user_id, username, restaurant_id, rating, comment, current_time):
+    """Write-queue job for add_review; returns the new review_id."""
+    cursor.execute("""
+        INSERT INTO reviews (user_id, username, restaurant_id, rating, comment, review_date)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, (user_id, username, restaurant_id, rating, comment, current_time))
+    return cursor.lastrowid
+
 def add_review(user_id, username, restaurant_id, rating, comment=""):
-    conn = get_db_connection()
-    cursor = conn.cursor()
     try:
         # Ensure rating is an integer
         if not isinstance(rating, int) or not (1 <= rating <= 5):
@@ -92,12 +132,7 @@ def add_review(user_id, username, restaurant_id, rating, comment=""):
             raise ValueError("Rating must be an integer between 1 and 5.")
 
         current_time = datetime.datetime.now()
-        cursor.execute("""
-            INSERT INTO reviews (user_id, username, restaurant_id, rating, comment, review_date)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (user_id, username, restaurant_id, rating, comment, current_time))
-        conn.commit()
-        review_id = cursor.lastrowid
+        review_id = write_queue.run(_insert_review, user_id, username, restaurant_id, rating, comment, current_time)
         log(f"Review {review_id} added for restaurant {restaurant_id} by user {username}.")
         return Review(
             review_id=review_id, 
@@ -110,21 +145,16 @@ def add_review(user_id, username, restaurant_id, rating, comment=""):
         )
     except ValueError as ve: # Catch specific ValueError for rating
         log(f"Error adding review (ValueError): {ve}")
-        conn.rollback()
         return None
     except sqlite3.Error as e:
         log(f"Database error adding review: {e}")
-        conn.rollback()
         return None
     except Exception as e:
         log(f"Unexpected error adding review: {e}")
-        conn.rollback()
         return None
-    finally:
-        conn.close()
 
 def get_reviews_for_restaurant(restaurant_id):
-    conn = get_db_connection()
+    conn = get_read_connection()
     cursor = conn.cursor()
     reviews = []
     try:
@@ -146,9 +176,60 @@ def get_reviews_for_restaurant(restaurant_id):
     finally:
         conn.close()
 
+# Sort modes for get_review_feed: ORDER BY clause, keyset comparison and the columns that make up the cursor.
+# "lowest" is the mirror image of "highest" so both can walk the same (restaurant_id, rating, review_date) index.
+REVIEW_FEED_SORTS = {
+    "newest": ("r.review_date DESC, r.review_id DESC", "(r.review_date, r.review_id) < (?, ?)", ("review_date", "review_id")),
+    "highest": ("r.rating DESC, r.review_date DESC, r.review_id DESC", "(r.rating, r.review_date, r.review_id) < (?, ?, ?)", ("rating", "review_date", "review_id")),
+    "lowest": ("r.rating ASC, r.review_date ASC, r.review_id ASC", "(r.rating, r.review_date, r.review_id) > (?, ?, ?)", ("rating", "review_date", "review_id")),
+}
+
+def get_review_feed(restaurant_id, sort="newest", cursor=None, limit=20):
+    """
+    Returns one page of a restaurant's reviews.
+
+    sort is "newest", "highest" or "lowest". Pass the returned cursor back in to
+    get the next page; it is None once there are no more reviews. Paging is
+    keyset-based, so later pages cost the same as the first one.
+
+    Returns:
+        tuple: (list of Review, next_cursor or None)
+    """
+    if sort not in REVIEW_FEED_SORTS:
+        raise ValueError(f"Unknown review sort '{sort}'. Expected one of: {', '.join(REVIEW_FEED_SORTS)}.")
+    order_by, after_cursor, cursor_columns = REVIEW_FEED_SORTS[sort]
+    try:
+        params = [restaurant_id]
+        keyset = ""
+        if cursor is not None:
+            keyset = f"AND {after_cursor}"
+            params.extend(cursor)
+        # One extra row tells us whether there is a next page
+        rows = query_cache.fetchall(f"""
+            SELECT r.review_id, r.user_id, r.username, r.restaurant_id, res.name AS restaurant_name,
+                   r.rating, r.comment, r.review_date
+            FROM reviews r
+            JOIN restaurants res ON r.restaurant_id = res.restaurant_id
+            WHERE r.restaurant_id = ? {keyset}
+            ORDER BY {order_by}
+            LIMIT ?
+        """, params + [limit + 1], tables=("reviews", "restaurants"))
+        reviews = [Review._from_row(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            # Built from the raw column values, not the parsed Review, so comparisons match what is stored
+            last_row = rows[limit - 1]
+            next_cursor = tuple(last_row[column] for column in cursor_columns)
+        return reviews, next_cursor
+    except ValueError:
+        raise
+    except Exception as e:
+        log(f"Error fetching review feed for restaurant {restaurant_id} (sort={sort}): {e}")
+        return [], None
+
 def populate_sample_reviews():
     log("Attempting to populate sample review data...")
-    conn = get_db_connection()
+    conn = get_write_connection()
     cursor = conn.cursor()
 
     sample_reviews_data = [
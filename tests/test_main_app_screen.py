@@ -0,0 +1,107 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from cart.models import Cart
+from gui_components import main_app_screen
+from gui_components.main_app_screen import MainAppScreen
+from utils import database
+from utils.query_cache import query_cache
+
+def _screen(tab):
+    # No Tk display here: skip the widget constructor and stub what on_show() touches
+    screen = object.__new__(MainAppScreen)
+    screen.app_ref = SimpleNamespace(cart=Cart(user_id=1))
+    screen.user = SimpleNamespace(user_id=1)
+    screen.current_nav_tab = tab
+    screen._tab_versions = {}
+    screen._shown_cart = None
+    screen.update_cart_count_in_nav = lambda: None
+    screen.load_cart_items = mock.Mock(side_effect=lambda: setattr(screen, "_shown_cart", screen._cart_signature()))
+    screen.favorites_list_component = mock.Mock()
+    screen._on_restaurants_loaded = mock.Mock()
+    screen._on_restaurants_refreshed = mock.Mock()
+    screen._on_orders_loaded = mock.Mock()
+    screen.orders_list = mock.Mock()
+    return screen
+
+class OnShowTest(unittest.TestCase):
+    def setUp(self):
+        self._old_path = database.DATABASE_NAME
+        self._dir = tempfile.mkdtemp()
+        self.path = os.path.join(self._dir, "test.db")
+        database.set_database_path(self.path)
+        database.initialize_database()
+        # Run loads synchronously instead of on the background pool
+        patch = mock.patch.object(main_app_screen, "load_async",
+                                  lambda owner, query, on_result, **kwargs: on_result(query()))
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        query_cache.close()
+        database.close_connections()
+        database.DATABASE_NAME = self._old_path
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _write(self, sql):
+        """Writes from a connection of its own, as another process would."""
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                conn.execute(sql)
+        finally:
+            conn.close()
+
+    def test_restaurant_list_reloads_only_after_a_change(self):
+        screen = _screen("home")
+        screen.load_restaurants = MainAppScreen.load_restaurants.__get__(screen)
+        screen.restaurant_list = mock.Mock()
+        screen.load_restaurants()
+        screen.on_show()
+        screen._on_restaurants_refreshed.assert_not_called()
+        self._write("INSERT INTO restaurants (name) VALUES ('Dosa Point')")
+        screen.on_show()
+        screen._on_restaurants_refreshed.assert_called_once()
+        screen.on_show()
+        screen._on_restaurants_refreshed.assert_called_once()
+
+    def test_orders_reload_only_after_a_change(self):
+        screen = _screen("orders")
+        screen.load_order_history()
+        self.assertEqual(screen._on_orders_loaded.call_count, 1)
+        screen.on_show()
+        self.assertEqual(screen._on_orders_loaded.call_count, 1)
+        # Another table changing does not matter to the orders tab
+        self._write("INSERT INTO restaurants (name) VALUES ('Dosa Point')")
+        screen.on_show()
+        self.assertEqual(screen._on_orders_loaded.call_count, 1)
+        self._write("INSERT INTO orders (user_id, restaurant_id, total_amount) VALUES (1, 1, 80)")
+        screen.on_show()
+        self.assertEqual(screen._on_orders_loaded.call_count, 2)
+
+    def test_favorites_reload_only_after_a_change(self):
+        screen = _screen("favorites")
+        screen.load_favorites()
+        screen.on_show()
+        self.assertEqual(screen.favorites_list_component.load_favorites.call_count, 1)
+        self._write("INSERT INTO restaurants (name) VALUES ('Dosa Point')")
+        self._write("INSERT INTO user_favorites (user_id, restaurant_id) VALUES (1, 1)")
+        screen.on_show()
+        self.assertEqual(screen.favorites_list_component.load_favorites.call_count, 2)
+
+    def test_cart_rebuilds_only_after_its_contents_changed(self):
+        screen = _screen("cart")
+        screen.on_show()  # Never built yet
+        screen.on_show()
+        self.assertEqual(screen.load_cart_items.call_count, 1)
+        screen.app_ref.cart.add_item(SimpleNamespace(item_id=3, name="Masala Dosa", price=80))
+        screen.on_show()
+        self.assertEqual(screen.load_cart_items.call_count, 2)
+
+if __name__ == "__main__":
+    unittest.main()
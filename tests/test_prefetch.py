@@ -0,0 +1,68 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from utils import database
+from utils.prefetch import MenuPrefetcher, _Request
+from utils.query_cache import query_cache
+
+class MenuPrefetcherTest(unittest.TestCase):
+    def setUp(self):
+        self._old_path = database.DATABASE_NAME
+        self._dir = tempfile.mkdtemp()
+        self.path = os.path.join(self._dir, "test.db")
+        database.set_database_path(self.path)
+        database.initialize_database()
+        with self._connect() as conn:
+            conn.execute("INSERT INTO restaurants (name) VALUES ('Dosa Point')")
+            conn.execute("INSERT INTO menu_items (restaurant_id, name, price) VALUES (1, 'Masala Dosa', 80)")
+        self.prefetcher = MenuPrefetcher()
+
+    def tearDown(self):
+        query_cache.close()
+        database.close_connections()
+        database.DATABASE_NAME = self._old_path
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _connect(self):
+        """A connection of its own, as another process would have."""
+        conn = sqlite3.connect(self.path)
+        self.addCleanup(conn.close)
+        return conn
+
+    def _prefetch(self, restaurant_id=1):
+        # Run on this thread instead of the prefetcher's worker
+        request = _Request(restaurant_id, "visible")
+        self.prefetcher._requests[restaurant_id] = request
+        self.prefetcher._run(request)
+
+    def test_unchanged_prefetch_is_handed_out_once(self):
+        self._prefetch()
+        result = self.prefetcher.take(1)
+        self.assertEqual([item.price for item in result.menu_items], [80])
+        self.assertIsNone(self.prefetcher.take(1))
+
+    def test_menu_change_from_another_process_drops_the_result(self):
+        self._prefetch()
+        with self._connect() as other:
+            other.execute("UPDATE menu_items SET price = 95 WHERE item_id = 1")
+        self.assertIsNone(self.prefetcher.take(1))
+
+    def test_new_review_drops_the_result(self):
+        self._prefetch()
+        with self._connect() as other:
+            other.execute("INSERT INTO reviews (user_id, restaurant_id, rating) VALUES (1, 1, 5)")
+        self.assertIsNone(self.prefetcher.take(1))
+
+    def test_stale_result_is_prefetched_again(self):
+        self._prefetch()
+        with self._connect() as other:
+            other.execute("UPDATE menu_items SET price = 95 WHERE item_id = 1")
+        self.assertFalse(self.prefetcher._results[1].fresh)
+        self._prefetch()
+        self.assertEqual([item.price for item in self.prefetcher.take(1).menu_items], [95])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from unittest import mock
+
+from gui_components import progressive_renderer
+from gui_components.progressive_renderer import ProgressiveRenderer
+
+class _FakeScheduler:
+    """Records call_later() jobs instead of arming Tk timers."""
+
+    def __init__(self):
+        self.pending = []
+
+    def call_later(self, owner, delay_ms, callback, *args):
+        job = (owner, callback, args)
+        self.pending.append(job)
+        return job
+
+    def cancel(self, job):
+        if job in self.pending:
+            self.pending.remove(job)
+
+    def run_next(self):
+        owner, callback, args = self.pending.pop(0)
+        callback(*args)
+
+class ProgressiveRendererTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = _FakeScheduler()
+        patch = mock.patch.object(progressive_renderer, "scheduler", self.scheduler)
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.widget = object()
+        self.rendered = []
+
+    def _renderer(self, count):
+        return ProgressiveRenderer(self.widget, list(range(count)), lambda start, batch: self.rendered.extend(batch),
+                                   name="test", first_batch=3, batch_size=2)
+
+    def test_remaining_slices_are_scheduler_jobs_owned_by_the_widget(self):
+        renderer = self._renderer(10).start()
+        self.assertEqual(self.rendered, [0, 1, 2])
+        self.assertEqual([job[0] for job in self.scheduler.pending], [self.widget])
+        while self.scheduler.pending:
+            self.scheduler.run_next()
+        self.assertEqual(self.rendered, list(range(10)))
+        self.assertTrue(renderer.done)
+        self.assertEqual(progressive_renderer.get_render_metrics("test")["rows"], 10)
+
+    def test_cancel_drops_the_pending_job(self):
+        renderer = self._renderer(10).start()
+        renderer.cancel()
+        self.assertEqual(self.scheduler.pending, [])
+        self.assertTrue(renderer.done)
+        self.assertEqual(self.rendered, [0, 1, 2])
+
+    def test_short_list_finishes_without_scheduling(self):
+        renderer = self._renderer(2).start()
+        self.assertTrue(renderer.done)
+        self.assertEqual(self.scheduler.pending, [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from utils import database, metrics
+from utils.migrations import VERSIONED_TABLES
+from utils.query_cache import QueryCache
+
+RESTAURANT_NAMES = "SELECT name FROM restaurants ORDER BY restaurant_id"
+
+def _names(rows):
+    return [row["name"] for row in rows]
+
+class _DatabaseTest(unittest.TestCase):
+    def setUp(self):
+        self._old_path = database.DATABASE_NAME
+        self._dir = tempfile.mkdtemp()
+        self.path = os.path.join(self._dir, "test.db")
+        database.set_database_path(self.path)
+        database.initialize_database()
+
+    def tearDown(self):
+        database.close_connections()
+        database.DATABASE_NAME = self._old_path
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _connect(self):
+        """A connection of its own, as another process would have."""
+        conn = sqlite3.connect(self.path)
+        self.addCleanup(conn.close)
+        return conn
+
+    def _versions(self):
+        conn = self._connect()
+        return dict(conn.execute("SELECT table_name, version FROM table_versions").fetchall())
+
+class TableVersionTriggerTest(_DatabaseTest):
+    def test_every_versioned_table_starts_tracked(self):
+        self.assertEqual(set(self._versions()), set(VERSIONED_TABLES))
+
+    def test_insert_update_and_delete_bump_the_table_version(self):
+        conn = self._connect()
+        start = self._versions()
+        with conn:
+            conn.execute("INSERT INTO restaurants (name) VALUES ('Dosa Point')")
+        self.assertEqual(self._versions()["restaurants"], start["restaurants"] + 1)
+        with conn:
+            conn.execute("UPDATE restaurants SET cuisine_type = 'South Indian' WHERE name = 'Dosa Point'")
+        self.assertEqual(self._versions()["restaurants"], start["restaurants"] + 2)
+        with conn:
+            conn.execute("DELETE FROM restaurants WHERE name = 'Dosa Point'")
+        after = self._versions()
+        self.assertEqual(after["restaurants"], start["restaurants"] + 3)
+        # Other tables are left alone
+        self.assertEqual(after["menu_items"], start["menu_items"])
+
+    def test_rolled_back_write_does_not_bump(self):
+        conn = self._connect()
+        start = self._versions()["restaurants"]
+        conn.execute("INSERT INTO restaurants (name) VALUES ('Dosa Point')")
+        conn.rollback()
+        self.assertEqual(self._versions()["restaurants"], start)
+
+class QueryCacheTest(_DatabaseTest):
+    def setUp(self):
+        super().setUp()
+        self.cache = QueryCache()
+        self.addCleanup(self.cache.close)
+        with self._connect() as conn:
+            conn.execute("INSERT INTO restaurants (name) VALUES ('Dosa Point')")
+
+    def _lookups(self, result):
+        return metrics.counter("swigato_query_cache_total", "Query cache lookups.", result=result).value
+
+    def test_repeated_read_is_served_from_the_cache(self):
+        first = self.cache.fetchall(RESTAURANT_NAMES, tables=("restaurants",))
+        hits = self._lookups("hit")
+        second = self.cache.fetchall(RESTAURANT_NAMES, tables=("restaurants",))
+        self.assertIs(second, first)
+        self.assertEqual(self._lookups("hit"), hits + 1)
+
+    def test_write_from_another_connection_drops_the_entry(self):
+        self.assertEqual(_names(self.cache.fetchall(RESTAURANT_NAMES, tables=("restaurants",))), ["Dosa Point"])
+        with self._connect() as other:
+            other.execute("INSERT INTO restaurants (name) VALUES ('Biryani House')")
+        misses = self._lookups("miss")
+        rows = self.cache.fetchall(RESTAURANT_NAMES, tables=("restaurants",))
+        self.assertEqual(_names(rows), ["Dosa Point", "Biryani House"])
+        self.assertEqual(self._lookups("miss"), misses + 1)
+
+    def test_write_to_an_unrelated_table_keeps_the_entry(self):
+        first = self.cache.fetchall(RESTAURANT_NAMES, tables=("restaurants",))
+        with self._connect() as other:
+            other.execute("INSERT INTO menu_items (restaurant_id, name, price) VALUES (1, 'Masala Dosa', 80)")
+        self.assertIs(self.cache.fetchall(RESTAURANT_NAMES, tables=("restaurants",)), first)
+
+    def test_untracked_database_bypasses_the_cache(self):
+        with self._connect() as other:
+            other.execute("DROP TABLE table_versions")
+        bypasses = self._lookups("bypass")
+        self.assertEqual(_names(self.cache.fetchall(RESTAURANT_NAMES, tables=("restaurants",))), ["Dosa Point"])
+        self.assertEqual(self._lookups("bypass"), bypasses + 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from gui_components import main_app_screen
+from gui_components.main_app_screen import RestaurantCard
+from gui_components.virtual_list import VirtualCardList
+
+class _FakeCanvas:
+    def itemconfigure(self, window, **options):
+        pass
+
+class _FakeScheduler:
+    """Records call_later() jobs instead of arming Tk timers."""
+
+    def __init__(self):
+        self.pending = []
+
+    def call_later(self, owner, delay_ms, callback, *args):
+        job = (callback, args)
+        self.pending.append(job)
+        return job
+
+    def cancel(self, job):
+        self.pending.remove(job)
+
+    def fire_all(self):
+        for callback, args in list(self.pending):
+            self.pending.remove((callback, args))
+            callback(*args)
+
+def _restaurant_card():
+    # No Tk display here: skip the widget constructor and set what the prefetch logic uses
+    card = object.__new__(RestaurantCard)
+    card.restaurant = None
+    card._prefetch_jobs = {}
+    return card
+
+def _virtual_list(rows):
+    virtual_list = object.__new__(VirtualCardList)
+    virtual_list.canvas = _FakeCanvas()
+    virtual_list._pool = {}
+    virtual_list._visible = {index: ("row", widget, index) for index, widget in enumerate(rows)}
+    return virtual_list
+
+class ReleasePrefetchTest(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = _FakeScheduler()
+        self.prefetcher = mock.Mock()
+        patches = [mock.patch.object(main_app_screen, "scheduler", self.scheduler),
+                   mock.patch.object(main_app_screen, "menu_prefetcher", self.prefetcher)]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_release_cancels_scheduled_visible_prefetch(self):
+        card = _restaurant_card()
+        card.restaurant = SimpleNamespace(restaurant_id=7)
+        card._schedule_prefetch("visible", 300)
+        self.assertEqual(len(self.scheduler.pending), 1)
+
+        virtual_list = _virtual_list([card])
+        virtual_list._release(0)
+
+        self.assertEqual(self.scheduler.pending, [])
+        self.assertEqual(card._prefetch_jobs, {})
+        self.assertEqual(virtual_list._pool["row"], [(card, 0)])
+        self.scheduler.fire_all()
+        self.prefetcher.prefetch.assert_not_called()
+
+    def test_release_cancels_started_prefetch(self):
+        card = _restaurant_card()
+        card.restaurant = SimpleNamespace(restaurant_id=7)
+        card._schedule_prefetch("visible", 300)
+        self.scheduler.fire_all()
+        self.prefetcher.prefetch.assert_called_once_with(7, "visible")
+
+        _virtual_list([card])._release(0)
+
+        self.prefetcher.cancel.assert_any_call(7, "visible")
+
+    def test_release_without_hook(self):
+        widget = SimpleNamespace()
+        virtual_list = _virtual_list([widget])
+        virtual_list._release(0)
+        self.assertEqual(virtual_list._pool["row"], [(widget, 0)])
+        self.assertEqual(virtual_list._visible, {})
+
+if __name__ == "__main__":
+    unittest.main()
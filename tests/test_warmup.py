@@ -0,0 +1,62 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+
+from restaurants.models import MenuItem, Restaurant
+from utils import database, metrics
+from utils.query_cache import query_cache
+from utils.warmup import WarmUp
+
+class WarmUpTest(unittest.TestCase):
+    def setUp(self):
+        self._old_path = database.DATABASE_NAME
+        self._dir = tempfile.mkdtemp()
+        self.path = os.path.join(self._dir, "test.db")
+        database.set_database_path(self.path)
+        database.initialize_database()
+        query_cache.clear()
+        with self._connect() as conn:
+            conn.execute("INSERT INTO restaurants (name) VALUES ('Dosa Point')")
+            conn.execute("INSERT INTO menu_items (restaurant_id, name, price) VALUES (1, 'Masala Dosa', 80)")
+
+    def tearDown(self):
+        query_cache.close()
+        database.close_connections()
+        database.DATABASE_NAME = self._old_path
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _connect(self):
+        """A connection of its own, as another process would have."""
+        conn = sqlite3.connect(self.path)
+        self.addCleanup(conn.close)
+        return conn
+
+    def _hits(self):
+        return metrics.counter("swigato_query_cache_total", "Query cache lookups.", result="hit").value
+
+    def _warm_up(self):
+        warmup = WarmUp()
+        warmup._run(None)
+        return warmup
+
+    def test_warmed_lists_are_served_from_the_query_cache(self):
+        warmup = self._warm_up()
+        self.assertEqual(warmup.coverage["restaurant list"], (1, 1))
+        self.assertEqual(warmup.coverage["menus"], (1, 1))
+        hits = self._hits()
+        Restaurant.get_all_with_stats()
+        MenuItem.get_for_restaurant(1)
+        self.assertEqual(self._hits(), hits + 2)
+
+    def test_change_from_another_process_is_not_served_stale(self):
+        self._warm_up()
+        with self._connect() as other:
+            other.execute("UPDATE menu_items SET price = 95 WHERE item_id = 1")
+            other.execute("INSERT INTO reviews (user_id, restaurant_id, rating) VALUES (1, 1, 5)")
+        self.assertEqual([item.price for item in MenuItem.get_for_restaurant(1)], [95])
+        self.assertEqual([r.review_count for r in Restaurant.get_all_with_stats()], [1])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+import unittest
+
+from utils import database, metrics
+from utils.write_queue import WriteQueue, is_busy_error
+
+def _insert_review(cursor, rating):
+    cursor.execute("INSERT INTO reviews (user_id, restaurant_id, rating) VALUES (1, 1, ?)", (rating,))
+    return cursor.lastrowid
+
+class WriteQueueTest(unittest.TestCase):
+    def setUp(self):
+        self._old_path = database.DATABASE_NAME
+        self._dir = tempfile.mkdtemp()
+        self.path = os.path.join(self._dir, "test.db")
+        database.set_database_path(self.path)
+        database.initialize_database()
+        self.queue = WriteQueue(base_delay=0.01, max_delay=0.05, max_retries=20)
+
+    def tearDown(self):
+        database.close_connections()
+        database.DATABASE_NAME = self._old_path
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+    def _hold_write_lock(self):
+        """A second connection, as another process would have, holding the write lock."""
+        other = sqlite3.connect(self.path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        self.addCleanup(other.close)
+        return other
+
+    def _review_count(self):
+        conn = sqlite3.connect(self.path)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM reviews").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_retries_with_backoff_while_another_connection_holds_the_lock(self):
+        other = self._hold_write_lock()
+        future = self.queue.submit(_insert_review, 4)
+        time.sleep(0.3)
+        self.assertFalse(future.done())
+        self.assertGreaterEqual(future.busy_retries, 3)
+        other.execute("COMMIT")
+        self.assertIsNotNone(future.result(timeout=5))
+        self.assertEqual(self._review_count(), 1)
+
+    def test_gives_up_after_max_retries_without_long_busy_waits(self):
+        self._hold_write_lock()
+        queue = WriteQueue(base_delay=0.01, max_delay=0.02, max_retries=3)
+        start = time.perf_counter()
+        future = queue.submit(_insert_review, 4)
+        error = future.exception(timeout=5)
+        elapsed = time.perf_counter() - start
+        self.assertTrue(is_busy_error(error), error)
+        self.assertEqual(future.busy_retries, 3)
+        # The backoff does the waiting, not SQLite's busy handler (5 s by default)
+        self.assertLess(elapsed, 1.0)
+
+    def test_pending_writes_share_one_commit(self):
+        other = self._hold_write_lock()
+        commits = metrics.counter("swigato_write_queue_commits_total", "Transactions committed by the write queue.")
+        before = commits.value
+        futures = [self.queue.submit(_insert_review, 1 + n % 5) for n in range(20)]
+        time.sleep(0.05)
+        other.execute("COMMIT")
+        for future in futures:
+            future.result(timeout=5)
+        self.assertEqual(self._review_count(), 20)
+        self.assertLessEqual(commits.value - before, 2)
+
+    def test_failing_job_is_rolled_back_alone(self):
+        bad = self.queue.submit(_insert_review, 9)  # Violates the rating CHECK constraint
+        good = self.queue.submit(_insert_review, 3)
+        self.assertIsInstance(bad.exception(timeout=5), sqlite3.IntegrityError)
+        self.assertIsNotNone(good.result(timeout=5))
+        self.assertEqual(self._review_count(), 1)
+
+if __name__ == "__main__":
+    unittest.main()
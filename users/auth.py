@@ -1,5 +1,6 @@
 from .models import User
 from utils.logger import log
+from utils import metrics
 from rich.console import Console
 
 console = Console()
@@ -29,7 +30,9 @@ def log_in(username, password):
     if user and user.verify_password(password):
         current_user_session = user
         log(f"User '{username}' (ID: {user.user_id}) logged in successfully.")
+        metrics.counter("swigato_logins_total", "Login attempts, by result.", result="success").inc()
         return user
+    metrics.counter("swigato_logins_total", "Login attempts, by result.", result="failure").inc()
     console.print("[red]Invalid username or password.[/red]") # Added this line
     log(f"Login failed for '{username}': Invalid username or password.")
     return None
@@ -6,6 +6,7 @@ from gui_Light import (BACKGROUND_COLOR, SUCCESS_COLOR, TEXT_COLOR, PRIMARY_COLO
 from utils.logger import log
 from utils.image_loader import load_image
 from cart.cart_ui import CartUtilities
+from gui_components.progressive_renderer import ProgressiveRenderer
 
 class FavoriteRestaurantCard(ctk.CTkFrame):
     """Card component for favorite restaurant"""
@@ -238,11 +239,15 @@ class FavoritesListComponent(ctk.CTkScrollableFrame):
         self.user = user
         self.app_ref = app_ref
         self.show_menu_callback = show_menu_callback
+        self.renderer = None
         
         self.grid_columnconfigure(0, weight=1)
         
     def load_favorites(self):
         """Load and display favorite restaurants and menu items with modern design"""
+        if self.renderer:
+            self.renderer.cancel()
+            self.renderer = None
         # Clear existing widgets
         for widget in self.winfo_children():
             widget.destroy()
@@ -251,7 +256,6 @@ class FavoritesListComponent(ctk.CTkScrollableFrame):
         fav_restaurants = self.user.get_favorite_restaurants()
         fav_menu_items = self.user.get_favorite_menu_items()
 
-        row = 0
 
         # Modern empty state
         if not fav_restaurants and not fav_menu_items:
@@ -290,49 +294,44 @@ class FavoritesListComponent(ctk.CTkScrollableFrame):
             empty_desc.pack(pady=(0, 30))
             return
 
-        # Favorite Restaurants Section
+        # Section headers and cards, rendered in order a few at a time
+        entries = []
         if fav_restaurants:
-            section_header = ctk.CTkLabel(
-                self,
-                text="🏪 Favorite Restaurants",
-                font=ctk.CTkFont(size=20, weight="bold"),
-                text_color=TEXT_COLOR,
-                anchor="w"
-            )
-            section_header.grid(row=row, column=0, sticky="ew", padx=20, pady=(20, 10))
-            row += 1
+            entries.append(("header", "🏪 Favorite Restaurants"))
+            entries.extend(("restaurant", rest) for rest in fav_restaurants)
+        if fav_menu_items:
+            entries.append(("header", "🍕 Favorite Dishes"))
+            entries.extend(("menu_item", item) for item in fav_menu_items)
+
+        self.renderer = ProgressiveRenderer(self, entries, self._render_entries, name="favorites").start()
 
-            for rest in fav_restaurants:
+    def _render_entries(self, start_row, entries):
+        for row, (kind, value) in enumerate(entries, start=start_row):
+            if kind == "header":
+                section_header = ctk.CTkLabel(
+                    self,
+                    text=value,
+                    font=ctk.CTkFont(size=20, weight="bold"),
+                    text_color=TEXT_COLOR,
+                    anchor="w"
+                )
+                section_header.grid(row=row, column=0, sticky="ew", padx=20, pady=(20, 10))
+            elif kind == "restaurant":
                 rest_card = FavoriteRestaurantCard(
                     self,
-                    restaurant=rest,
+                    restaurant=value,
                     show_menu_callback=self.show_menu_callback,
                     app_ref=self.app_ref
                 )
                 rest_card.grid(row=row, column=0, sticky="ew", padx=20, pady=(0, 10))
-                row += 1
-
-        # Favorite Menu Items Section
-        if fav_menu_items:
-            section_header = ctk.CTkLabel(
-                self,
-                text="🍕 Favorite Dishes",
-                font=ctk.CTkFont(size=20, weight="bold"),
-                text_color=TEXT_COLOR,
-                anchor="w"
-            )
-            section_header.grid(row=row, column=0, sticky="ew", padx=20, pady=(20, 10))
-            row += 1
-
-            for item in fav_menu_items:
+            else:
                 item_card = FavoriteMenuItemCard(
                     self,
-                    menu_item=item,
+                    menu_item=value,
                     app_ref=self.app_ref,
                     user=self.user
                 )
                 item_card.grid(row=row, column=0, sticky="ew", padx=20, pady=(0, 10))
-                row += 1
 
 
 class FavoritesWindow:
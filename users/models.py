@@ -1,7 +1,9 @@
 import bcrypt
 import sqlite3 # Import sqlite3 for exception handling
-from utils.database import get_db_connection
+from utils.database import get_read_connection, get_write_connection
 from utils.logger import log
+from utils import metrics
+from utils.write_queue import write_queue
 
 class User:
     def __init__(self, user_id, username, password_hash, address=None, email=None, phone=None, created_at=None, is_admin=False):
@@ -13,12 +15,15 @@ class User:
         self.phone = phone
         self.created_at = created_at # Should be set by DB or on creation
         self.is_admin = is_admin # Added is_admin
+        # Favorite IDs, loaded on first use and kept up to date by the add/remove methods
+        self._favorite_restaurant_ids = None
+        self._favorite_item_ids = None
 
     def __repr__(self):
         return f"<User {self.username} (ID: {self.user_id}) Admin: {self.is_admin}>" # Updated repr
     
     def update_address(self, new_address):
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("UPDATE users SET address = ? WHERE user_id = ?", (new_address, self.user_id))
@@ -34,7 +39,7 @@ class User:
 
     def update_email(self, new_email):
         """Updates the user's email in the database."""
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("UPDATE users SET email = ? WHERE user_id = ?", (new_email, self.user_id))
@@ -50,7 +55,7 @@ class User:
 
     def update_phone(self, new_phone):
         """Updates the user's phone number in the database."""
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("UPDATE users SET phone = ? WHERE user_id = ?", (new_phone, self.user_id))
@@ -66,7 +71,7 @@ class User:
 
     def update_username(self, new_username):
         """Updates the user's username in the database."""
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("UPDATE users SET username = ? WHERE user_id = ?", (new_username, self.user_id))
@@ -82,7 +87,7 @@ class User:
 
     def update_admin_status(self, new_admin_status: bool):
         """Updates the user's admin status in the database."""
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("UPDATE users SET is_admin = ? WHERE user_id = ?", (new_admin_status, self.user_id))
@@ -103,7 +108,7 @@ class User:
             return False # Or raise an error
 
         new_password_hash = bcrypt.hashpw(new_password.encode('utf-8'), bcrypt.gensalt())
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("UPDATE users SET password_hash = ? WHERE user_id = ?", 
@@ -122,7 +127,7 @@ class User:
     def create(username, password, address=None, email=None, phone=None, is_admin=False):
         """Creates a new user in the database."""
         password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("INSERT INTO users (username, password_hash, address, email, phone, is_admin) VALUES (?, ?, ?, ?, ?, ?)", 
@@ -144,7 +149,7 @@ class User:
     @staticmethod
     def get_by_username(username):
         """Retrieves a user by username from the database."""
-        conn = get_db_connection()
+        conn = get_read_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT user_id, username, password_hash, address, email, phone, created_at, is_admin FROM users WHERE username = ?", (username,))
@@ -164,7 +169,7 @@ class User:
     @staticmethod
     def get_by_id(user_id):
         """Retrieves a user by user_id from the database."""
-        conn = get_db_connection()
+        conn = get_read_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT user_id, username, password_hash, address, email, phone, created_at, is_admin FROM users WHERE user_id = ?", (user_id,))
@@ -184,7 +189,7 @@ class User:
     @staticmethod
     def get_all_users():
         """Retrieves all users from the database, ordered by user_id ascending.""" # Updated docstring
-        conn = get_db_connection()
+        conn = get_read_connection()
         cursor = conn.cursor()
         users = []
         try:
@@ -203,16 +208,92 @@ class User:
         finally:
             conn.close()
 
+    # Columns for user listings; password hashes are never loaded for these
+    LISTING_COLUMNS = "user_id, username, address, email, phone, created_at, is_admin"
+
+    @staticmethod
+    def search(term="", is_admin=None, cursor=None, limit=50):
+        """
+        Searches users for the admin listing, one page at a time.
+
+        term matches a user ID exactly, the start of a username (case-insensitive)
+        or a word in the address (full-text index when available, otherwise LIKE).
+        is_admin optionally restricts to admins (True) or non-admins (False).
+        Pages are ordered by user_id; pass the returned next_cursor to get the
+        following page. Returned users have password_hash set to None.
+
+        Returns:
+            tuple: (list of User, next_cursor or None when this is the last page)
+        """
+        conn = get_read_connection()
+        db_cursor = conn.cursor()
+        try:
+            conditions = []
+            params = []
+            term = (term or "").strip()
+            if term:
+                matches = ["(username COLLATE NOCASE >= ? AND username COLLATE NOCASE < ?)"]
+                params.extend([term, term + "\U0010ffff"])
+                if term.isdigit():
+                    matches.append("user_id = ?")
+                    params.append(int(term))
+                db_cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users_fts'")
+                if db_cursor.fetchone():
+                    matches.append("user_id IN (SELECT rowid FROM users_fts WHERE users_fts MATCH ?)")
+                    params.append('"' + term.replace('"', '""') + '"*')
+                else:
+                    matches.append("address LIKE ?")
+                    params.append(f"%{term}%")
+                conditions.append("(" + " OR ".join(matches) + ")")
+            if is_admin is not None:
+                conditions.append("is_admin = ?")
+                params.append(bool(is_admin))
+            if cursor is not None:
+                conditions.append("user_id > ?")
+                params.append(cursor)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            # One extra row tells us whether there is a next page
+            db_cursor.execute(f"SELECT {User.LISTING_COLUMNS} FROM users {where} ORDER BY user_id ASC LIMIT ?",
+                              params + [limit + 1])
+            rows = db_cursor.fetchall()
+            users = [User(user_id=row['user_id'], username=row['username'],
+                          password_hash=None, address=row['address'],
+                          email=row['email'], phone=row['phone'],
+                          created_at=row['created_at'], is_admin=row['is_admin'])
+                     for row in rows[:limit]]
+            next_cursor = users[-1].user_id if len(rows) > limit else None
+            return users, next_cursor
+        except Exception as e:
+            log(f"Error searching users for '{term}': {e}")
+            return [], None
+        finally:
+            conn.close()
+
+    @staticmethod
+    def count():
+        """Returns the number of users without loading them."""
+        conn = get_read_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT COUNT(*) FROM users")
+            return cursor.fetchone()[0]
+        except Exception as e:
+            log(f"Error counting users: {e}")
+            return 0
+        finally:
+            conn.close()
+
     def verify_password(self, password):
         """Verifies the given password against the stored hash."""
         if self.password_hash:
-            return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+            with metrics.histogram("swigato_password_verify_seconds", "Time spent in bcrypt password checks.").time():
+                return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
         return False
 
     @staticmethod
     def delete_by_username(username):
         """Deletes a user by username from the database."""
-        conn = get_db_connection()
+        conn = get_write_connection()
         cursor = conn.cursor()
         try:
             cursor.execute("SELECT user_id FROM users WHERE username = ?", (username,))
@@ -243,52 +324,71 @@ class User:
         finally:
             conn.close()
 
-    def add_favorite_restaurant(self, restaurant_id):
-        conn = get_db_connection()
+    def _ensure_favorite_ids(self):
+        """Loads this user's favorite restaurant and menu item IDs in one query, once per session."""
+        if self._favorite_restaurant_ids is not None:
+            return True
+        conn = get_read_connection()
         cursor = conn.cursor()
         try:
-            cursor.execute("INSERT OR IGNORE INTO user_favorites (user_id, restaurant_id, item_id) VALUES (?, ?, NULL)", (self.user_id, restaurant_id))
-            conn.commit()
+            cursor.execute("SELECT restaurant_id, item_id FROM user_favorites WHERE user_id = ?", (self.user_id,))
+            restaurant_ids, item_ids = set(), set()
+            for row in cursor.fetchall():
+                if row['item_id'] is not None:
+                    item_ids.add(row['item_id'])
+                elif row['restaurant_id'] is not None:
+                    restaurant_ids.add(row['restaurant_id'])
+            self._favorite_restaurant_ids = restaurant_ids
+            self._favorite_item_ids = item_ids
             return True
         except Exception as e:
-            log(f"Error adding favorite restaurant: {e}")
+            log(f"Error loading favorite IDs for user {self.user_id}: {e}")
             return False
         finally:
             conn.close()
 
-    def remove_favorite_restaurant(self, restaurant_id):
-        conn = get_db_connection()
-        cursor = conn.cursor()
+    def favorite_restaurant_ids(self):
+        return frozenset(self._favorite_restaurant_ids) if self._ensure_favorite_ids() else frozenset()
+
+    def favorite_item_ids(self):
+        return frozenset(self._favorite_item_ids) if self._ensure_favorite_ids() else frozenset()
+
+    def add_favorite_restaurant(self, restaurant_id):
         try:
-            cursor.execute("DELETE FROM user_favorites WHERE user_id = ? AND restaurant_id = ? AND item_id IS NULL", (self.user_id, restaurant_id))
-            conn.commit()
+            write_queue.execute("INSERT OR IGNORE INTO user_favorites (user_id, restaurant_id, item_id) VALUES (?, ?, NULL)", (self.user_id, restaurant_id))
+            if self._favorite_restaurant_ids is not None:
+                self._favorite_restaurant_ids.add(restaurant_id)
             return True
         except Exception as e:
-            log(f"Error removing favorite restaurant: {e}")
+            log(f"Error adding favorite restaurant: {e}")
             return False
-        finally:
-            conn.close()
 
-    def is_favorite_restaurant(self, restaurant_id):
-        conn = get_db_connection()
-        cursor = conn.cursor()
+    def remove_favorite_restaurant(self, restaurant_id):
         try:
-            cursor.execute("SELECT 1 FROM user_favorites WHERE user_id = ? AND restaurant_id = ? AND item_id IS NULL", (self.user_id, restaurant_id))
-            return cursor.fetchone() is not None
+            write_queue.execute("DELETE FROM user_favorites WHERE user_id = ? AND restaurant_id = ? AND item_id IS NULL", (self.user_id, restaurant_id))
+            if self._favorite_restaurant_ids is not None:
+                self._favorite_restaurant_ids.discard(restaurant_id)
+            return True
         except Exception as e:
-            log(f"Error checking favorite restaurant: {e}")
+            log(f"Error removing favorite restaurant: {e}")
             return False
-        finally:
-            conn.close()
+
+    def is_favorite_restaurant(self, restaurant_id):
+        return restaurant_id in self.favorite_restaurant_ids()
 
     def get_favorite_restaurants(self):
         from restaurants.models import Restaurant
-        conn = get_db_connection()
+        conn = get_read_connection()
         cursor = conn.cursor()
         try:
-            cursor.execute("SELECT DISTINCT restaurant_id FROM user_favorites WHERE user_id = ? AND restaurant_id IS NOT NULL", (self.user_id,))
-            rows = cursor.fetchall()
-            return [Restaurant.get_by_id(row[0]) for row in rows if row[0] is not None]
+            cursor.execute("""
+                SELECT r.* FROM user_favorites f
+                JOIN restaurants r ON r.restaurant_id = f.restaurant_id
+                WHERE f.user_id = ? AND f.restaurant_id IS NOT NULL
+                GROUP BY r.restaurant_id
+                ORDER BY MIN(f.favorite_id)
+            """, (self.user_id,))
+            return [Restaurant(**dict(row)) for row in cursor.fetchall()]
         except Exception as e:
             log(f"Error fetching favorite restaurants: {e}")
             return []
@@ -296,51 +396,41 @@ class User:
             conn.close()
 
     def add_favorite_menu_item(self, item_id):
-        conn = get_db_connection()
-        cursor = conn.cursor()
         try:
-            cursor.execute("INSERT OR IGNORE INTO user_favorites (user_id, restaurant_id, item_id) VALUES (?, NULL, ?)", (self.user_id, item_id))
-            conn.commit()
+            write_queue.execute("INSERT OR IGNORE INTO user_favorites (user_id, restaurant_id, item_id) VALUES (?, NULL, ?)", (self.user_id, item_id))
+            if self._favorite_item_ids is not None:
+                self._favorite_item_ids.add(item_id)
             return True
         except Exception as e:
             log(f"Error adding favorite menu item: {e}")
             return False
-        finally:
-            conn.close()
 
     def remove_favorite_menu_item(self, item_id):
-        conn = get_db_connection()
-        cursor = conn.cursor()
         try:
-            cursor.execute("DELETE FROM user_favorites WHERE user_id = ? AND item_id = ? AND restaurant_id IS NULL", (self.user_id, item_id))
-            conn.commit()
+            write_queue.execute("DELETE FROM user_favorites WHERE user_id = ? AND item_id = ? AND restaurant_id IS NULL", (self.user_id, item_id))
+            if self._favorite_item_ids is not None:
+                self._favorite_item_ids.discard(item_id)
             return True
         except Exception as e:
             log(f"Error removing favorite menu item: {e}")
             return False
-        finally:
-            conn.close()
 
     def is_favorite_menu_item(self, item_id):
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        try:
-            cursor.execute("SELECT 1 FROM user_favorites WHERE user_id = ? AND item_id = ? AND restaurant_id IS NULL", (self.user_id, item_id))
-            return cursor.fetchone() is not None
-        except Exception as e:
-            log(f"Error checking favorite menu item: {e}")
-            return False
-        finally:
-            conn.close()
+        return item_id in self.favorite_item_ids()
 
     def get_favorite_menu_items(self):
         from restaurants.models import MenuItem
-        conn = get_db_connection()
+        conn = get_read_connection()
         cursor = conn.cursor()
         try:
-            cursor.execute("SELECT DISTINCT item_id FROM user_favorites WHERE user_id = ? AND item_id IS NOT NULL", (self.user_id,))
-            rows = cursor.fetchall()
-            return [MenuItem.get_by_id(row[0]) for row in rows if row[0] is not None]
+            cursor.execute("""
+                SELECT m.* FROM user_favorites f
+                JOIN menu_items m ON m.item_id = f.item_id
+                WHERE f.user_id = ? AND f.item_id IS NOT NULL
+                GROUP BY m.item_id
+                ORDER BY MIN(f.favorite_id)
+            """, (self.user_id,))
+            return [MenuItem(**dict(row)) for row in cursor.fetchall()]
         except Exception as e:
             log(f"Error fetching favorite menu items: {e}")
             return []
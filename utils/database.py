@@ -1,212 +1,286 @@
+import atexit
+import functools
+import pathlib
 import sqlite3
 import os
+import threading
+import time
+import weakref
+from . import metrics
 from .logger import log
+from .migrations import apply_migrations, latest_version
+from .sql_trace import sql_tracer
 
 DATABASE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
-DATABASE_NAME = os.path.join(DATABASE_DIR, 'swigato.db')
+# SWIGATO_DB_PATH points the application at another database file, e.g. a generated one
+DATABASE_NAME = os.environ.get('SWIGATO_DB_PATH') or os.path.join(DATABASE_DIR, 'swigato.db')
+
+# Seconds a write outside utils.write_queue waits for another process's write lock (sqlite3's default)
+BUSY_TIMEOUT = 5.0
+
+# SQLite's default limit is 999 bound variables per statement; bulk updates bind IDs in chunks of this size
+MAX_BULK_IDS = 500
+
+_query_histograms = {}  # statement kind -> histogram, so the hot path skips the registry lookup
+
+def _observe_query(sql, seconds, failed):
+    kind = sql.lstrip().split(None, 1)[0].lower() if sql.strip() else "empty"
+    histogram = _query_histograms.get(kind)
+    if histogram is None:
+        histogram = _query_histograms[kind] = metrics.histogram(
+            "swigato_db_query_seconds", "Time spent in cursor.execute(), by statement kind.", statement=kind)
+    histogram.observe(seconds)
+    if failed:
+        metrics.counter("swigato_db_errors_total", "Statements that raised an SQLite error.", statement=kind).inc()
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that records statement timings in the metrics registry."""
+
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = super().execute(sql, parameters)
+            failed = False
+            return result
+        finally:
+            _observe_query(sql, time.perf_counter() - start, failed)
+
+    def executemany(self, sql, seq_of_parameters):
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = super().executemany(sql, seq_of_parameters)
+            failed = False
+            return result
+        finally:
+            _observe_query(sql, time.perf_counter() - start, failed)
+
+class InstrumentedConnection(sqlite3.Connection):
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    # The Connection shortcut creates its cursor internally, so route it through cursor()
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+_connection_factory = InstrumentedConnection
+
+class _ReaderRole:
+    """
+    A thread's read-only connection (see get_read_connection). close() keeps it
+    open for the thread's next read; discard() really closes it.
+    """
+    database_path = None
+    discarded = False
+
+    def close(self):
+        if self.in_transaction:
+            self.rollback()  # Don't pin an old WAL snapshot until the next read
+
+    def discard(self):
+        self.discarded = True
+        super().close()
+
+class _WriterRole:
+    """
+    The process's writer connection (see get_write_connection). close() hands
+    it back to the next writer, rolling back whatever the borrower left
+    uncommitted; discard() really closes it.
+    """
+    database_path = None
+    borrows = 0
+    owner = None  # Ident of the borrowing thread
+    busy_timeout = None  # Seconds SQLite waits for another process's lock, set per borrow
+
+    def close(self):
+        self.borrows -= 1
+        try:
+            if self.borrows == 0:
+                self.owner = None
+                if self.in_transaction:
+                    self.rollback()
+        finally:
+            _writer_lock.release()
+
+    def discard(self):
+        super().close()
+
+_local = threading.local()  # .reader: this thread's read-only connection
+_readers = weakref.WeakSet()  # Every thread's reader, so close_connections() can reach them
+_writer = None
+_writer_lock = threading.RLock()  # Held while a thread has borrowed _writer
+
+def set_database_path(path):
+    """Points every later get_db_connection() call at another database file (benchmarks, load tests)."""
+    global DATABASE_NAME
+    DATABASE_NAME = os.path.abspath(path)
+    log(f"Database path set to {DATABASE_NAME}")
+
+def set_connection_factory(factory):
+    """Makes get_db_connection() create factory instances (an InstrumentedConnection subclass); None restores the default."""
+    global _connection_factory
+    _connection_factory = factory or InstrumentedConnection
+
+@functools.lru_cache(maxsize=None)
+def _role_class(role, base):
+    return type(f"{role.__name__.lstrip('_').replace('Role', '')}{base.__name__}", (role, base), {})
+
+def _connect(database, role=None, **kwargs):
+    if sql_tracer.enabled:
+        return sql_tracer.connect(database, role=role, **kwargs)  # Profiling mode, see utils/sql_trace.py
+    factory = _connection_factory if role is None else _role_class(role, _connection_factory)
+    return sqlite3.connect(database, factory=factory, **kwargs)
 
 def get_db_connection():
-    """Establishes a connection to the SQLite database."""
-    if not os.path.exists(DATABASE_DIR):
-        os.makedirs(DATABASE_DIR)
-        log(f"Created database directory: {DATABASE_DIR}")
-    conn = sqlite3.connect(DATABASE_NAME)
+    """
+    Establishes a general-purpose connection to the SQLite database.
+
+    Model code reads through get_read_connection() and writes through
+    get_write_connection(); this is for schema changes and one-off scripts.
+    """
+    database_dir = os.path.dirname(DATABASE_NAME)
+    if not os.path.exists(database_dir):
+        os.makedirs(database_dir)
+        log(f"Created database directory: {database_dir}")
+    conn = _connect(DATABASE_NAME)
+    metrics.counter("swigato_db_connections_total", "Connections opened by get_db_connection().").inc()
     conn.row_factory = sqlite3.Row # Access columns by name
     log(f"Database connection established to {DATABASE_NAME}")
     return conn
 
+def get_read_connection():
+    """
+    Returns this thread's read-only connection, opening it on first use.
+
+    It is opened through a mode=ro URI with PRAGMA query_only set, so it never
+    takes the write lock; in WAL mode its reads run alongside the writer
+    instead of queueing behind it. No transaction is held between statements,
+    so every read sees the latest committed data. close() leaves the
+    connection open for the thread's next read.
+    """
+    conn = getattr(_local, "reader", None)
+    if conn is not None and conn.discarded:
+        conn = None  # Closed by close_connections()
+    if conn is not None and conn.database_path != DATABASE_NAME:
+        conn.discard()  # Pointed at another database since (benchmarks, load tests)
+        conn = None
+    if conn is None:
+        uri = pathlib.Path(os.path.abspath(DATABASE_NAME)).as_uri() + "?mode=ro"
+        # Only this thread uses it; the check is off so close_connections() may close it from another thread
+        conn = _connect(uri, role=_ReaderRole, uri=True, check_same_thread=False)
+        conn.execute("PRAGMA query_only = ON")
+        conn.row_factory = sqlite3.Row
+        conn.database_path = DATABASE_NAME
+        _local.reader = conn
+        _readers.add(conn)
+        metrics.counter("swigato_db_role_connections_total", "Reader and writer connections opened.", role="read").inc()
+        log(f"Read-only database connection for {threading.current_thread().name} established to {DATABASE_NAME}")
+    return conn
+
+def get_write_connection(busy_timeout=BUSY_TIMEOUT):
+    """
+    Borrows the process's single writer connection, waiting while another thread has it.
+
+    Writes from every thread take turns on this one connection, so they never
+    fight each other for SQLite's write lock, only other processes. While
+    another process holds it, statements wait inside SQLite for up to
+    busy_timeout seconds before raising SQLITE_BUSY; utils.write_queue passes
+    a few milliseconds and does its own backoff. Transactions start with BEGIN
+    IMMEDIATE, so one that reads before it writes is never refused halfway
+    through. The borrower must close() the connection to hand it back;
+    anything left uncommitted is rolled back then. A thread may borrow it
+    again while holding it, sharing the transaction (and busy timeout).
+    """
+    global _writer
+    _writer_lock.acquire()
+    try:
+        if _writer is not None and _writer.database_path != DATABASE_NAME:
+            _writer.discard()
+            _writer = None
+        if _writer is None:
+            database_dir = os.path.dirname(DATABASE_NAME)
+            if not os.path.exists(database_dir):
+                os.makedirs(database_dir)
+            conn = _connect(DATABASE_NAME, role=_WriterRole, check_same_thread=False, isolation_level="IMMEDIATE",
+                            timeout=busy_timeout)
+            conn.row_factory = sqlite3.Row
+            conn.database_path = DATABASE_NAME
+            conn.busy_timeout = busy_timeout
+            _writer = conn
+            metrics.counter("swigato_db_role_connections_total", "Reader and writer connections opened.", role="write").inc()
+            log(f"Writer database connection established to {DATABASE_NAME}")
+        if _writer.borrows == 0 and _writer.busy_timeout != busy_timeout:
+            _writer.execute(f"PRAGMA busy_timeout = {int(busy_timeout * 1000)}")
+            _writer.busy_timeout = busy_timeout
+        _writer.borrows += 1
+        _writer.owner = threading.get_ident()
+        return _writer
+    except BaseException:
+        _writer_lock.release()
+        raise
+
+def close_connections():
+    """
+    Really closes every thread's reader and the writer, checkpointing the WAL first.
+
+    Once the last connection to a WAL database is closed, SQLite folds the
+    -wal file back into the database and removes it along with the -shm file,
+    so call this before copying or replacing the database file. Runs at exit.
+    Later reads and writes open new connections.
+    """
+    global _writer
+    readers = [reader for reader in list(_readers) if not reader.discarded]
+    for reader in readers:
+        reader.discard()
+    _readers.clear()
+    with _writer_lock:
+        writer, _writer = _writer, None
+        if writer is None and readers and os.path.exists(DATABASE_NAME):
+            # A read-only connection cannot checkpoint, so let a writable one be the last to close
+            writer = sqlite3.connect(DATABASE_NAME)
+        if writer is not None:
+            try:
+                writer.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error as e:
+                log(f"WAL checkpoint before closing the writer failed: {e}")
+            if isinstance(writer, _WriterRole):
+                writer.discard()
+            else:
+                writer.close()
+
+atexit.register(close_connections)
+
+def holds_write_connection():
+    """True while the current thread has borrowed the writer connection (and so must not wait for another writer)."""
+    writer = _writer
+    return writer is not None and writer.owner == threading.get_ident()
+
+def id_chunks(ids):
+    """Splits ids into lists small enough to bind in one `IN (...)` clause."""
+    ids = list(ids)
+    return [ids[i:i + MAX_BULK_IDS] for i in range(0, len(ids), MAX_BULK_IDS)]
+
 def initialize_database():
-    """Initializes all tables in the database if they don't exist."""
-    log("Initializing database tables...")
-    init_users_table()
-    init_restaurants_table()
-    init_menu_items_table()
-    init_reviews_table()
-    init_orders_table()
-    init_order_items_table()
-    init_user_favorites_table()
-    log("Database initialization complete.")
-
-    # Create a default admin user if one doesn't exist
-    create_default_admin_user()
-
-def init_users_table():
-    """Initializes the users table."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS users (
-            user_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            username TEXT UNIQUE NOT NULL,
-            password_hash TEXT NOT NULL,
-            address TEXT,
-            is_admin BOOLEAN DEFAULT FALSE, -- Added is_admin field
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    conn.commit()
-    conn.close()
-    log("Users table initialized.")
-
-def init_restaurants_table():
-    """Initializes the restaurants table."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS restaurants (
-            restaurant_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            cuisine_type TEXT,
-            address TEXT,
-            description TEXT, -- Added description column
-            image_filename TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-    conn.commit()
-    conn.close()
-    log("Restaurants table initialized (with description).")
-
-def init_menu_items_table():
-    """Initializes the menu_items table."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS menu_items (
-            item_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            restaurant_id INTEGER NOT NULL,
-            name TEXT NOT NULL,
-            description TEXT,
-            price REAL NOT NULL,
-            category TEXT,
-            image_filename TEXT, -- Added image_filename column
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (restaurant_id) REFERENCES restaurants (restaurant_id)
-        )
-    ''')
-    # Add an index for faster lookups by restaurant_id
-    cursor.execute('''
-        CREATE INDEX IF NOT EXISTS idx_menu_items_restaurant_id ON menu_items (restaurant_id);
-    ''')
-    conn.commit()
-    conn.close()
-    log("Menu items table initialized.")
-
-def init_reviews_table():
-    """Initializes the reviews table."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS reviews (
-            review_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            restaurant_id INTEGER NOT NULL,
-            rating INTEGER NOT NULL CHECK (rating >= 1 AND rating <= 5),
-            comment TEXT,
-            username TEXT, -- Denormalized for easier display, could also join with users
-            review_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES users (user_id),
-            FOREIGN KEY (restaurant_id) REFERENCES restaurants (restaurant_id)
-        )
-    ''')
-    # Add indexes
-    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_reviews_user_id ON reviews (user_id);''')
-    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_reviews_restaurant_id ON reviews (restaurant_id);''')
-    conn.commit()
-    conn.close()
-    log("Reviews table initialized.")
-
-def init_orders_table():
-    """Initializes the orders table."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS orders (
-            order_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER, -- Can be NULL for guest orders
-            restaurant_id INTEGER NOT NULL,
-            restaurant_name TEXT, -- Denormalized for convenience
-            total_amount REAL NOT NULL,
-            status TEXT DEFAULT 'Pending',
-            order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            delivery_address TEXT,
-            FOREIGN KEY (user_id) REFERENCES users (user_id),
-            FOREIGN KEY (restaurant_id) REFERENCES restaurants (restaurant_id) 
-        )
-    ''')
-    # Add indexes
-    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_orders_user_id ON orders (user_id);''')
-    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_orders_restaurant_id ON orders (restaurant_id);''')
-    conn.commit()
-    conn.close()
-    log("Orders table initialized.")
-
-def init_order_items_table():
-    """Initializes the order_items table to store items for each order."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS order_items (
-            order_item_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            order_id INTEGER NOT NULL,
-            item_id INTEGER, -- Renamed from menu_item_id to item_id
-            name TEXT NOT NULL,
-            quantity INTEGER NOT NULL,
-            price REAL NOT NULL, -- Price at the time of order
-            FOREIGN KEY (order_id) REFERENCES orders (order_id)
-            -- FOREIGN KEY (item_id) REFERENCES menu_items (item_id) -- Optional
-        )
-    ''')
-    # Add index
-    cursor.execute('''CREATE INDEX IF NOT EXISTS idx_order_items_order_id ON order_items (order_id);''')
-    conn.commit()
-    conn.close()
-    log("Order items table initialized.")
-
-def init_user_favorites_table():
-    """Initializes the user_favorites table for storing user favorites (restaurants and menu items)."""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS user_favorites (
-            favorite_id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            restaurant_id INTEGER,
-            item_id INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            UNIQUE(user_id, restaurant_id, item_id),
-            FOREIGN KEY (user_id) REFERENCES users (user_id),
-            FOREIGN KEY (restaurant_id) REFERENCES restaurants (restaurant_id),
-            FOREIGN KEY (item_id) REFERENCES menu_items (item_id)
-        )
-    ''')
-    conn.commit()
-    conn.close()
-    log("User favorites table initialized.")
-
-def create_default_admin_user():
-    """Creates a default admin user if no admin users exist."""
-    from users.models import User # Local import to avoid circular dependency if User model imports from database directly
+    """
+    Brings the database schema up to date using the versioned migrations in utils.migrations.
+
+    All pending migrations (tables, indexes, legacy columns and the default admin user)
+    run in a single transaction on one connection. When the schema is already current
+    this is a single version check, plus making sure the database is in WAL mode.
+    """
     conn = get_db_connection()
-    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT user_id FROM users WHERE is_admin = TRUE LIMIT 1")
-        admin_exists = cursor.fetchone()
-        if not admin_exists:
-            default_admin_username = os.environ.get('SWIGATO_ADMIN_USER', 'admin')
-            default_admin_password = os.environ.get('SWIGATO_ADMIN_PASS', 'admin123')
-            # Use User.create to ensure hashing and correct insertion
-            admin_user = User.create(username=default_admin_username, password=default_admin_password, address="Admin HQ", is_admin=True)
-            if admin_user:
-                log(f"Default admin user '{default_admin_username}' created successfully.")
-            else:
-                log(f"Failed to create default admin user '{default_admin_username}'.")
+        applied = apply_migrations(conn)
+        if applied:
+            log(f"Database initialization complete ({applied} migration(s) applied).")
         else:
-            log("Admin user already exists. Skipping default admin creation.")
-    except sqlite3.Error as e:
-        log(f"Database error during default admin user creation check: {e}")
-    except Exception as e:
-        log(f"Unexpected error during default admin creation: {e}")
+            log(f"Database schema is current (version {latest_version()}).")
+        # WAL lets the read-only connections read while the writer commits; the mode is stored in the file
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+        except sqlite3.OperationalError as e:
+            log(f"Could not switch the database to WAL mode, readers will wait for writers: {e}")
     finally:
         conn.close()
 
@@ -0,0 +1,256 @@
+import argparse
+import bisect
+import datetime
+import itertools
+import os
+import random
+import sqlite3
+import sys
+import time
+
+# Add project root to sys.path so the module can also be run as a script
+_PROJ_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _PROJ_ROOT not in sys.path:
+    sys.path.insert(0, _PROJ_ROOT)
+
+import bcrypt
+
+from utils import database
+from utils.logger import log
+
+DEFAULT_PASSWORD = "swigato123"
+CHUNK_ORDERS = 50_000 # Orders generated and inserted per batch, to bound memory use
+
+# Dataset presets, named after the number of orders
+PRESETS = {
+    "1k": {"users": 200, "restaurants": 20, "items_per_restaurant": 15, "orders": 1_000, "reviews": 500, "favorites_per_user": 2},
+    "100k": {"users": 10_000, "restaurants": 500, "items_per_restaurant": 20, "orders": 100_000, "reviews": 50_000, "favorites_per_user": 3},
+    "1m": {"users": 100_000, "restaurants": 2_000, "items_per_restaurant": 25, "orders": 1_000_000, "reviews": 500_000, "favorites_per_user": 3},
+}
+
+CUISINES = ["North Indian", "South Indian", "Chinese", "Italian", "Mexican", "Cafe", "Desserts", "Street Food", "Biryani", "Fast Food"]
+DISHES = ["Paneer Tikka", "Chicken Biryani", "Masala Dosa", "Veg Hakka Noodles", "Margherita Pizza", "Chicken Burrito",
+          "Cold Coffee", "Gulab Jamun", "Pav Bhaji", "Butter Chicken", "Idli Sambar", "Pasta Alfredo", "Dal Makhani",
+          "Chole Bhature", "Veg Manchurian", "Tandoori Roti", "Mango Lassi", "Chicken Momos", "Rasmalai", "Aloo Paratha"]
+CATEGORIES = ["Starters", "Main Course", "Breads", "Beverages", "Desserts"]
+CITIES = ["Jabalpur", "Bhopal", "Indore", "Pune", "Bengaluru", "Delhi", "Mumbai", "Hyderabad"]
+STATUSES = ["Pending Confirmation", "Preparing", "Out for Delivery", "Delivered", "Cancelled"]
+STATUS_WEIGHTS = [2, 2, 2, 90, 4]
+REVIEW_COMMENTS = ["Loved it!", "Food arrived hot and fresh.", "Decent, a bit too spicy.", "Portion could be bigger.",
+                   "Will order again.", "Delivery took too long.", "Best biryani in town.", ""]
+
+# Share of orders per hour of the day: quiet mornings, a lunch peak and a bigger dinner peak
+HOURLY_ORDER_WEIGHTS = [1, 0.5, 0.3, 0.2, 0.2, 0.3, 0.8, 1.5, 2.5, 3, 3, 4.5,
+                        8, 9, 6, 3, 2.5, 3, 4.5, 7, 10, 9, 6, 3]
+# Distinct dishes per order (1..8) and quantity per dish (1..4)
+BASKET_SIZE_WEIGHTS = [30, 28, 18, 11, 6, 4, 2, 1]
+QUANTITY_WEIGHTS = [75, 18, 5, 2]
+RATING_WEIGHTS = [5, 7, 15, 35, 38]
+
+def zipf_cum_weights(n, exponent=1.0):
+    """Cumulative weights of a Zipf distribution over n ranks, for random.choices(cum_weights=...)."""
+    return list(itertools.accumulate(1.0 / (rank ** exponent) for rank in range(1, n + 1)))
+
+def generate(path, users, restaurants, items_per_restaurant, orders, reviews, favorites_per_user=3,
+             seed=42, end_date=datetime.date(2025, 1, 1), days=365, password=DEFAULT_PASSWORD):
+    """
+    Fills the database at path with a synthetic dataset and returns the number of rows per table.
+
+    The schema is created (or migrated) first. Restaurant popularity, the users
+    placing orders and the dishes picked within a restaurant follow Zipf
+    distributions; basket sizes, quantities, order hours and review ratings
+    follow the weight tables above. The same arguments and seed always produce
+    the same data. All rows are written with bulk inserts in one transaction.
+    """
+    rng = random.Random(seed)
+    database.set_database_path(path)
+    database.initialize_database()
+
+    # Hashing is deliberately slow, so every generated user shares one hash
+    password_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+    start_date = end_date - datetime.timedelta(days=days)
+    day_strings = [(start_date + datetime.timedelta(days=day)).isoformat() for day in range(days)]
+    created_at = f"{start_date.isoformat()} 00:00:00" # Fixed so the output only depends on the seed
+    counts = {}
+
+    conn = sqlite3.connect(path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA synchronous = OFF")
+        cursor.execute("PRAGMA journal_mode = MEMORY")
+        cursor.execute("PRAGMA cache_size = -200000")
+        cursor.execute("BEGIN")
+        # Secondary indexes are cheaper to build once at the end than to maintain row by row
+        bulk_tables = ("orders", "order_items", "reviews", "user_favorites")
+        deferred_indexes = cursor.execute(
+            f"SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL "
+            f"AND tbl_name IN ({', '.join('?' * len(bulk_tables))})", bulk_tables).fetchall()
+        for name, _ in deferred_indexes:
+            cursor.execute(f'DROP INDEX "{name}"')
+        # Likewise the per-row table version bumps (migration 6); one bump per table at the end is enough
+        deferred_triggers = cursor.execute(
+            r"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%\_version\_%' ESCAPE '\'").fetchall()
+        for name, _ in deferred_triggers:
+            cursor.execute(f'DROP TRIGGER "{name}"')
+
+        # --- Users ---
+        first_user_id = (cursor.execute("SELECT COALESCE(MAX(user_id), 0) FROM users").fetchone()[0]) + 1
+        user_rows = [(first_user_id + n, f"user_{seed}_{n}", password_hash,
+                      f"{rng.randint(1, 999)} Main Road, {rng.choice(CITIES)}",
+                      f"user_{seed}_{n}@example.com", f"9{rng.randrange(10 ** 9):09d}", created_at)
+                     for n in range(users)]
+        cursor.executemany("INSERT INTO users (user_id, username, password_hash, address, email, phone, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                           user_rows)
+        counts["users"] = users
+        user_ids = [row[0] for row in user_rows]
+        user_names = {row[0]: row[1] for row in user_rows}
+        user_addresses = {row[0]: row[3] for row in user_rows}
+        del user_rows
+
+        # --- Restaurants and menus ---
+        first_restaurant_id = (cursor.execute("SELECT COALESCE(MAX(restaurant_id), 0) FROM restaurants").fetchone()[0]) + 1
+        restaurant_rows = [(first_restaurant_id + n, f"{rng.choice(CUISINES)} House {n}", rng.choice(CUISINES),
+                            f"{rng.randint(1, 999)} Food Street, {rng.choice(CITIES)}", "Generated restaurant.", created_at)
+                           for n in range(restaurants)]
+        cursor.executemany("INSERT INTO restaurants (restaurant_id, name, cuisine_type, address, description, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                           restaurant_rows)
+        counts["restaurants"] = restaurants
+
+        first_item_id = (cursor.execute("SELECT COALESCE(MAX(item_id), 0) FROM menu_items").fetchone()[0]) + 1
+        menus = []  # Per restaurant (same order as restaurant_rows): [(item_id, name, price), ...]
+        item_rows = []
+        next_item_id = first_item_id
+        for restaurant_id, *_ in restaurant_rows:
+            menu = []
+            for dish in rng.sample(DISHES * (items_per_restaurant // len(DISHES) + 1), items_per_restaurant):
+                price = float(rng.randrange(60, 650, 10))
+                menu.append((next_item_id, dish, price))
+                item_rows.append((next_item_id, restaurant_id, dish, f"House special {dish.lower()}.", price, rng.choice(CATEGORIES), created_at))
+                next_item_id += 1
+            menus.append(menu)
+        cursor.executemany("INSERT INTO menu_items (item_id, restaurant_id, name, description, price, category, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                           item_rows)
+        counts["menu_items"] = len(item_rows)
+        del item_rows
+
+        # --- Orders and order items, generated in chunks ---
+        restaurant_cum = zipf_cum_weights(restaurants, 1.07)
+        user_cum = zipf_cum_weights(users, 0.8)
+        dish_cum = zipf_cum_weights(items_per_restaurant, 0.9)
+        hour_cum = list(itertools.accumulate(HOURLY_ORDER_WEIGHTS))
+        basket_cum = list(itertools.accumulate(BASKET_SIZE_WEIGHTS))
+        quantity_cum = list(itertools.accumulate(QUANTITY_WEIGHTS))
+        status_cum = list(itertools.accumulate(STATUS_WEIGHTS))
+        restaurant_indexes = range(restaurants)
+        # Users are shuffled so the heaviest customers are not simply the lowest ids
+        shuffled_user_ids = user_ids[:]
+        rng.shuffle(shuffled_user_ids)
+        first_order_id = (cursor.execute("SELECT COALESCE(MAX(order_id), 0) FROM orders").fetchone()[0]) + 1
+        sampled_orders = []  # (user_id, restaurant_id, order_date) of orders that get a review
+        review_probability = min(1.0, reviews / orders) if orders else 0.0
+        counts["order_items"] = 0
+        next_random = rng.random
+        clock_strings = [f"{minute:02d}:{second:02d}" for minute in range(60) for second in range(60)]
+        dish_total, quantity_total = dish_cum[-1], quantity_cum[-1]
+
+        for chunk_start in range(0, orders, CHUNK_ORDERS):
+            chunk = min(CHUNK_ORDERS, orders - chunk_start)
+            restaurant_picks = rng.choices(restaurant_indexes, cum_weights=restaurant_cum, k=chunk)
+            user_picks = rng.choices(shuffled_user_ids, cum_weights=user_cum, k=chunk)
+            hours = rng.choices(range(24), cum_weights=hour_cum, k=chunk)
+            basket_sizes = rng.choices(range(1, len(BASKET_SIZE_WEIGHTS) + 1), cum_weights=basket_cum, k=chunk)
+            statuses = rng.choices(STATUSES, cum_weights=status_cum, k=chunk)
+            order_rows, order_item_rows = [], []
+            for n in range(chunk):
+                order_id = first_order_id + chunk_start + n
+                restaurant_index = restaurant_picks[n]
+                restaurant_id, restaurant_name = restaurant_rows[restaurant_index][:2]
+                menu = menus[restaurant_index]
+                basket = set(bisect.bisect_left(dish_cum, next_random() * dish_total)
+                             for _ in range(min(basket_sizes[n], len(menu))))
+                total = 0.0
+                for dish_index in basket:
+                    item_id, name, price = menu[dish_index]
+                    quantity = bisect.bisect_left(quantity_cum, next_random() * quantity_total) + 1
+                    total += price * quantity
+                    order_item_rows.append((order_id, item_id, name, quantity, price))
+                user_id = user_picks[n]
+                order_date = f"{day_strings[int(next_random() * days)]} {hours[n]:02d}:{clock_strings[int(next_random() * 3600)]}"
+                order_rows.append((order_id, user_id, restaurant_id, restaurant_name, round(total, 2), statuses[n],
+                                   order_date, user_addresses[user_id]))
+                if statuses[n] == "Delivered" and next_random() < review_probability:
+                    sampled_orders.append((user_id, restaurant_id, order_date))
+            cursor.executemany("INSERT INTO orders (order_id, user_id, restaurant_id, restaurant_name, total_amount, status, order_date, delivery_address) "
+                               "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", order_rows)
+            cursor.executemany("INSERT INTO order_items (order_id, item_id, name, quantity, price) VALUES (?, ?, ?, ?, ?)",
+                               order_item_rows)
+            counts["order_items"] += len(order_item_rows)
+        counts["orders"] = orders
+
+        # --- Reviews, written after delivered orders ---
+        # Delivered orders are ~90% of all orders, so top up from random orders if the sample fell short
+        while len(sampled_orders) < reviews and orders:
+            restaurant_index = rng.choices(restaurant_indexes, cum_weights=restaurant_cum)[0]
+            sampled_orders.append((rng.choice(user_ids), restaurant_rows[restaurant_index][0],
+                                   f"{day_strings[rng.randrange(days)]} {rng.randrange(24):02d}:{rng.randrange(60):02d}:00"))
+        ratings = rng.choices(range(1, 6), weights=RATING_WEIGHTS, k=reviews)
+        cursor.executemany("INSERT INTO reviews (user_id, username, restaurant_id, rating, comment, review_date) VALUES (?, ?, ?, ?, ?, ?)",
+                           ((user_id, user_names[user_id], restaurant_id, ratings[n], rng.choice(REVIEW_COMMENTS),
+                             order_date[:-5] + "59:59") # End of the hour the order was placed
+                            for n, (user_id, restaurant_id, order_date) in enumerate(sampled_orders[:reviews])))
+        counts["reviews"] = min(reviews, len(sampled_orders))
+
+        # --- Favorites: a few popular restaurants and dishes per user ---
+        favorite_rows = set()
+        for user_id in user_ids:
+            for restaurant_index in rng.choices(restaurant_indexes, cum_weights=restaurant_cum, k=favorites_per_user):
+                favorite_rows.add((user_id, restaurant_rows[restaurant_index][0], None, created_at))
+                favorite_rows.add((user_id, None, rng.choice(menus[restaurant_index])[0], created_at))
+        cursor.executemany("INSERT OR IGNORE INTO user_favorites (user_id, restaurant_id, item_id, created_at) VALUES (?, ?, ?, ?)",
+                           sorted(favorite_rows, key=lambda row: (row[0], row[1] or 0, row[2] or 0)))
+        counts["user_favorites"] = len(favorite_rows)
+
+        for _, index_sql in deferred_indexes:
+            cursor.execute(index_sql)
+        for _, trigger_sql in deferred_triggers:
+            cursor.execute(trigger_sql)
+        if deferred_triggers:
+            cursor.execute("UPDATE table_versions SET version = version + 1")
+        conn.commit()
+        cursor.execute("ANALYZE")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    log(f"Generated dataset in {path}: {counts}")
+    return counts
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic Swigato dataset.")
+    parser.add_argument("output", help="Database file to fill (created if missing).")
+    parser.add_argument("--preset", choices=list(PRESETS), default="1k", help="Dataset size preset (default: 1k).")
+    parser.add_argument("--users", type=int, help="Override the preset's number of users.")
+    parser.add_argument("--restaurants", type=int, help="Override the preset's number of restaurants.")
+    parser.add_argument("--items-per-restaurant", type=int, help="Override the preset's menu size.")
+    parser.add_argument("--orders", type=int, help="Override the preset's number of orders.")
+    parser.add_argument("--reviews", type=int, help="Override the preset's number of reviews.")
+    parser.add_argument("--favorites-per-user", type=int, help="Override the preset's favorites per user.")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed; the same seed gives the same data.")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="Password of every generated user.")
+    parser.add_argument("--force", action="store_true", help="Delete the output file first if it exists.")
+    return parser.parse_args(argv)
+
+if __name__ == "__main__":
+    args = parse_args()
+    spec = dict(PRESETS[args.preset])
+    for key in spec:
+        if getattr(args, key) is not None:
+            spec[key] = getattr(args, key)
+    if os.path.exists(args.output):
+        if not args.force:
+            sys.exit(f"{args.output} already exists; pass --force to replace it.")
+        os.remove(args.output)
+    started = time.perf_counter()
+    counts = generate(args.output, seed=args.seed, password=args.password, **spec)
+    print(f"Generated in {time.perf_counter() - started:.1f} s: " + ", ".join(f"{count} {table}" for table, count in counts.items()))
@@ -2,6 +2,49 @@
 from PIL import Image, ImageTk
 import customtkinter as ctk
 import os
+import time
+import functools
+from . import metrics
+
+def _resolve_image_path(image_path: str) -> str | None:
+    if os.path.exists(image_path):
+        return image_path
+    # Try to construct path from project root if it's a relative path like 'assets/image.png'
+    # This assumes 'assets' is a common folder name. Adjust if your structure is different.
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # g:\swigato_project
+    potential_path = os.path.join(base_dir, image_path)
+    if os.path.exists(potential_path):
+        return potential_path
+    print(f"Error: Image not found at path: {image_path} or {potential_path}")
+    return None
+
+@functools.lru_cache(maxsize=256)
+def _decode_image_lru(image_path, size):
+    img = Image.open(image_path)
+    # Nothing is shown larger than twice the requested size (at 200% scaling), so
+    # let JPEGs decode at reduced resolution and shrink anything bigger than that
+    max_size = (size[0] * 2, size[1] * 2)
+    img.draft(None, max_size)
+    img.load()
+    if img.width > max_size[0] or img.height > max_size[1]:
+        img.thumbnail(max_size)
+    return img
+
+def decode_image(image_path: str, size: tuple[int, int] = (100, 100)) -> Image.Image | None:
+    """
+    Decodes an image for display at size, caching the decoded pixels so that
+    load_image() does not read or decode the file again. Unlike load_image()
+    this creates no Tk objects, so it can run on a background thread (see
+    utils.prefetch). Returns None if the image is missing or unreadable.
+    """
+    resolved_path = _resolve_image_path(image_path)
+    if resolved_path is None:
+        return None
+    try:
+        return _decode_image_lru(resolved_path, tuple(size))
+    except Exception as e:
+        print(f"Error decoding image {image_path}: {e}")
+        return None
 
 def load_image(image_path: str, size: tuple[int, int] = (100, 100)) -> ctk.CTkImage | None:
     """
@@ -15,20 +58,33 @@ def load_image(image_path: str, size: tuple[int, int] = (100, 100)) -> ctk.CTkIm
     Returns:
         ctk.CTkImage | None: A CTkImage object if successful, None otherwise.
     """
+    start = time.perf_counter()
     try:
-        if not os.path.exists(image_path):
-            # Try to construct path from project root if it's a relative path like 'assets/image.png'
-            # This assumes 'assets' is a common folder name. Adjust if your structure is different.
-            base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # g:\swigato_project
-            potential_path = os.path.join(base_dir, image_path)
-            if os.path.exists(potential_path):
-                image_path = potential_path
-            else:
-                print(f"Error: Image not found at path: {image_path} or {potential_path}")
-                return None
+        resolved_path = _resolve_image_path(image_path)
+        if resolved_path is None:
+            metrics.counter("swigato_image_loads_total", "Images loaded from disk, by result.", result="missing").inc()
+            return None
         
-        img = Image.open(image_path)
-        return ctk.CTkImage(light_image=img, dark_image=img, size=size)
+        img = _decode_image_lru(resolved_path, tuple(size))
+        image = ctk.CTkImage(light_image=img, dark_image=img, size=size)
+        metrics.counter("swigato_image_loads_total", "Images loaded from disk, by result.", result="ok").inc()
+        metrics.histogram("swigato_image_load_seconds", "Time to open an image and wrap it in a CTkImage.").observe(time.perf_counter() - start)
+        return image
     except Exception as e:
         print(f"Error loading image {image_path}: {e}")
+        metrics.counter("swigato_image_loads_total", "Images loaded from disk, by result.", result="error").inc()
         return None
+
+@functools.lru_cache(maxsize=256)
+def _load_image_lru(image_path, size):
+    metrics.counter("swigato_image_cache_misses_total", "load_image_cached() calls that had to load the image.").inc()
+    return load_image(image_path, size)
+
+def load_image_cached(image_path: str, size: tuple[int, int] = (100, 100)) -> ctk.CTkImage | None:
+    """
+    Same as load_image, but repeated requests for the same path and size return
+    the same CTkImage. Used by recycled list cards, which re-bind their images
+    every time they scroll into view.
+    """
+    metrics.counter("swigato_image_cache_requests_total", "load_image_cached() calls.").inc()
+    return _load_image_lru(image_path, size)
@@ -0,0 +1,179 @@
+import gc
+import os
+import re
+import time
+import tracemalloc
+from collections import Counter
+from . import metrics
+from .logger import log
+from .scheduler import scheduler
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_FILE = os.path.join(_PROJECT_ROOT, "data", "leak_report.log")
+ENV_VAR = "SWIGATO_TRACK_LEAKS"
+TOP_ALLOCATIONS = 10  # Allocation sites listed per report
+# Tkinter registers Python callbacks as Tcl commands named <id(func)><func.__name__>
+_TCL_COMMAND_ID = re.compile(r"^\d+")
+
+class _Checkpoint:
+    """What was alive right after a screen switch."""
+
+    def __init__(self, screen, widgets, after_callbacks, tk_images, ctk_images, traced_bytes, snapshot, scheduled_jobs):
+        self.screen = screen
+        self.widgets = widgets  # Counter: widget class -> live instances
+        self.after_callbacks = after_callbacks  # Counter: callback name -> pending after() calls
+        self.tk_images = tk_images
+        self.ctk_images = ctk_images
+        self.traced_bytes = traced_bytes
+        self.snapshot = snapshot
+        self.scheduled_jobs = scheduled_jobs  # Counter: callback name -> jobs pending in utils.scheduler
+
+class LeakTracker:
+    """
+    Records what is alive after each screen switch and reports how it grew.
+
+    At every checkpoint the tracker counts live widgets per class (walking the
+    whole Tk tree, so Toplevel popups are included), pending after() callbacks
+    by function name, Tk images and CTkImage objects, and takes a tracemalloc
+    snapshot. Each report compares the checkpoint with the previous one and
+    with the previous visit to the same screen: a screen that is left and
+    re-entered should come back to the same counts, so growth between two
+    visits points at whatever that round trip leaked.
+    """
+
+    def __init__(self, frames=10):
+        self.enabled = False
+        self.frames = frames
+        self.checkpoints = 0
+        self._previous = None
+        self._by_screen = {}  # screen name -> last _Checkpoint for it
+
+    def enable(self):
+        """Starts tracemalloc. Call as early as possible so start-up allocations are traced too."""
+        if self.enabled:
+            return
+        self.enabled = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        log(f"Leak tracking enabled; reports go to {REPORT_FILE}.")
+
+    def checkpoint(self, root, screen):
+        """Records a checkpoint for screen and appends the growth report. No-op unless enabled."""
+        if not self.enabled:
+            return None
+        gc.collect()  # Garbage still waiting for the cycle collector is not a leak
+        current = _Checkpoint(
+            screen,
+            count_widgets(root),
+            pending_after_callbacks(root),
+            len(root.tk.call("image", "names")),
+            _count_ctk_images(),
+            tracemalloc.get_traced_memory()[0],
+            _filtered_snapshot(),
+            scheduler.jobs_by_name(),
+        )
+        self.checkpoints += 1
+        report = self._report(current, self._previous, self._by_screen.get(screen))
+        self._previous = current
+        self._by_screen[screen] = current
+
+        metrics.gauge("swigato_tk_widgets", "Live Tk widgets at the last screen switch.").set(sum(current.widgets.values()))
+        metrics.gauge("swigato_tk_after_callbacks", "Pending after() callbacks at the last screen switch.").set(sum(current.after_callbacks.values()))
+        metrics.gauge("swigato_tk_images", "Tk images at the last screen switch.").set(current.tk_images)
+        metrics.gauge("swigato_traced_memory_bytes", "Memory traced by tracemalloc at the last screen switch.").set(current.traced_bytes)
+
+        log(report.splitlines()[0])
+        try:
+            with open(REPORT_FILE, "a", encoding="utf-8") as f:
+                f.write(report + "\n\n")
+        except OSError as e:
+            log(f"Could not write leak report to {REPORT_FILE}: {e}")
+        return report
+
+    def _report(self, current, previous, last_visit):
+        lines = [f"{time.strftime('%Y-%m-%d %H:%M:%S')} Checkpoint {self.checkpoints} after switching to {current.screen}: "
+                 f"{sum(current.widgets.values())} widgets, {sum(current.after_callbacks.values())} pending after() callbacks "
+                 f"({sum(current.scheduled_jobs.values())} scheduler jobs), "
+                 f"{current.tk_images} Tk images, {current.ctk_images} CTkImages, {current.traced_bytes / 1024:.0f} KiB traced"]
+        if previous is not None:
+            lines.append(f"  Since the previous switch (from {previous.screen}):")
+            lines.extend(_format_deltas(current, previous))
+        if last_visit is not None:
+            lines.append(f"  Since the last visit to {current.screen} (growth here is likely a leak):")
+            lines.extend(_format_deltas(current, last_visit))
+            lines.append("    Top allocation growth:")
+            stats = [stat for stat in current.snapshot.compare_to(last_visit.snapshot, "lineno") if stat.size_diff > 0]
+            for stat in stats[:TOP_ALLOCATIONS]:
+                frame = stat.traceback[0]
+                lines.append(f"      {stat.size_diff / 1024:+8.1f} KiB {stat.count_diff:+6d} blocks  "
+                             f"{_display_path(frame.filename)}:{frame.lineno}")
+            if not stats:
+                lines.append("      (none)")
+        return "\n".join(lines)
+
+def _format_deltas(current, baseline):
+    lines = [f"    widgets {_signed(sum(current.widgets.values()) - sum(baseline.widgets.values()))}, "
+             f"after() callbacks {_signed(sum(current.after_callbacks.values()) - sum(baseline.after_callbacks.values()))}, "
+             f"Tk images {_signed(current.tk_images - baseline.tk_images)}, "
+             f"CTkImages {_signed(current.ctk_images - baseline.ctk_images)}, "
+             f"traced memory {(current.traced_bytes - baseline.traced_bytes) / 1024:+.0f} KiB"]
+    lines.extend(f"      {name}: {_signed(delta)}" for name, delta in _grown(current.widgets, baseline.widgets))
+    lines.extend(f"      after({name}): {_signed(delta)}" for name, delta in _grown(current.after_callbacks, baseline.after_callbacks))
+    lines.extend(f"      scheduler({name}): {_signed(delta)}" for name, delta in _grown(current.scheduled_jobs, baseline.scheduled_jobs))
+    return lines
+
+def _grown(current, baseline):
+    """(name, delta) for every entry that grew, largest first."""
+    deltas = {name: current[name] - baseline.get(name, 0) for name in current}
+    return sorted(((name, delta) for name, delta in deltas.items() if delta > 0), key=lambda item: -item[1])
+
+def _display_path(filename):
+    filename = os.path.abspath(filename) if not filename.startswith("<") else filename
+    return os.path.relpath(filename, _PROJECT_ROOT) if filename.startswith(_PROJECT_ROOT) else filename
+
+def _signed(value):
+    return f"{value:+d}"
+
+def count_widgets(root):
+    """Live widgets under root (including root and Toplevels) per class name."""
+    counts = Counter()
+    pending = [root]
+    while pending:
+        widget = pending.pop()
+        counts[type(widget).__name__] += 1
+        pending.extend(widget.winfo_children())
+    return counts
+
+def pending_after_callbacks(root):
+    """Pending after() / after_idle() callbacks per Python function name."""
+    counts = Counter()
+    for after_id in root.tk.splitlist(root.tk.call("after", "info")):
+        try:
+            script = root.tk.splitlist(root.tk.call("after", "info", after_id))[0]
+        except Exception:
+            continue  # Fired or cancelled meanwhile
+        command = str(script).split()[0] if str(script).strip() else "?"
+        counts[_TCL_COMMAND_ID.sub("", command) or command] += 1
+    return counts
+
+def _count_ctk_images():
+    try:
+        from customtkinter import CTkImage
+    except ImportError:
+        return 0
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, CTkImage))
+
+def _filtered_snapshot():
+    return tracemalloc.take_snapshot().filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ))
+
+# Shared instance used by gui_app; enabled by its --track-leaks flag or by the
+# SWIGATO_TRACK_LEAKS environment variable.
+leak_tracker = LeakTracker()
+if os.environ.get(ENV_VAR, "").lower() in ("1", "true", "yes", "on"):
+    leak_tracker.enable()
@@ -0,0 +1,246 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from .logger import log
+
+# Bucket bounds (seconds) written for histograms in the Prometheus export
+EXPORT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS  # Buckets per power of two, i.e. about 6% precision
+
+class Counter:
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+class Gauge:
+    def __init__(self):
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def set(self, value):
+        self.value = value
+
+    def inc(self, amount=1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount=1):
+        self.inc(-amount)
+
+class Histogram:
+    """
+    Latency histogram in the style of HdrHistogram.
+
+    Values (seconds) are counted in log-linear buckets: 16 equal-width buckets
+    per power of two of microseconds, so every recorded value is kept to within
+    about 6% no matter its magnitude, and memory only grows with the number of
+    distinct buckets actually hit.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self._buckets = {}  # bucket index -> count
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _bucket_index(value):
+        micros = max(int(value * 1_000_000), 0)
+        if micros < _SUB_BUCKETS:
+            return micros
+        shift = micros.bit_length() - _SUB_BUCKET_BITS - 1
+        return (shift + 1) * _SUB_BUCKETS + (micros >> shift) - _SUB_BUCKETS
+
+    @staticmethod
+    def _bucket_bounds(index):
+        """(lower, upper) bound of a bucket, in seconds."""
+        if index < _SUB_BUCKETS:
+            return index / 1_000_000, (index + 1) / 1_000_000
+        shift = index // _SUB_BUCKETS - 1
+        mantissa = index % _SUB_BUCKETS + _SUB_BUCKETS
+        return (mantissa << shift) / 1_000_000, ((mantissa + 1) << shift) / 1_000_000
+
+    def observe(self, value):
+        index = self._bucket_index(value)
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    @contextmanager
+    def time(self):
+        """Observes the time spent in the with-block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def quantile(self, q):
+        """Estimated value at quantile q (0..1), or 0.0 when empty."""
+        with self._lock:
+            buckets = sorted(self._buckets.items())
+            count = self.count
+        if not count:
+            return 0.0
+        rank = q * count
+        seen = 0
+        for index, bucket_count in buckets:
+            seen += bucket_count
+            if seen >= rank:
+                lower, upper = self._bucket_bounds(index)
+                return (lower + upper) / 2
+        return self._bucket_bounds(buckets[-1][0])[1]
+
+    def cumulative_counts(self, bounds=EXPORT_BUCKETS):
+        """Observations at or below each bound. Buckets straddling a bound count towards the next one."""
+        with self._lock:
+            buckets = sorted(self._buckets.items())
+        result = []
+        seen = 0
+        position = 0
+        for bound in bounds:
+            while position < len(buckets) and self._bucket_bounds(buckets[position][0])[1] <= bound:
+                seen += buckets[position][1]
+                position += 1
+            result.append(seen)
+        return result
+
+class _Family:
+    def __init__(self, name, kind, help_text):
+        self.name = name
+        self.kind = kind
+        self.help = help_text
+        self.children = {}  # tuple of sorted (label, value) pairs -> metric
+
+class MetricsRegistry:
+    """Named counters, gauges and histograms, exportable as Prometheus text."""
+
+    _KINDS = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}
+
+    def __init__(self):
+        self._families = {}
+        self._lock = threading.Lock()
+
+    def _get(self, kind, name, help_text, labels):
+        key = tuple(sorted(labels.items()))
+        family = self._families.get(name)
+        if family is not None:
+            child = family.children.get(key)
+            if child is not None and family.kind == kind:
+                return child
+        with self._lock:
+            family = self._families.setdefault(name, _Family(name, kind, help_text))
+            if family.kind != kind:
+                raise ValueError(f"Metric '{name}' is already registered as a {family.kind}.")
+            if not family.help and help_text:
+                family.help = help_text
+            return family.children.setdefault(key, self._KINDS[kind]())
+
+    def counter(self, name, help_text="", **labels):
+        return self._get("counter", name, help_text, labels)
+
+    def gauge(self, name, help_text="", **labels):
+        return self._get("gauge", name, help_text, labels)
+
+    def histogram(self, name, help_text="", **labels):
+        return self._get("histogram", name, help_text, labels)
+
+    def to_prometheus_text(self):
+        """The registry in the Prometheus text exposition format (version 0.0.4)."""
+        lines = []
+        with self._lock:
+            families = sorted(self._families.values(), key=lambda family: family.name)
+            children = {family.name: list(family.children.items()) for family in families}
+        for family in families:
+            if family.help:
+                lines.append(f"# HELP {family.name} {_escape_help(family.help)}")
+            lines.append(f"# TYPE {family.name} {family.kind}")
+            for key, metric in sorted(children[family.name], key=lambda child: child[0]):
+                if family.kind == "histogram":
+                    for bound, cumulative in zip(EXPORT_BUCKETS, metric.cumulative_counts()):
+                        lines.append(f"{family.name}_bucket{_format_labels(key + (('le', repr(bound)),))} {cumulative}")
+                    lines.append(f"{family.name}_bucket{_format_labels(key + (('le', '+Inf'),))} {metric.count}")
+                    lines.append(f"{family.name}_sum{_format_labels(key)} {metric.sum!r}")
+                    lines.append(f"{family.name}_count{_format_labels(key)} {metric.count}")
+                else:
+                    lines.append(f"{family.name}{_format_labels(key)} {metric.value!r}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Writes the export to path, replacing the file atomically so readers never see a partial dump."""
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus_text())
+        os.replace(temp_path, path)
+
+def _escape_help(text):
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+def _escape_label_value(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(key):
+    if not key:
+        return ""
+    return "{" + ",".join(f'{label}="{_escape_label_value(value)}"' for label, value in key) + "}"
+
+# Shared registry used across the application
+registry = MetricsRegistry()
+counter = registry.counter
+gauge = registry.gauge
+histogram = registry.histogram
+registry.gauge("swigato_process_start_time_seconds", "Unix time the process started.").set(time.time())
+
+def start_file_exporter(path, interval=15.0):
+    """Rewrites path with the Prometheus export every interval seconds from a daemon thread."""
+    def export_loop():
+        while True:
+            try:
+                registry.write_prometheus(path)
+            except OSError as e:
+                log(f"Could not write metrics to {path}: {e}")
+            time.sleep(interval)
+    thread = threading.Thread(target=export_loop, name="swigato-metrics-file", daemon=True)
+    thread.start()
+    log(f"Writing metrics to {path} every {interval:g} s.")
+    return thread
+
+class _MetricsRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = registry.to_prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # Scrapes would otherwise be printed to stderr
+
+def start_http_server(port, host="127.0.0.1"):
+    """Serves the Prometheus export at http://host:port/metrics from a daemon thread."""
+    server = ThreadingHTTPServer((host, port), _MetricsRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, name="swigato-metrics-http", daemon=True)
+    thread.start()
+    log(f"Serving metrics at http://{host}:{server.server_address[1]}/metrics")
+    return server
+
+def start_exporters_from_env():
+    """Starts the exporters requested by SWIGATO_METRICS_FILE / SWIGATO_METRICS_PORT (and SWIGATO_METRICS_INTERVAL)."""
+    metrics_file = os.environ.get("SWIGATO_METRICS_FILE")
+    metrics_port = os.environ.get("SWIGATO_METRICS_PORT")
+    if metrics_file:
+        start_file_exporter(metrics_file, float(os.environ.get("SWIGATO_METRICS_INTERVAL", "15")))
+    if metrics_port:
+        start_http_server(int(metrics_port))
@@ -0,0 +1,262 @@
+import os
+import sqlite3
+import datetime
+from .logger import log
+
+# Ordered list of (version, description, apply_function). Each apply function
+# receives a cursor that is already inside the migration transaction and must
+# not commit or open connections of its own.
+MIGRATIONS = []
+
+def migration(version, description):
+    """Registers a schema migration. Versions must be unique and increasing."""
+    def decorator(func):
+        if MIGRATIONS and version <= MIGRATIONS[-1][0]:
+            raise ValueError(f"Migration version {version} must be greater than {MIGRATIONS[-1][0]}.")
+        MIGRATIONS.append((version, description, func))
+        return func
+    return decorator
+
+def latest_version():
+    """Returns the version the schema will be at once all migrations are applied."""
+    return MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+def get_schema_version(conn):
+    """Returns the current schema version, or 0 for a database that was never migrated."""
+    try:
+        row = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()
+        return row[0] if row and row[0] is not None else 0
+    except sqlite3.OperationalError:
+        # schema_version table does not exist yet (new or pre-migration database)
+        return 0
+
+def _column_names(cursor, table_name):
+    cursor.execute(f"PRAGMA table_info({table_name})")
+    return [column[1] for column in cursor.fetchall()]
+
+def _add_column_if_missing(cursor, table_name, column_name, column_type):
+    if column_name not in _column_names(cursor, table_name):
+        cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}")
+        log(f"Added '{column_name}' column to '{table_name}' table.")
+
+def apply_migrations(conn):
+    """
+    Brings the database schema up to date.
+
+    When the schema is current this costs a single version query. Otherwise all
+    pending migrations are applied in one IMMEDIATE transaction, so a second
+    process starting at the same time either waits or sees the finished schema.
+
+    Returns:
+        int: The number of migrations applied.
+    """
+    if get_schema_version(conn) >= latest_version():
+        return 0
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY,
+                description TEXT,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        # Re-check under the write lock in case another process migrated meanwhile
+        current_version = get_schema_version(conn)
+        applied = 0
+        for version, description, apply_func in MIGRATIONS:
+            if version <= current_version:
+                continue
+            log(f"Applying schema migration {version}: {description}")
+            apply_func(cursor)
+            cursor.execute("INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)",
+                           (version, description, datetime.datetime.now()))
+            applied += 1
+        conn.commit()
+        log(f"Schema is at version {latest_version()} ({applied} migration(s) applied).")
+        return applied
+    except Exception as e:
+        log(f"Schema migration failed, rolling back: {e}")
+        conn.rollback()
+        raise
+
+# --- Migrations ---
+
+@migration(1, "Create base tables")
+def _create_base_tables(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS users (
+            user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            username TEXT UNIQUE NOT NULL,
+            password_hash TEXT NOT NULL,
+            address TEXT,
+            email TEXT,
+            phone TEXT,
+            is_admin BOOLEAN DEFAULT FALSE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS restaurants (
+            restaurant_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            cuisine_type TEXT,
+            address TEXT,
+            description TEXT,
+            image_filename TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS menu_items (
+            item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            restaurant_id INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            price REAL NOT NULL,
+            category TEXT,
+            image_filename TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (restaurant_id) REFERENCES restaurants (restaurant_id)
+        )
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_menu_items_restaurant_id ON menu_items (restaurant_id)")
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS reviews (
+            review_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            restaurant_id INTEGER NOT NULL,
+            rating INTEGER NOT NULL CHECK (rating >= 1 AND rating <= 5),
+            comment TEXT,
+            username TEXT, -- Denormalized for easier display
+            review_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users (user_id),
+            FOREIGN KEY (restaurant_id) REFERENCES restaurants (restaurant_id)
+        )
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_user_id ON reviews (user_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_restaurant_id ON reviews (restaurant_id)")
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS orders (
+            order_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER, -- Can be NULL for guest orders
+            restaurant_id INTEGER NOT NULL,
+            restaurant_name TEXT, -- Denormalized for convenience
+            total_amount REAL NOT NULL,
+            status TEXT DEFAULT 'Pending',
+            order_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            delivery_address TEXT,
+            FOREIGN KEY (user_id) REFERENCES users (user_id),
+            FOREIGN KEY (restaurant_id) REFERENCES restaurants (restaurant_id)
+        )
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_user_id ON orders (user_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_restaurant_id ON orders (restaurant_id)")
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS order_items (
+            order_item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            order_id INTEGER NOT NULL,
+            item_id INTEGER,
+            name TEXT NOT NULL,
+            quantity INTEGER NOT NULL,
+            price REAL NOT NULL, -- Price at the time of order
+            FOREIGN KEY (order_id) REFERENCES orders (order_id)
+        )
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_order_items_order_id ON order_items (order_id)")
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS user_favorites (
+            favorite_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER NOT NULL,
+            restaurant_id INTEGER,
+            item_id INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(user_id, restaurant_id, item_id),
+            FOREIGN KEY (user_id) REFERENCES users (user_id),
+            FOREIGN KEY (restaurant_id) REFERENCES restaurants (restaurant_id),
+            FOREIGN KEY (item_id) REFERENCES menu_items (item_id)
+        )
+    ''')
+
+@migration(2, "Add columns missing from databases created by older versions")
+def _add_legacy_columns(cursor):
+    # Previously handled by the ad-hoc checks in utils/update_schema.py
+    _add_column_if_missing(cursor, "restaurants", "description", "TEXT")
+    _add_column_if_missing(cursor, "restaurants", "image_filename", "TEXT")
+    _add_column_if_missing(cursor, "menu_items", "image_filename", "TEXT")
+    _add_column_if_missing(cursor, "users", "email", "TEXT")
+    _add_column_if_missing(cursor, "users", "phone", "TEXT")
+
+@migration(3, "Create default admin user")
+def _create_default_admin_user(cursor):
+    cursor.execute("SELECT user_id FROM users WHERE is_admin = TRUE LIMIT 1")
+    if cursor.fetchone():
+        log("Admin user already exists. Skipping default admin creation.")
+        return
+    import bcrypt  # Only needed the first time the schema is created
+    default_admin_username = os.environ.get('SWIGATO_ADMIN_USER', 'admin')
+    default_admin_password = os.environ.get('SWIGATO_ADMIN_PASS', 'admin123')
+    password_hash = bcrypt.hashpw(default_admin_password.encode('utf-8'), bcrypt.gensalt())
+    cursor.execute("INSERT OR IGNORE INTO users (username, password_hash, address, is_admin) VALUES (?, ?, ?, ?)",
+                   (default_admin_username, password_hash.decode('utf-8'), "Admin HQ", True))
+    if cursor.rowcount:
+        log(f"Default admin user '{default_admin_username}' created successfully.")
+    else:
+        log(f"Failed to create default admin user '{default_admin_username}': username already taken.")
+
+@migration(4, "Add user search indexes")
+def _add_user_search_indexes(cursor):
+    # Case-insensitive prefix searches on username (User.search) use this index
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_username_nocase ON users (username COLLATE NOCASE)")
+    try:
+        cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS users_fts USING fts5(address, content='users', content_rowid='user_id')")
+    except sqlite3.OperationalError as e:
+        # SQLite built without FTS5; User.search falls back to LIKE on the address
+        log(f"Full-text search unavailable, address search will use LIKE: {e}")
+        return
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS users_fts_insert AFTER INSERT ON users BEGIN
+            INSERT INTO users_fts (rowid, address) VALUES (new.user_id, new.address);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS users_fts_delete AFTER DELETE ON users BEGIN
+            INSERT INTO users_fts (users_fts, rowid, address) VALUES ('delete', old.user_id, old.address);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS users_fts_update AFTER UPDATE OF address ON users BEGIN
+            INSERT INTO users_fts (users_fts, rowid, address) VALUES ('delete', old.user_id, old.address);
+            INSERT INTO users_fts (rowid, address) VALUES (new.user_id, new.address);
+        END
+    ''')
+    cursor.execute("INSERT INTO users_fts (users_fts) VALUES ('rebuild')")
+
+@migration(5, "Add review feed indexes")
+def _add_review_feed_indexes(cursor):
+    # Keyset pages of reviews.models.get_review_feed, newest first and by rating
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_restaurant_date ON reviews (restaurant_id, review_date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_reviews_restaurant_rating ON reviews (restaurant_id, rating, review_date)")
+
+# Tables whose changes utils.query_cache tracks; every write to one bumps its row in table_versions
+VERSIONED_TABLES = ("users", "restaurants", "menu_items", "reviews", "orders", "order_items", "user_favorites")
+
+@migration(6, "Add table version counters for the query cache")
+def _add_table_versions(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS table_versions (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    for table_name in VERSIONED_TABLES:
+        cursor.execute("INSERT OR IGNORE INTO table_versions (table_name) VALUES (?)", (table_name,))
+        # Triggers run inside the writing transaction, so the bump commits (or rolls back) with the change itself
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table_name}_version_{event.lower()} AFTER {event} ON {table_name} BEGIN
+                    UPDATE table_versions SET version = version + 1 WHERE table_name = '{table_name}';
+                END
+            ''')
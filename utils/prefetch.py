@@ -0,0 +1,162 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from . import metrics
+from .image_loader import decode_image
+from .logger import log
+from .query_cache import query_cache
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MENU_IMAGE_SIZE = (120, 120)  # Size MenuItemCard shows item images at
+HOVER_DELAY_MS = 120  # Hover this long before prefetching, so sweeping the pointer across cards costs nothing
+VISIBLE_DELAY_MS = 400  # Stay in view this long (i.e. scrolling has settled) before prefetching
+# Tables a prefetch reads (the menu and the review feed); a write to any of them drops the result
+PREFETCH_TABLES = ("menu_items", "reviews", "restaurants")
+
+class _Request:
+    def __init__(self, restaurant_id, reason):
+        self.restaurant_id = restaurant_id
+        self.reason = reason  # "hover" or "visible"
+        self.cancelled = False
+        self.future = None
+
+class MenuPrefetch:
+    """What MenuScreen needs to open a restaurant, loaded ahead of time."""
+
+    def __init__(self, menu_items, review_page, ttl, versions):
+        self.menu_items = menu_items
+        self.review_page = review_page  # (reviews, next_cursor) for the default sort
+        self.expires_at = time.monotonic() + ttl
+        self.versions = versions  # PREFETCH_TABLES versions from before the data was read
+
+    @property
+    def fresh(self):
+        """Younger than the ttl, and none of PREFETCH_TABLES changed since it was loaded, in any process."""
+        if self.versions is None or time.monotonic() >= self.expires_at:
+            return False
+        return query_cache.table_versions(PREFETCH_TABLES) == self.versions
+
+class MenuPrefetcher:
+    """
+    Loads a restaurant's menu, first page of reviews and decoded item
+    thumbnails in the background before its menu is opened.
+
+    Restaurant cards call prefetch() when they are hovered or have been in
+    view for a moment, and cancel() when the pointer or the scroll position
+    moves on. The work is bounded: one worker thread, at most max_queued
+    requests (a hover replaces the previous hover and can displace a
+    "visible" request), at most max_images thumbnails per restaurant and at
+    most max_cached results, each usable once and only for ttl seconds.
+    MenuScreen picks results up with take(), which hands out a result only
+    while the tables it was read from are unchanged (see utils.query_cache),
+    so writes from other processes and new reviews are never shown stale.
+    """
+
+    def __init__(self, max_queued=4, max_cached=6, max_images=12, ttl=60.0, review_page_size=10):
+        self.max_queued = max_queued
+        self.max_cached = max_cached
+        self.max_images = max_images
+        self.ttl = ttl
+        self.review_page_size = review_page_size  # Matches MenuScreen.REVIEWS_PAGE_SIZE
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="swigato-prefetch")
+        self._requests = {}  # restaurant_id -> _Request queued or running
+        self._results = OrderedDict()  # restaurant_id -> MenuPrefetch, oldest first
+        self._lock = threading.Lock()
+
+    def prefetch(self, restaurant_id, reason="visible"):
+        """Starts prefetching a restaurant's menu unless it is already cached, queued or over budget."""
+        with self._lock:
+            result = self._results.get(restaurant_id)
+            if result is not None and result.fresh:
+                return
+            request = self._requests.get(restaurant_id)
+            if request is not None:
+                if reason == "hover":
+                    request.reason = "hover"
+                return
+            if reason == "hover":
+                # Only the card under the pointer is worth a hover prefetch
+                for other in [r for r in self._requests.values() if r.reason == "hover"]:
+                    self._cancel_locked(other)
+            if len(self._requests) >= self.max_queued:
+                visible = [r for r in self._requests.values() if r.reason == "visible"]
+                if reason != "hover" or not visible:
+                    metrics.counter("swigato_prefetch_total", "Menu prefetch requests, by outcome.", outcome="over_budget").inc()
+                    return
+                self._cancel_locked(visible[0])
+            request = _Request(restaurant_id, reason)
+            self._requests[restaurant_id] = request
+        metrics.counter("swigato_prefetch_total", "Menu prefetch requests, by outcome.", outcome="started").inc()
+        request.future = self._executor.submit(self._run, request)
+
+    def cancel(self, restaurant_id, reason=None):
+        """Cancels a queued or running prefetch; with reason, only one started for that reason."""
+        with self._lock:
+            request = self._requests.get(restaurant_id)
+            if request is not None and (reason is None or request.reason == reason):
+                self._cancel_locked(request)
+
+    def take(self, restaurant_id):
+        """The prefetched MenuPrefetch for a restaurant, or None. Each result is handed out once."""
+        with self._lock:
+            result = self._results.pop(restaurant_id, None)
+        if result is not None and result.fresh:
+            metrics.counter("swigato_prefetch_lookups_total", "MenuScreen lookups of prefetched menus.", result="hit").inc()
+            return result
+        metrics.counter("swigato_prefetch_lookups_total", "MenuScreen lookups of prefetched menus.", result="miss").inc()
+        return None
+
+    def invalidate(self, restaurant_id):
+        """Drops anything prefetched for a restaurant, e.g. after its menu or reviews changed."""
+        with self._lock:
+            self._results.pop(restaurant_id, None)
+            request = self._requests.get(restaurant_id)
+            if request is not None:
+                self._cancel_locked(request)
+
+    def _store_locked(self, restaurant_id, result):
+        self._results[restaurant_id] = result
+        self._results.move_to_end(restaurant_id)
+        while len(self._results) > self.max_cached:
+            self._results.popitem(last=False)
+
+    def _cancel_locked(self, request):
+        request.cancelled = True
+        if request.future is not None:
+            request.future.cancel()  # Only succeeds if it has not started yet
+        self._requests.pop(request.restaurant_id, None)
+        metrics.counter("swigato_prefetch_total", "Menu prefetch requests, by outcome.", outcome="cancelled").inc()
+
+    def _run(self, request):
+        from restaurants.models import MenuItem
+        from reviews.models import get_review_feed
+        try:
+            if request.cancelled:
+                return
+            # Read before the data, so a write landing meanwhile only makes the result look older than it is
+            versions = query_cache.table_versions(PREFETCH_TABLES)
+            menu_items = MenuItem.get_for_restaurant(request.restaurant_id)
+            if request.cancelled:
+                return
+            review_page = get_review_feed(request.restaurant_id, "newest", limit=self.review_page_size)
+            # Thumbnails for the first screenful; decode_image keeps them in its cache for load_image()
+            for item in [item for item in menu_items if item.image_filename][:self.max_images]:
+                if request.cancelled:
+                    return
+                decode_image(os.path.join(_PROJECT_ROOT, "assets", "menu_items", item.image_filename), MENU_IMAGE_SIZE)
+            with self._lock:
+                if request.cancelled:
+                    return
+                self._requests.pop(request.restaurant_id, None)
+                self._store_locked(request.restaurant_id, MenuPrefetch(menu_items, review_page, self.ttl, versions))
+            metrics.counter("swigato_prefetch_total", "Menu prefetch requests, by outcome.", outcome="completed").inc()
+        except Exception as e:
+            log(f"Menu prefetch for restaurant {request.restaurant_id} failed: {e}")
+            with self._lock:
+                if self._requests.get(request.restaurant_id) is request:
+                    self._requests.pop(request.restaurant_id)
+
+# Shared instance used by the restaurant list and MenuScreen
+menu_prefetcher = MenuPrefetcher()
@@ -0,0 +1,142 @@
+import atexit
+import os
+import pathlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from . import database, metrics
+from .logger import log
+
+ENV_VAR = "SWIGATO_QUERY_CACHE"
+
+class QueryCache:
+    """
+    Read-through cache for model query results, tagged by the tables each query reads.
+
+    Every write to a versioned table bumps its counter in table_versions
+    (triggers added by schema migration 6), whichever process made it, so an
+    entry is served only while the versions of its tables are the ones it was
+    stored under. Reading the counters on every lookup would cost a query, so
+    a watch connection first checks PRAGMA data_version, which only changes
+    when another connection has committed; until it does, the versions
+    already read are current. No TTLs are involved.
+
+    Query errors are not cached: they propagate to the caller. Without the
+    table_versions table (a database not migrated yet) every lookup goes
+    straight to the database. Results are shared between callers, so they
+    must not be modified.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self.enabled = True
+        self._entries = OrderedDict()  # (sql, params) -> (table versions, rows), least recently used first
+        self._versions = {}  # table name -> version as of _data_version
+        self._data_version = None
+        self._watch = None
+        self._watch_path = None
+        self._lock = threading.Lock()
+
+    def fetchall(self, sql, params=(), tables=()):
+        """
+        The rows of sql with params, from the cache while none of tables changed since they were stored.
+
+        tables must name every table the query reads; a write to any other table is not noticed.
+        """
+        if not self.enabled:
+            return self._bypass(sql, params)
+        key = (sql, tuple(params))
+        with self._lock:
+            versions = self._table_versions(tables)
+            if versions is None:
+                return self._bypass(sql, params)
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == versions:
+                self._entries.move_to_end(key)
+                metrics.counter("swigato_query_cache_total", "Query cache lookups.", result="hit").inc()
+                return entry[1]
+        metrics.counter("swigato_query_cache_total", "Query cache lookups.", result="miss").inc()
+        # Versions were read before the query, so a write landing meanwhile only makes the entry look older than it is
+        rows = _query(sql, params)
+        with self._lock:
+            self._entries[key] = (versions, rows)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return rows
+
+    def table_versions(self, tables):
+        """
+        The current versions of tables, for caches outside this one to compare later; None when they cannot be tracked.
+
+        Tracked whether or not the cache itself is enabled.
+        """
+        with self._lock:
+            return self._table_versions(tables)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def close(self):
+        """Drops all entries and closes the watch connection."""
+        with self._lock:
+            self._entries.clear()
+            self._close_watch()
+
+    def _bypass(self, sql, params):
+        metrics.counter("swigato_query_cache_total", "Query cache lookups.", result="bypass").inc()
+        return _query(sql, params)
+
+    def _table_versions(self, tables):
+        """The current versions of tables as a tuple, or None when they cannot be tracked."""
+        try:
+            watch = self._watch_connection()
+            data_version = watch.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version:
+                self._versions = dict(watch.execute("SELECT table_name, version FROM table_versions").fetchall())
+                self._data_version = data_version
+        except sqlite3.Error as e:
+            # Missing database or table_versions table; look again next time
+            if self._data_version is not None:
+                log(f"Query cache: cannot read table versions, bypassing the cache: {e}")
+            self._close_watch()
+            return None
+        if any(table not in self._versions for table in tables):
+            return None
+        return tuple(self._versions[table] for table in tables)
+
+    def _watch_connection(self):
+        if self._watch is not None and self._watch_path != database.DATABASE_NAME:
+            # Pointed at another database (benchmarks, datagen); nothing cached applies to it
+            self._close_watch()
+        if self._watch is None:
+            path = database.DATABASE_NAME
+            # Read-only, so a lookup never creates the database file or takes a write lock
+            uri = pathlib.Path(os.path.abspath(path)).as_uri() + "?mode=ro"
+            self._watch = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._watch_path = path
+        return self._watch
+
+    def _close_watch(self):
+        if self._watch is not None:
+            self._watch.close()
+        self._watch = None
+        self._watch_path = None
+        self._data_version = None
+        self._versions = {}
+        self._entries.clear()
+
+def _query(sql, params):
+    conn = database.get_read_connection()
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+# Shared instance used by the model classes; SWIGATO_QUERY_CACHE=0 turns it off
+query_cache = QueryCache()
+# Registered after utils.database's hook, so it runs first and the writer is the last connection to close
+atexit.register(query_cache.close)
+if os.environ.get(ENV_VAR, "").lower() in ("0", "false", "no", "off"):
+    query_cache.enabled = False
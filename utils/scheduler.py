@@ -0,0 +1,183 @@
+import time
+import tkinter
+from collections import Counter
+from . import metrics
+from .logger import log
+
+class _Job:
+    __slots__ = ("owner", "owner_path", "callback", "args", "interval_ms", "key", "due", "after_id")
+
+    def __init__(self, owner, callback, args, interval_ms, key):
+        self.owner = owner
+        self.owner_path = str(owner)
+        self.callback = callback
+        self.args = args
+        self.interval_ms = interval_ms  # None for one-shot jobs
+        self.key = key
+        self.due = 0.0
+        self.after_id = None
+
+    @property
+    def name(self):
+        return getattr(self.callback, "__qualname__", None) or repr(self.callback)
+
+class UiScheduler:
+    """
+    Owns the UI's after() timers.
+
+    Every job has an owner widget; when the owner is destroyed its jobs are
+    cancelled, so nothing fires on a dead widget (tkinter deletes a widget's
+    Tcl callbacks on destroy, which turns a stray after() into an "invalid
+    command name" error). One-shot jobs get an after() of their own on the
+    root window. Recurring jobs share a single tick that is re-armed for the
+    earliest due job, so any number of them cost one pending timer.
+
+    All methods must be called from the Tk thread.
+    """
+
+    def __init__(self):
+        self._one_shots = set()
+        self._recurring = []
+        self._bound_owners = set()  # Paths of owners with our <Destroy> binding
+        self._root = None
+        self._tick_after_id = None
+        self._tick_due = None
+
+    def call_later(self, owner, delay_ms, callback, *args):
+        """Calls callback(*args) once after delay_ms, unless owner is destroyed first."""
+        job = _Job(owner, callback, args, None, None)
+        self._watch_owner(owner)
+        job.after_id = self._root_of(owner).after(delay_ms, self._fire, job)
+        self._one_shots.add(job)
+        self._update_gauges()
+        return job
+
+    def every(self, owner, interval_ms, callback, *args, key=None, first_delay_ms=None):
+        """
+        Calls callback(*args) every interval_ms while owner exists.
+
+        A job with the same owner and key replaces the existing one, so code
+        that may run twice for the same widget does not start a second loop.
+        """
+        if key is not None:
+            for other in [job for job in self._recurring if job.key == key and job.owner is owner]:
+                self._recurring.remove(other)
+        job = _Job(owner, callback, args, interval_ms, key)
+        job.due = time.perf_counter() + (interval_ms if first_delay_ms is None else first_delay_ms) / 1000
+        self._watch_owner(owner)
+        self._root_of(owner)
+        self._recurring.append(job)
+        self._arm_tick()
+        self._update_gauges()
+        return job
+
+    def cancel(self, job):
+        if job in self._one_shots:
+            self._one_shots.discard(job)
+            try:
+                self._root.after_cancel(job.after_id)
+            except Exception:
+                pass  # Already fired or the application is closing
+        elif job in self._recurring:
+            self._recurring.remove(job)
+        self._update_gauges()
+
+    def cancel_for(self, widget):
+        """Cancels the jobs owned by widget or any of its children. Returns how many were cancelled."""
+        widget_path = str(widget)
+        jobs = [job for job in list(self._one_shots) + self._recurring
+                if job.owner_path == widget_path or job.owner_path.startswith(widget_path + ".")]
+        for job in jobs:
+            self.cancel(job)
+        self._bound_owners = {path for path in self._bound_owners
+                              if path != widget_path and not path.startswith(widget_path + ".")}
+        return len(jobs)
+
+    def counts(self):
+        """
+        Pending jobs and timers, for diagnostics.
+
+        Not included: the stall monitor's heartbeat and utils.tasks' result
+        drain, which arm their own after() on the root window.
+        """
+        return {
+            "one_shot": len(self._one_shots),
+            "recurring": len(self._recurring),
+            "tk_timers": len(self._one_shots) + (1 if self._tick_after_id is not None else 0),
+        }
+
+    def jobs_by_name(self):
+        """Pending jobs per callback name."""
+        return Counter(job.name for job in list(self._one_shots) + self._recurring)
+
+    # --- Internals ---
+
+    def _root_of(self, owner):
+        if self._root is None:
+            self._root = owner._root()
+        return self._root
+
+    def _watch_owner(self, owner):
+        owner_path = str(owner)
+        if owner_path in self._bound_owners:
+            return
+        self._bound_owners.add(owner_path)
+        # tkinter.Misc.bind rather than owner.bind: customtkinter widgets redirect bind() to their canvas
+        tkinter.Misc.bind(owner, "<Destroy>", lambda event: self._on_destroy(event, owner_path), add="+")
+
+    def _on_destroy(self, event, owner_path):
+        # A Toplevel also receives <Destroy> for each of its children
+        if str(event.widget) == owner_path:
+            self.cancel_for(owner_path)
+
+    def _fire(self, job):
+        self._one_shots.discard(job)
+        self._update_gauges()
+        self._run(job)
+
+    def _run(self, job):
+        try:
+            if not job.owner.winfo_exists():
+                return False
+        except Exception:
+            return False  # Owner's interpreter is gone
+        try:
+            job.callback(*job.args)
+        except Exception as e:
+            log(f"Scheduled callback {job.name} for {job.owner_path} failed: {e}")
+        return True
+
+    def _arm_tick(self):
+        if not self._recurring:
+            return
+        next_due = min(job.due for job in self._recurring)
+        if self._tick_after_id is not None:
+            if self._tick_due <= next_due:
+                return  # The armed tick comes first anyway
+            self._root.after_cancel(self._tick_after_id)
+        self._tick_due = next_due
+        self._tick_after_id = self._root.after(max(int((next_due - time.perf_counter()) * 1000), 0), self._tick)
+
+    def _tick(self):
+        self._tick_after_id = None
+        self._tick_due = None
+        now = time.perf_counter()
+        for job in [job for job in self._recurring if job.due <= now]:
+            if job not in self._recurring:
+                continue  # Cancelled by an earlier callback in this tick
+            if self._run(job):
+                job.due = max(job.due + job.interval_ms / 1000, now)
+            elif job in self._recurring:
+                self._recurring.remove(job)
+        self._update_gauges()
+        try:
+            self._arm_tick()
+        except Exception:
+            pass  # Application is shutting down
+
+    def _update_gauges(self):
+        metrics.gauge("swigato_scheduled_jobs", "Pending UI timer jobs.", kind="one_shot").set(len(self._one_shots))
+        metrics.gauge("swigato_scheduled_jobs", "Pending UI timer jobs.", kind="recurring").set(len(self._recurring))
+
+# Shared instance used by the screens for their timers
+scheduler = UiScheduler()
@@ -0,0 +1,237 @@
+import atexit
+import functools
+import os
+import re
+import sqlite3
+import threading
+import time
+import traceback
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from .logger import log
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Frames from these files are the tracing/connection plumbing, not the code that issued the query
+_SKIPPED_FILES = {os.path.abspath(__file__), os.path.join(_PROJECT_ROOT, "utils", "database.py")}
+REPORT_FILE = os.path.join(_PROJECT_ROOT, "data", "sql_trace_report.txt")
+ENV_VAR = "SWIGATO_SQL_TRACE"
+
+_WHITESPACE = re.compile(r"\s+")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+
+def normalize_sql(sql):
+    """Collapses whitespace and replaces literals with ? so the same statement groups together."""
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+class _StatementStats:
+    __slots__ = ("count", "total_ms", "max_ms", "call_sites")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.call_sites = Counter()
+
+class _Action:
+    """Statements issued during one UI action (one Tk event-loop turn, or an explicit action())."""
+
+    def __init__(self, name):
+        self.name = name
+        self.statements = Counter()   # normalized sql -> executions
+        self.call_sites = {}          # normalized sql -> call site of the first execution
+
+class SqlTracer:
+    """
+    Records every SQL statement run through get_db_connection() while enabled.
+
+    For each distinct (normalized) statement it keeps the number of executions,
+    the total and worst time spent in execute() and the project call sites that
+    issued it. Statements are also grouped per UI action: everything run on the
+    Tk thread within one event-loop turn (see bind_tk), or inside an explicit
+    action() block, such as a background load. A statement repeated at least
+    n_plus_one_threshold times within one action is reported as a likely N+1
+    query. The ranked report is printed, logged and written to REPORT_FILE at exit.
+    """
+
+    def __init__(self, n_plus_one_threshold=5):
+        self.enabled = False
+        self.n_plus_one_threshold = n_plus_one_threshold
+        self.stats = defaultdict(_StatementStats)
+        self.suspects = []  # (action name, normalized sql, executions, call site)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._tk_root = None
+        self._tk_thread = None
+
+    def enable(self):
+        if self.enabled:
+            return
+        self.enabled = True
+        atexit.register(self.write_report)
+        log(f"SQL tracing enabled; the report will be written to {REPORT_FILE} at exit.")
+
+    def bind_tk(self, root):
+        """Groups statements run on root's thread into one action per event-loop turn."""
+        self._tk_root = root
+        self._tk_thread = threading.current_thread()
+
+    def connect(self, database, role=None, **kwargs):
+        """
+        sqlite3.connect() returning a connection whose statements are recorded.
+
+        role is an optional mixin class placed in front of the traced connection
+        class, such as the reader and writer roles in utils.database.
+        """
+        factory = _TracedConnection if role is None else _traced_class(role)
+        conn = sqlite3.connect(database, factory=factory, **kwargs)
+        conn.tracer = self
+        return conn
+
+    @contextmanager
+    def action(self, name):
+        """Groups the statements run by this thread inside the block as one action."""
+        if not self.enabled or getattr(self._local, "action", None) is not None:
+            yield  # Nested actions belong to the outer one
+            return
+        self._local.action = _Action(name)
+        try:
+            yield
+        finally:
+            self._finish_action()
+
+    # --- Recording ---
+
+    def record(self, sql, elapsed_ms):
+        normalized = normalize_sql(sql)
+        call_site = _call_site()
+        with self._lock:
+            stats = self.stats[normalized]
+            stats.count += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.call_sites[call_site] += 1
+        action = self._current_action(call_site)
+        if action is not None:
+            action.statements[normalized] += 1
+            action.call_sites.setdefault(normalized, call_site)
+
+    def _current_action(self, call_site):
+        action = getattr(self._local, "action", None)
+        if action is None and self._tk_root is not None and threading.current_thread() is self._tk_thread:
+            # Everything until the event loop goes idle again belongs to the same UI action
+            action = self._local.action = _Action(f"Tk event ({call_site})")
+            try:
+                self._tk_root.after_idle(self._finish_action)
+            except Exception:
+                self._local.action = None  # Root already destroyed
+                return None
+        return action
+
+    def _finish_action(self):
+        action = getattr(self._local, "action", None)
+        self._local.action = None
+        if action is None:
+            return
+        for normalized, executions in action.statements.items():
+            if executions >= self.n_plus_one_threshold:
+                with self._lock:
+                    self.suspects.append((action.name, normalized, executions, action.call_sites[normalized]))
+
+    # --- Reporting ---
+
+    def report(self, top=25):
+        """Returns the ranked report as text."""
+        with self._lock:
+            ranked = sorted(self.stats.items(), key=lambda entry: entry[1].total_ms, reverse=True)
+            suspects = sorted(self.suspects, key=lambda suspect: suspect[2], reverse=True)
+        total_count = sum(stats.count for _, stats in ranked)
+        total_ms = sum(stats.total_ms for _, stats in ranked)
+        lines = [f"SQL trace: {total_count} statement(s), {len(ranked)} distinct, {total_ms:.1f} ms in execute()."]
+        lines.append("")
+        lines.append("Top statements by total time:")
+        for sql, stats in ranked[:top]:
+            lines.append(f"  {stats.total_ms:9.1f} ms  {stats.count:6}x  avg {stats.total_ms / stats.count:7.2f}  "
+                         f"max {stats.max_ms:7.2f}  {sql[:120]}")
+            for call_site, count in stats.call_sites.most_common(3):
+                lines.append(f"  {'':>40}{count:6}x from {call_site}")
+        lines.append("")
+        if suspects:
+            lines.append(f"Likely N+1 queries (same statement {self.n_plus_one_threshold}+ times in one action):")
+            for action_name, sql, executions, call_site in suspects[:top]:
+                lines.append(f"  {executions:6}x  {sql[:100]}")
+                lines.append(f"          from {call_site} during {action_name}")
+        else:
+            lines.append("No likely N+1 queries found.")
+        return "\n".join(lines)
+
+    def write_report(self):
+        if not self.enabled:
+            return
+        report = self.report()
+        print(report)
+        log(report)
+        try:
+            with open(REPORT_FILE, "w", encoding="utf-8") as f:
+                f.write(report + "\n")
+        except OSError as e:
+            log(f"Could not write SQL trace report to {REPORT_FILE}: {e}")
+
+def _call_site():
+    """The innermost project frame outside the tracing plumbing, as 'path:line in function'."""
+    for frame in reversed(traceback.extract_stack()):
+        filename = os.path.abspath(frame.filename)
+        if filename in _SKIPPED_FILES or not filename.startswith(_PROJECT_ROOT):
+            continue
+        return f"{os.path.relpath(filename, _PROJECT_ROOT)}:{frame.lineno} in {frame.name}"
+    return "<unknown>"
+
+class _TracedCursor(sqlite3.Cursor):
+    def execute(self, sql, parameters=()):
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self.connection.tracer.record(sql, (time.perf_counter() - start) * 1000)
+
+    def executemany(self, sql, seq_of_parameters):
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self.connection.tracer.record(sql, (time.perf_counter() - start) * 1000)
+
+    def executescript(self, sql_script):
+        start = time.perf_counter()
+        try:
+            return super().executescript(sql_script)
+        finally:
+            self.connection.tracer.record(sql_script, (time.perf_counter() - start) * 1000)
+
+class _TracedConnection(sqlite3.Connection):
+    tracer = None
+
+    def cursor(self, factory=_TracedCursor):
+        return super().cursor(factory)
+
+    # The Connection shortcuts create their cursor internally, so route them through cursor()
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script):
+        return self.cursor().executescript(sql_script)
+
+@functools.lru_cache(maxsize=None)
+def _traced_class(role):
+    return type(f"Traced{role.__name__.strip('_').replace('Role', '')}Connection", (role, _TracedConnection), {})
+
+# Shared instance used by utils.database; enabled by the SWIGATO_SQL_TRACE
+# environment variable or gui_app's --trace-sql flag.
+sql_tracer = SqlTracer()
+if os.environ.get(ENV_VAR, "").lower() in ("1", "true", "yes", "on"):
+    sql_tracer.enable()
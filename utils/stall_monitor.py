@@ -0,0 +1,143 @@
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from . import metrics
+from .logger import log
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPORT_FILE = os.path.join(_PROJECT_ROOT, "data", "stall_reports.log")
+MAX_SAMPLES = 20  # Stack samples kept per stall
+
+class StallMonitor:
+    """
+    Watchdog for the Tk event loop.
+
+    The Tk thread re-arms a heartbeat with after() every heartbeat_ms; a
+    background thread checks that the heartbeat keeps coming. While the loop
+    is blocked for longer than threshold_ms the background thread samples the
+    Tk thread's stack (once per threshold_ms). When the loop recovers the stall
+    is written to REPORT_FILE with its length, the screen that was showing,
+    the action in progress (see action()) and the sampled stacks.
+
+    When nothing is stalled the cost is one after() callback per heartbeat and
+    a sleeping thread.
+    """
+
+    def __init__(self, threshold_ms=200, heartbeat_ms=50):
+        self.threshold = threshold_ms / 1000
+        self.heartbeat_ms = heartbeat_ms
+        self.enabled = False
+        self.stall_count = 0
+        self.app = None
+        self._tk_thread_id = None
+        self._last_beat = 0.0
+        self._samples = []  # (seconds into the stall, hot frame, formatted stack) for the stall in progress
+        self._action = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self, app, threshold_ms=None):
+        """Starts monitoring app's event loop. Must be called from the Tk thread."""
+        if self.enabled:
+            return
+        if threshold_ms:
+            self.threshold = threshold_ms / 1000
+        self.enabled = True
+        self.app = app
+        self._tk_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        # A raw after() rather than utils.scheduler: the heartbeat measures event loop lag, so it must fire on
+        # its own and never be coalesced with other timers
+        app.after(self.heartbeat_ms, self._beat)
+        threading.Thread(target=self._watch, name="swigato-stall-monitor", daemon=True).start()
+        log(f"Stall monitor started (threshold {self.threshold * 1000:.0f} ms); reports go to {REPORT_FILE}.")
+
+    def stop(self):
+        self.enabled = False
+        self._stop.set()
+
+    @contextmanager
+    def action(self, name):
+        """Names what the Tk thread is doing, for stalls that happen inside the block."""
+        previous = self._action
+        self._action = name
+        try:
+            yield
+        finally:
+            self._action = previous
+
+    # --- Tk thread ---
+
+    def _beat(self):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        lag = now - self._last_beat - self.heartbeat_ms / 1000
+        self._last_beat = now
+        metrics.histogram("swigato_event_loop_lag_seconds", "How late the stall monitor's heartbeat ran.").observe(max(lag, 0.0))
+        with self._lock:
+            samples, self._samples = self._samples, []
+        if samples or lag > self.threshold:
+            self._report(lag, samples)
+        try:
+            self.app.after(self.heartbeat_ms, self._beat)
+        except Exception:
+            self.enabled = False  # Application closed
+
+    def _report(self, lag, samples):
+        self.stall_count += 1
+        metrics.counter("swigato_event_loop_stalls_total", "Event-loop stalls longer than the stall monitor's threshold.").inc()
+        screen = type(self.app.current_screen_frame).__name__ if getattr(self.app, "current_screen_frame", None) else "none"
+        lines = [f"{time.strftime('%Y-%m-%d %H:%M:%S')} Stall of {lag * 1000:.0f} ms on screen {screen}"
+                 + (f" during '{self._action}'" if self._action else "")]
+        if samples:
+            # The frame seen in most samples is where the time went
+            hot_frames = Counter(hot_frame for _, hot_frame, _ in samples)
+            lines.append(f"  Most samples in: {hot_frames.most_common(1)[0][0]}")
+            for offset, _, stack in samples[:3]:
+                lines.append(f"  Stack at +{offset * 1000:.0f} ms:")
+                lines.extend(f"    {line}" for line in stack.rstrip().splitlines())
+            if len(samples) > 3:
+                lines.append(f"  ({len(samples) - 3} more sample(s) omitted)")
+        else:
+            lines.append("  Not sampled (shorter than one watchdog interval).")
+        report = "\n".join(lines)
+        log(report.splitlines()[0])
+        try:
+            with open(REPORT_FILE, "a", encoding="utf-8") as f:
+                f.write(report + "\n\n")
+        except OSError as e:
+            log(f"Could not write stall report to {REPORT_FILE}: {e}")
+
+    # --- Watchdog thread ---
+
+    def _watch(self):
+        interval = self.threshold / 2
+        while not self._stop.wait(interval):
+            stalled_for = time.perf_counter() - self._last_beat - self.heartbeat_ms / 1000
+            if stalled_for < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._tk_thread_id)
+            if frame is None:
+                continue
+            stack = traceback.extract_stack(frame)
+            with self._lock:
+                if len(self._samples) < MAX_SAMPLES:
+                    self._samples.append((stalled_for, _hot_frame(stack), "".join(traceback.format_list(stack[-12:]))))
+            # Sample at most once per threshold while the stall lasts
+            self._stop.wait(self.threshold / 2)
+
+def _hot_frame(stack):
+    """The innermost frame from the project's own code, as 'path:line in function'."""
+    for frame in reversed(stack):
+        filename = os.path.abspath(frame.filename)
+        if filename.startswith(_PROJECT_ROOT) and filename != os.path.abspath(__file__):
+            return f"{os.path.relpath(filename, _PROJECT_ROOT)}:{frame.lineno} in {frame.name}"
+    return f"{stack[-1].filename}:{stack[-1].lineno} in {stack[-1].name}" if stack else "<unknown>"
+
+# Shared instance; started by gui_app's --stall-monitor flag or SWIGATO_STALL_MS
+stall_monitor = StallMonitor()
@@ -0,0 +1,44 @@
+import time
+from .logger import log
+
+class StartupProfiler:
+    """
+    Records named checkpoints during application start-up and reports the time
+    spent between them, ending with the time to the first rendered frame.
+    """
+
+    def __init__(self, origin=None):
+        self.enabled = False
+        self.origin = origin if origin is not None else time.perf_counter()
+        self.marks = []  # List of (name, perf_counter timestamp)
+
+    def enable(self, origin=None):
+        if origin is not None:
+            self.origin = origin
+        self.enabled = True
+
+    def mark(self, name):
+        """Records a checkpoint. Cheap no-op unless profiling is enabled."""
+        if self.enabled:
+            self.marks.append((name, time.perf_counter()))
+
+    def report(self):
+        """Returns the breakdown as text, one line per phase."""
+        lines = ["Startup profile (ms):"]
+        previous = self.origin
+        for name, timestamp in self.marks:
+            lines.append(f"  {name:<28} {(timestamp - previous) * 1000:8.1f}   (at {(timestamp - self.origin) * 1000:8.1f})")
+            previous = timestamp
+        total = (self.marks[-1][1] - self.origin) * 1000 if self.marks else 0.0
+        lines.append(f"  {'total':<28} {total:8.1f}")
+        return "\n".join(lines)
+
+    def print_report(self):
+        if not self.enabled:
+            return
+        report = self.report()
+        print(report)
+        log(report)
+
+# Shared instance used by gui_app; marks are ignored until enable() is called.
+startup_profiler = StartupProfiler()
@@ -0,0 +1,130 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import time
+from . import metrics
+from .logger import log
+from .sql_trace import sql_tracer
+
+# Shared pool for database queries started from the GUI. Model reads use the
+# calling thread's own read-only connection and writes borrow the shared writer
+# in turn (see utils.database), so model functions are safe to run here.
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="swigato-loader")
+
+# Finished work waiting to be handed to the Tk thread: (handle, result, error)
+_results = queue.Queue()
+_pending = set()  # Handles that have been submitted and not yet delivered or cancelled
+_pending_lock = threading.Lock()
+_poll_after_id = None
+POLL_INTERVAL_MS = 15
+
+class LoadHandle:
+    """A single load_async() request. cancel() drops its result if it has not been delivered yet."""
+
+    def __init__(self, owner, key, on_result, on_error):
+        self.owner = owner
+        self.owner_path = str(owner)
+        self.key = key
+        self.on_result = on_result
+        self.on_error = on_error
+        self.future = None
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+        if self.future is not None:
+            self.future.cancel()  # Only succeeds if the query has not started yet
+        with _pending_lock:
+            _pending.discard(self)
+
+def load_async(owner, query_fn, on_result, on_error=None, key=None):
+    """
+    Runs query_fn() on the shared worker pool and calls on_result(result) on the
+    Tk thread once it finishes. Must be called from the Tk thread.
+
+    owner is the widget the result is for; nothing is delivered once it has
+    been destroyed or its requests were cancelled with cancel_for(). Requests
+    with the same owner and key are coalesced: a new request supersedes any
+    pending one, so only the latest result is delivered (e.g. while typing in
+    a search box). on_error(exception) is called instead of on_result when
+    query_fn raises; by default the error is only logged.
+    """
+    handle = LoadHandle(owner, key, on_result, on_error)
+    with _pending_lock:
+        if key is not None:
+            for other in [h for h in _pending if h.key == key and h.owner is owner]:
+                other.cancelled = True
+                if other.future is not None:
+                    other.future.cancel()
+                _pending.discard(other)
+        _pending.add(handle)
+    handle.future = _executor.submit(_run, handle, query_fn)
+    _ensure_polling(owner)
+    return handle
+
+def cancel_for(widget):
+    """Cancels all pending requests owned by widget or any of its children, e.g. when a screen is closed."""
+    widget_path = str(widget)
+    with _pending_lock:
+        handles = [h for h in _pending if h.owner_path == widget_path or h.owner_path.startswith(widget_path + ".")]
+    for handle in handles:
+        handle.cancel()
+    return len(handles)
+
+def pending_count():
+    with _pending_lock:
+        return len(_pending)
+
+def _run(handle, query_fn):
+    if handle.cancelled:
+        return
+    start = time.perf_counter()
+    try:
+        with sql_tracer.action(f"background load {handle.key or ''} for {handle.owner_path}"):
+            result = query_fn()
+        metrics.histogram("swigato_background_load_seconds", "Time spent running load_async() queries, by key.",
+                          key=handle.key or "none").observe(time.perf_counter() - start)
+        _results.put((handle, result, None))
+    except Exception as e:
+        _results.put((handle, None, e))
+
+def _ensure_polling(widget):
+    global _poll_after_id
+    if _poll_after_id is None:
+        root = widget._root()
+        # On the root rather than through utils.scheduler: the drain serves every owner and lives as long as root
+        _poll_after_id = root.after(POLL_INTERVAL_MS, _drain, root)
+
+def _drain(root):
+    """Delivers finished results on the Tk thread; keeps polling while requests are outstanding."""
+    global _poll_after_id
+    _poll_after_id = None
+    while True:
+        try:
+            handle, result, error = _results.get_nowait()
+        except queue.Empty:
+            break
+        with _pending_lock:
+            if handle not in _pending:
+                continue  # Cancelled or superseded
+            _pending.discard(handle)
+        try:
+            if not handle.owner.winfo_exists():
+                continue
+        except Exception:
+            continue  # Owner's interpreter is gone
+        try:
+            if error is not None:
+                if handle.on_error:
+                    handle.on_error(error)
+                else:
+                    log(f"Background load for {handle.owner_path} (key={handle.key}) failed: {error}")
+            else:
+                handle.on_result(result)
+        except Exception as e:
+            log(f"Error delivering background load result to {handle.owner_path}: {e}")
+    if pending_count() or not _results.empty():
+        try:
+            _poll_after_id = root.after(POLL_INTERVAL_MS, _drain, root)
+        except Exception:
+            pass  # Application is shutting down
@@ -0,0 +1,124 @@
+import os
+import threading
+import time
+from . import metrics
+from .image_loader import decode_image
+from .logger import log
+from .prefetch import menu_prefetcher, MENU_IMAGE_SIZE
+from .query_cache import query_cache
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESTAURANT_IMAGE_SIZE = (120, 120)  # Size RestaurantCard shows restaurant images at
+
+class WarmUp:
+    """
+    Fills the application's caches in the background while the login screen
+    is showing, so the first screens after login do not start cold.
+
+    In order, until the time or memory budget runs out:
+      1. the restaurant list with ratings,
+      2. the restaurants' card images (into image_loader's decode cache),
+      3. the menus and first review pages of the first top_menus restaurants,
+         and their item thumbnails.
+
+    The lists are loaded through the model queries the screens use, so they
+    land in utils.query_cache and are dropped as soon as their tables change,
+    in this process or another. With the query cache turned off only the
+    images are warmed.
+
+    Memory is counted as the size of the decoded images. When warm-up ends
+    it logs how much of each cache it managed to fill (see coverage).
+    """
+
+    def __init__(self, top_menus=5, time_budget=5.0, memory_budget_mb=32):
+        self.top_menus = top_menus
+        self.time_budget = time_budget
+        self.memory_budget = memory_budget_mb * 1024 * 1024
+        self.coverage = {}  # cache name -> (items warmed, items wanted)
+        self.stopped_by = None  # "time" or "memory" when a budget cut warm-up short
+        self.done = threading.Event()
+        self._thread = None
+        self._started = 0.0
+        self._memory_used = 0  # Bytes of decoded images
+
+    def start(self, wait_for=None):
+        """Starts warming up on a daemon thread, after wait_for (e.g. the seeding thread) finishes."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, args=(wait_for,), name="swigato-warmup", daemon=True)
+        self._thread.start()
+
+    def report(self):
+        parts = [f"{name} {warmed}/{wanted}" for name, (warmed, wanted) in self.coverage.items()]
+        return "Warm-up coverage: " + (", ".join(parts) or "nothing") + \
+            (f" (stopped by the {self.stopped_by} budget)" if self.stopped_by else "")
+
+    def _run(self, wait_for):
+        from restaurants.models import MenuItem, Restaurant
+        from reviews.models import get_review_feed
+        if wait_for is not None:
+            wait_for.join()
+        self._started = time.perf_counter()
+        self._memory_used = 0
+        cache_lists = query_cache.enabled
+        try:
+            restaurants = Restaurant.get_all_with_stats()
+            if cache_lists:
+                self._set_coverage("restaurant list", 1, 1)
+
+            images = [os.path.join(_PROJECT_ROOT, "assets", "restaurants", r.image_filename)
+                      for r in restaurants if r.image_filename]
+            self._set_coverage("restaurant images", self._decode_all(images, RESTAURANT_IMAGE_SIZE), len(images))
+
+            top = restaurants[:self.top_menus]
+            menus_warmed = thumbnails_warmed = thumbnails_wanted = 0
+            for restaurant in top:
+                if self._over_budget():
+                    break
+                menu_items = MenuItem.get_for_restaurant(restaurant.restaurant_id)
+                if cache_lists:
+                    # Same query and page size as MenuScreen's first review page
+                    get_review_feed(restaurant.restaurant_id, "newest", limit=menu_prefetcher.review_page_size)
+                    menus_warmed += 1
+                thumbnails = [os.path.join(_PROJECT_ROOT, "assets", "menu_items", item.image_filename)
+                              for item in menu_items if item.image_filename][:menu_prefetcher.max_images]
+                thumbnails_wanted += len(thumbnails)
+                thumbnails_warmed += self._decode_all(thumbnails, MENU_IMAGE_SIZE)
+            if cache_lists:
+                self._set_coverage("menus", menus_warmed, len(top))
+            self._set_coverage("menu thumbnails", thumbnails_warmed, thumbnails_wanted)
+        except Exception as e:
+            log(f"Warm-up failed: {e}")
+        finally:
+            elapsed = time.perf_counter() - self._started
+            metrics.histogram("swigato_warmup_seconds", "Time spent warming caches at start-up.").observe(elapsed)
+            log(f"{self.report()} in {elapsed * 1000:.0f} ms, {self._memory_used / (1024 * 1024):.1f} MB of images.")
+            self.done.set()
+
+    def _decode_all(self, paths, size):
+        """Decodes images into image_loader's cache until a budget runs out; returns how many were decoded."""
+        decoded = 0
+        for path in paths:
+            if self._over_budget():
+                break
+            img = decode_image(path, size)
+            if img is not None:
+                self._memory_used += img.width * img.height * len(img.getbands())
+                decoded += 1
+        return decoded
+
+    def _over_budget(self):
+        if self.stopped_by is None:
+            if time.perf_counter() - self._started > self.time_budget:
+                self.stopped_by = "time"
+            elif self._memory_used > self.memory_budget:
+                self.stopped_by = "memory"
+        return self.stopped_by is not None
+
+    def _set_coverage(self, name, warmed, wanted):
+        self.coverage[name] = (warmed, wanted)
+        metrics.gauge("swigato_warmup_coverage_ratio", "Share of each cache filled by the start-up warm-up.",
+                      cache=name).set(warmed / wanted if wanted else 1.0)
+
+# Shared instance; started by gui_app once the login screen is showing
+warmup = WarmUp()
@@ -0,0 +1,195 @@
+import queue
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from . import database, metrics
+from .logger import log
+
+class _Job:
+    __slots__ = ("fn", "args", "name", "future", "submitted")
+
+    def __init__(self, fn, args, name):
+        self.fn = fn
+        self.args = args
+        self.name = name
+        self.future = Future()
+        self.future.busy_retries = 0  # Times the job's batch was retried after SQLITE_BUSY / SQLITE_LOCKED
+        self.submitted = time.perf_counter()
+
+def is_busy_error(error):
+    """True for SQLITE_BUSY / SQLITE_LOCKED, i.e. errors worth retrying once the other writer is done."""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    code = getattr(error, "sqlite_errorcode", None)
+    if code is not None:
+        return code & 0xFF in (sqlite3.SQLITE_BUSY, sqlite3.SQLITE_LOCKED)
+    message = str(error)
+    return "database is locked" in message or "table is locked" in message
+
+def _execute(cursor, sql, params):
+    cursor.execute(sql, params)
+    return cursor.rowcount
+
+class WriteQueue:
+    """
+    Runs writes on one writer thread, grouping whatever is pending into a single transaction.
+
+    submit() queues a job, a function called as fn(cursor, *args) on the
+    writer connection (see utils.database.get_write_connection), and returns
+    a Future for its result. Each tick the writer thread takes every queued
+    job (up to max_batch), runs them inside one BEGIN IMMEDIATE transaction,
+    each under its own savepoint, and commits once: under load many writes
+    share one commit instead of queueing for the write lock one by one. A job
+    that raises is rolled back to its savepoint and its future gets the
+    exception; the rest of the batch still commits. Futures resolve only
+    after the commit.
+
+    When another process holds the write lock, SQLite gives up after only
+    busy_timeout seconds (SQLITE_BUSY / SQLITE_LOCKED); the whole batch is
+    then rolled back and retried after an exponential backoff with jitter,
+    base_delay doubling up to max_delay, at most max_retries times before its
+    futures fail with the busy error. Each future's busy_retries attribute
+    counts the retries its job went through.
+
+    observer, when set, is called as observer(future) on the waiting thread
+    after every run(), e.g. so the load generator can attribute errors and
+    retries that happened on the writer thread to the operation that waited.
+
+    Jobs must only write through the cursor they are given and must not
+    commit or roll back; they may be run more than once.
+    """
+
+    def __init__(self, max_batch=64, max_retries=8, base_delay=0.005, max_delay=0.5, busy_timeout=0.002):
+        self.max_batch = max_batch
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.busy_timeout = busy_timeout
+        self.observer = None
+        self._jobs = queue.SimpleQueue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, fn, *args, name=None):
+        """Queues fn(cursor, *args) for the next group commit; returns a Future for its result."""
+        job = _Job(fn, args, name or fn.__name__)
+        if database.holds_write_connection():
+            # Called from a job or while borrowing the writer: waiting for the writer thread would deadlock
+            self._run_inline(job)
+            return job.future
+        self._ensure_started()
+        self._jobs.put(job)
+        return job.future
+
+    def run(self, fn, *args, name=None):
+        """submit() and wait for the result; re-raises the job's exception."""
+        future = self.submit(fn, *args, name=name)
+        try:
+            return future.result()
+        finally:
+            if self.observer is not None:
+                self.observer(future)
+
+    def is_writer_thread(self):
+        return threading.current_thread() is self._thread
+
+    def execute(self, sql, params=()):
+        """Runs a single statement through the queue and waits for its commit; returns the affected row count."""
+        return self.run(_execute, sql, params, name=sql.split(None, 1)[0].lower())
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._loop, name="swigato-writer", daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def _loop(self):
+        while True:
+            batch = [self._jobs.get()]
+            # Everything that arrived while the previous commit was in flight joins this one
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._jobs.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._commit_batch(batch)
+            except Exception as e:
+                log(f"Write queue: batch of {len(batch)} write(s) ({', '.join(sorted({job.name for job in batch}))}) failed: {e}")
+                for job in batch:
+                    if not job.future.done():
+                        job.future.set_exception(e)
+
+    def _commit_batch(self, batch):
+        for attempt in range(self.max_retries + 1):
+            try:
+                outcomes = self._run_batch(batch)
+                break
+            except sqlite3.OperationalError as e:
+                if not is_busy_error(e) or attempt == self.max_retries:
+                    raise
+                delay = min(self.max_delay, self.base_delay * 2 ** attempt) * random.uniform(0.5, 1.0)
+                for job in batch:
+                    job.future.busy_retries += 1
+                metrics.counter("swigato_write_queue_busy_retries_total", "Group commits retried after SQLITE_BUSY.").inc()
+                log(f"Write queue: database busy ({e}), retrying {len(batch)} write(s) in {delay * 1000:.0f} ms.")
+                time.sleep(delay)
+        metrics.counter("swigato_write_queue_commits_total", "Transactions committed by the write queue.").inc()
+        finished = time.perf_counter()
+        for job, (ok, value) in zip(batch, outcomes):
+            metrics.counter("swigato_write_queue_jobs_total", "Writes run by the write queue, by result.",
+                            result="committed" if ok else "failed").inc()
+            metrics.histogram("swigato_write_queue_latency_seconds", "Time from submit() to the write's commit.").observe(
+                finished - job.submitted)
+            if ok:
+                job.future.set_result(value)
+            else:
+                job.future.set_exception(value)
+
+    def _run_batch(self, batch):
+        """Runs batch in one transaction; returns [(ok, result or exception)] in order. Busy errors propagate."""
+        conn = database.get_write_connection(busy_timeout=self.busy_timeout)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            outcomes = []
+            for job in batch:
+                cursor.execute("SAVEPOINT job")
+                try:
+                    outcomes.append((True, job.fn(cursor, *job.args)))
+                    cursor.execute("RELEASE job")
+                except Exception as e:
+                    if is_busy_error(e):
+                        raise
+                    cursor.execute("ROLLBACK TO job")
+                    cursor.execute("RELEASE job")
+                    outcomes.append((False, e))
+            conn.commit()
+            return outcomes
+        finally:
+            conn.close()  # Rolls back whatever did not commit
+
+    def _run_inline(self, job):
+        """Runs job on the writer this thread already borrowed, inside the borrower's transaction if one is open."""
+        conn = database.get_write_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SAVEPOINT job")  # Outside a transaction, releasing it commits
+            try:
+                result = job.fn(cursor, *job.args)
+                cursor.execute("RELEASE job")
+                job.future.set_result(result)
+            except Exception as e:
+                cursor.execute("ROLLBACK TO job")
+                cursor.execute("RELEASE job")
+                job.future.set_exception(e)
+        finally:
+            conn.close()
+
+# Shared instance; the models' hot write paths (orders, reviews, favorites) go through it
+write_queue = WriteQueue()